@@ -0,0 +1,44 @@
+import argparse
+import io
+import tempfile
+import time
+
+import benchmarks
+from app import ProgramLoop
+from console import BatchConsole, Console
+
+PROJECT_COUNT = 100
+
+
+def generateCommands(commandCount:int) -> str:
+    commands = [f"add project project{index}\n" for index in range(PROJECT_COUNT)]
+    for index in range(commandCount - PROJECT_COUNT):
+        if index % 4 == 3:
+            commands.append(f"check {index // 2 + 1}\n")
+        else:
+            commands.append(f"add task project{index % PROJECT_COUNT} task{index}\n")
+    commands.append("quit\n")
+    return "".join(commands)
+
+
+def measureCommandsPerSecond(consoleClass:type, commands:str, commandCount:int) -> float:
+    with tempfile.TemporaryFile("w") as output:
+        console = consoleClass(io.StringIO(commands), output)
+        start   = time.perf_counter()
+        ProgramLoop(console).run()
+        return commandCount / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="commands/sec of batch mode against the interactive loop")
+    parser.add_argument("commandCount", nargs="?", type=int, default=100000)
+    arguments = parser.parse_args()
+
+    commands = generateCommands(commandCount=arguments.commandCount)
+    for consoleClass in (Console, BatchConsole):
+        commandsPerSecond = measureCommandsPerSecond(consoleClass=consoleClass, commands=commands, commandCount=arguments.commandCount)
+        print(f"{consoleClass.__name__:>12}: {commandsPerSecond:12.0f} commands/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import argparse
+import io
+import time
+
+import benchmarks
+from app import ProgramLoop
+from benchmarks.bench_check_task import buildProgramDatas
+from console import BatchConsole, Console
+
+
+def runCommands(programDatas, commands:str) -> float:
+    start = time.perf_counter()
+    ProgramLoop(BatchConsole(io.StringIO(commands), io.StringIO()), programDatas=programDatas).run()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="check of ID ranges against the equivalent single check commands")
+    parser.add_argument("sizes", nargs="*", type=int, default=[1000, 100000, 1000000])
+    arguments = parser.parse_args()
+
+    console = Console(io.StringIO(), io.StringIO())
+    for taskCount in arguments.sizes:
+        half        = taskCount // 2
+        rangeSpec   = f"1-{half},{half + 2}-{taskCount}"
+
+        programDatas    = buildProgramDatas(taskCount=taskCount, console=console)
+        singleSeconds   = runCommands(programDatas=programDatas, commands="".join(f"check {taskId}\n" for taskId in range(1, taskCount + 1) if taskId != half + 1))
+        programDatas    = buildProgramDatas(taskCount=taskCount, console=console)
+        bulkSeconds     = runCommands(programDatas=programDatas, commands=f"check {rangeSpec}\n")
+
+        print(f"{taskCount:>9} tasks: single {singleSeconds * 1e3:10.1f} ms, ranges {bulkSeconds * 1e3:10.1f} ms, {singleSeconds / bulkSeconds:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import argparse
+import io
+import time
+
+import benchmarks
+from app import ProgramDatas
+from console import Console
+from primitiveWrapper import ProjectName, TaskDescription, TaskId
+
+PROJECT_COUNT   = 100
+CHECK_COUNT     = 10000
+
+
+def buildProgramDatas(taskCount:int, console:Console) -> ProgramDatas:
+    programDatas    = ProgramDatas()
+    projectNames    = [ProjectName(projetNameStr=f"project{index}") for index in range(PROJECT_COUNT)]
+    for projectName in projectNames:
+        programDatas.addProject(projectName=projectName, console=console)
+
+    for index in range(taskCount):
+        programDatas.addTask(
+            projectName=projectNames[index % PROJECT_COUNT],
+            taskDescription=TaskDescription(taskDescriptionStr=f"task {index}"),
+            console=console)
+    return programDatas
+
+
+def measureCheckLatency(programDatas:ProgramDatas, taskCount:int, console:Console) -> float:
+    taskIds = [TaskId(taskIdInt=(index * 7919) % taskCount + 1) for index in range(CHECK_COUNT)]
+
+    start = time.perf_counter()
+    for taskId in taskIds:
+        programDatas.checkTask(taskId=taskId, console=console)
+    return (time.perf_counter() - start) / CHECK_COUNT
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="check <task ID> latency against the number of tasks")
+    parser.add_argument("sizes", nargs="*", type=int, default=[1000, 10000, 100000, 1000000])
+    arguments = parser.parse_args()
+
+    console = Console(io.StringIO(), io.StringIO())
+    for taskCount in arguments.sizes:
+        programDatas    = buildProgramDatas(taskCount=taskCount, console=console)
+        latency         = measureCheckLatency(programDatas=programDatas, taskCount=taskCount, console=console)
+        print(f"{taskCount:>9} tasks: {latency * 1e6:8.2f} us/check")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import argparse
+import csv
+import json
+import os
+import tempfile
+import time
+
+import benchmarks
+from app import ProgramDatas
+from importer import readRows
+
+PROJECT_COUNT = 1000
+
+
+def writeCsv(filePath:str, rowCount:int) -> None:
+    with open(filePath, "w", newline="", encoding="utf-8") as csvFile:
+        writer = csv.writer(csvFile)
+        writer.writerow(["project", "description", "done"])
+        for index in range(rowCount):
+            writer.writerow([f"project{index % PROJECT_COUNT}", f"task {index}", index % 3 == 0])
+
+
+def writeJsonLines(filePath:str, rowCount:int) -> None:
+    with open(filePath, "w", encoding="utf-8") as jsonLinesFile:
+        for index in range(rowCount):
+            jsonLinesFile.write(json.dumps({"project": f"project{index % PROJECT_COUNT}", "description": f"task {index}", "done": index % 3 == 0}) + "\n")
+
+
+def measureRowsPerSecond(filePath:str, rowCount:int) -> float:
+    programDatas = ProgramDatas()
+    start = time.perf_counter()
+    with open(filePath, newline="", encoding="utf-8") as taskFile:
+        programDatas.importTasks(rows=readRows(taskFile=taskFile, filePath=filePath))
+    return rowCount / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="rows/sec of the bulk importer")
+    parser.add_argument("rowCount", nargs="?", type=int, default=1000000)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for fileName, writeFile in (("tasks.csv", writeCsv), ("tasks.jsonl", writeJsonLines)):
+            filePath = os.path.join(directory, fileName)
+            writeFile(filePath=filePath, rowCount=arguments.rowCount)
+            rowsPerSecond = measureRowsPerSecond(filePath=filePath, rowCount=arguments.rowCount)
+            print(f"{fileName:>12}: {rowsPerSecond:12.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import argparse
+import gc
+import io
+import tempfile
+import time
+import tracemalloc
+
+import benchmarks
+from app import ProgramDatas
+from benchmarks.bench_check_task import PROJECT_COUNT
+from console import Console
+from primitiveWrapper import ProjectName, TaskId
+from storage import FileStorage, MappedStorage
+from taskRow import TaskRow
+
+
+def fill(programDatas:ProgramDatas, taskCount:int) -> None:
+    programDatas.importTasks(rows=(TaskRow(None, f"project{index % PROJECT_COUNT}", f"task {index}", index % 3 != 0) for index in range(taskCount)))
+    programDatas.close()
+
+
+def measureLoad(createStorage) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    start           = time.perf_counter()
+    programDatas    = ProgramDatas(storage=createStorage())
+    seconds         = time.perf_counter() - start
+    gc.collect()
+    loadedBytes, _  = tracemalloc.get_traced_memory()
+    "".join(programDatas.showChunks(projectName=ProjectName(projetNameStr="project0")))
+    programDatas.checkTask(taskId=TaskId(taskIdInt=PROJECT_COUNT + 2), console=Console(io.StringIO(), io.StringIO()))
+    gc.collect()
+    touchedBytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    programDatas.close()
+    return seconds, loadedBytes, touchedBytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="load time and Python heap of the journal storage against the memory-mapped storage")
+    parser.add_argument("sizes", nargs="*", type=int, default=[10000, 100000, 1000000])
+    arguments = parser.parse_args()
+
+    for taskCount in arguments.sizes:
+        with tempfile.TemporaryDirectory() as fileDirectory, tempfile.TemporaryDirectory() as mappedDirectory:
+            fill(programDatas=ProgramDatas(storage=FileStorage(directory=fileDirectory)), taskCount=taskCount)
+            fill(programDatas=ProgramDatas(storage=MappedStorage(directory=mappedDirectory)), taskCount=taskCount)
+
+            fileSeconds, fileBytes, fileTouchedBytes        = measureLoad(createStorage=lambda: FileStorage(directory=fileDirectory))
+            mappedSeconds, mappedBytes, mappedTouchedBytes  = measureLoad(createStorage=lambda: MappedStorage(directory=mappedDirectory))
+
+        print(f"{taskCount:>9} tasks: journal {fileSeconds:7.2f} s {fileBytes / 1024:9.0f} KiB, {fileTouchedBytes / 1024:9.0f} KiB with 2 projects used;"
+              f" mapped {mappedSeconds:7.2f} s {mappedBytes / 1024:9.0f} KiB, {mappedTouchedBytes / 1024:9.0f} KiB with 2 projects used")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import argparse
+import gc
+import io
+import tracemalloc
+
+import benchmarks
+from benchmarks.bench_check_task import buildProgramDatas
+from console import Console
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="memory held per task by ProgramDatas")
+    parser.add_argument("sizes", nargs="*", type=int, default=[10000, 100000, 1000000])
+    arguments = parser.parse_args()
+
+    console = Console(io.StringIO(), io.StringIO())
+    for taskCount in arguments.sizes:
+        gc.collect()
+        tracemalloc.start()
+        programDatas    = buildProgramDatas(taskCount=taskCount, console=console)
+        gc.collect()
+        current, _      = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{taskCount:>9} tasks: {current / taskCount:8.1f} bytes/task")
+        del programDatas
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import benchmarks
+from app import ProgramDatas
+from benchmarks.bench_mapped import fill
+from mappedTable import MappedTaskFile
+from storage import MappedStorage
+
+PYTHON_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(arguments:list, repeat:int, before=None) -> float:
+    seconds = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "task_list", *arguments], cwd=PYTHON_DIRECTORY, stdout=subprocess.DEVNULL, check=True)
+        seconds.append(time.perf_counter() - start)
+    return statistics.median(seconds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="wall time of one-shot invocations such as python -m task_list check 42")
+    parser.add_argument("sizes", nargs="*", type=int, default=[0, 1000000])
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    print(f"  interpreter only: {measure(arguments=['--help'], repeat=arguments.repeat) * 1e3:8.1f} ms (--help)")
+    print(f"       empty state: {measure(arguments=['check', '42'], repeat=arguments.repeat) * 1e3:8.1f} ms")
+    for taskCount in arguments.sizes:
+        if taskCount == 0:
+            continue
+
+        directory = tempfile.mkdtemp()
+        try:
+            fill(programDatas=ProgramDatas(storage=MappedStorage(directory=directory)), taskCount=taskCount)
+            indexPath   = os.path.join(directory, MappedTaskFile.INDEX_FILE_NAME)
+            removeIndex = lambda: os.path.exists(indexPath) and os.remove(indexPath)
+            cold        = measure(arguments=["--mapped-dir", directory, "check", "42"], repeat=arguments.repeat, before=removeIndex)
+            warm        = measure(arguments=["--mapped-dir", directory, "check", "42"], repeat=arguments.repeat)
+            fullLoad    = measure(arguments=["--mapped-dir", directory, "show", "project0", "0", "1"], repeat=arguments.repeat)
+        finally:
+            shutil.rmtree(directory)
+
+        print(f"{taskCount:>9} tasks: check cold index {cold * 1e3:8.1f} ms, warm index {warm * 1e3:8.1f} ms, full load (show) {fullLoad * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
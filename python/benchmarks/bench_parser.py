@@ -0,0 +1,35 @@
+import argparse
+import time
+
+import benchmarks
+from app import CommandLine
+
+COMMAND_LINES = (
+    "show\n",
+    "add project training\n",
+    "add task training Four Elements of Simple Design\n",
+    "check 42\n",
+    "uncheck 42\n",
+    "export jsonl tasks.jsonl\n",
+    "help\n",
+    "fly to the moon\n",
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="command line parsing throughput over mixed commands")
+    parser.add_argument("lineCount", nargs="?", type=int, default=1000000)
+    arguments = parser.parse_args()
+
+    lines = [COMMAND_LINES[index % len(COMMAND_LINES)] for index in range(arguments.lineCount)]
+
+    start = time.perf_counter()
+    for line in lines:
+        CommandLine(commandLineStr=line)
+    elapsed = time.perf_counter() - start
+
+    print(f"{arguments.lineCount} lines: {elapsed:.3f} s, {elapsed / arguments.lineCount * 1e9:.0f} ns/line")
+
+
+if __name__ == "__main__":
+    main()
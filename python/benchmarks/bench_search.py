@@ -0,0 +1,50 @@
+import argparse
+import io
+import time
+
+import benchmarks
+from app import ProgramDatas
+from benchmarks.bench_check_task import PROJECT_COUNT
+from console import Console
+from descriptionIndex import parseSearchTerms
+from taskRow import TaskRow
+
+RARE_COUNT      = 100
+SEARCH_COUNT    = 1000
+QUERIES         = ("rare common", "rare comm*", "rare task*")
+
+
+def buildProgramDatas(taskCount:int) -> ProgramDatas:
+    programDatas    = ProgramDatas()
+    rareEvery       = taskCount // RARE_COUNT
+    programDatas.importTasks(rows=(
+        TaskRow(None, f"project{index % PROJECT_COUNT}", f"common task {index}" + (" rare" if index % rareEvery == 0 else ""), False)
+        for index in range(taskCount)))
+    return programDatas
+
+
+def measureSearchLatency(programDatas:ProgramDatas, queryStr:str, console:Console) -> float:
+    tokens, prefixes = parseSearchTerms(queryStr=queryStr)
+
+    start = time.perf_counter()
+    for _ in range(SEARCH_COUNT):
+        programDatas.search(tokens=tokens, prefixes=prefixes, console=console)
+    return (time.perf_counter() - start) / SEARCH_COUNT
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="search latency against the number of tasks, for a word in 100 tasks and a word every task has")
+    parser.add_argument("sizes", nargs="*", type=int, default=[10000, 100000, 1000000])
+    arguments = parser.parse_args()
+
+    console = Console(io.StringIO(), io.StringIO())
+    for taskCount in arguments.sizes:
+        programDatas    = buildProgramDatas(taskCount=taskCount)
+        latencies       = ", ".join(
+            f"{queryStr!r} {measureSearchLatency(programDatas=programDatas, queryStr=queryStr, console=console) * 1e6:9.1f} us"
+            for queryStr in QUERIES)
+        print(f"{taskCount:>9} tasks: {latencies}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import asyncio
+import time
+from typing import List
+
+import benchmarks
+from app import ProgramDatas
+from primitiveWrapper import ProjectName
+from server import PROMPT, TaskListServer
+
+PROJECT_COUNT = 10
+
+
+async def runClient(port:int, clientIndex:int, commandCount:int, latencies:List[float]) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=2 ** 26)
+    await reader.readuntil(PROMPT)
+
+    for index in range(commandCount):
+        if index % 50 == 49:
+            commandLineStr = "show"
+        elif index % 4 == 3:
+            commandLineStr = f"check {clientIndex * commandCount // 2 + index // 2 + 1}"
+        else:
+            commandLineStr = f"add task project{clientIndex % PROJECT_COUNT} task {clientIndex}-{index}"
+
+        start = time.perf_counter()
+        writer.write(f"{commandLineStr}\n".encode("utf-8"))
+        await reader.readuntil(PROMPT)
+        latencies.append(time.perf_counter() - start)
+
+    writer.write(b"quit\n")
+    writer.close()
+    await writer.wait_closed()
+
+
+async def loadTest(clientCount:int, commandCount:int) -> None:
+    programDatas = ProgramDatas()
+    for index in range(PROJECT_COUNT):
+        programDatas.restoreProject(projectName=ProjectName(projetNameStr=f"project{index}"))
+
+    server      = await TaskListServer(programDatas=programDatas).startTcp(host="127.0.0.1", port=0)
+    port        = server.sockets[0].getsockname()[1]
+    latencies   :List[float] = []
+
+    start = time.perf_counter()
+    await asyncio.gather(*(runClient(port=port, clientIndex=clientIndex, commandCount=commandCount, latencies=latencies) for clientIndex in range(clientCount)))
+    elapsed = time.perf_counter() - start
+
+    server.close()
+    await server.wait_closed()
+
+    latencies.sort()
+    print(f"{clientCount} clients x {commandCount} commands: {len(latencies) / elapsed:10.0f} commands/sec")
+    print(f"latency p50 {latencies[len(latencies) // 2] * 1e3:8.2f} ms, p99 {latencies[int(len(latencies) * 0.99)] * 1e3:8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="throughput and latency of the task list server under many clients")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--commands", type=int, default=200, help="commands sent by each client")
+    arguments = parser.parse_args()
+
+    asyncio.run(loadTest(clientCount=arguments.clients, commandCount=arguments.commands))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import argparse
+import io
+import time
+
+import benchmarks
+from app import ProgramDatas, ProgramLoop
+from benchmarks.bench_check_task import PROJECT_COUNT
+from console import BatchConsole
+from shards import ShardedProgramLoop, ShardRouter
+
+
+def buildCommands(taskCount:int) -> str:
+    commands = [f"add project project{index}\n" for index in range(PROJECT_COUNT)]
+    commands.extend(f"add task project{index % PROJECT_COUNT} task {index}\n" for index in range(taskCount))
+    commands.extend(f"check {(index * 7919) % taskCount + 1}\n" for index in range(taskCount))
+    return "".join(commands)
+
+
+def runSingle(commands:str) -> float:
+    start = time.perf_counter()
+    ProgramLoop(BatchConsole(io.StringIO(commands), io.StringIO()), programDatas=ProgramDatas()).run()
+    return time.perf_counter() - start
+
+
+def runSharded(commands:str, shardCount:int, batchSize:int) -> float:
+    router  = ShardRouter(shardCount=shardCount)
+    start   = time.perf_counter()
+    ShardedProgramLoop(BatchConsole(io.StringIO(commands), io.StringIO()), router=router, batchSize=batchSize).run()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="add and check throughput of the sharded backend against the number of shards")
+    parser.add_argument("taskCount", nargs="?", type=int, default=200000)
+    parser.add_argument("--shards", nargs="*", type=int, default=[1, 2, 4])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    arguments = parser.parse_args()
+
+    commands        = buildCommands(taskCount=arguments.taskCount)
+    commandCount    = commands.count("\n")
+    seconds         = runSingle(commands=commands)
+    print(f"  no shards: {commandCount / seconds:12,.0f} commands/s")
+    for shardCount in arguments.shards:
+        seconds = runSharded(commands=commands, shardCount=shardCount, batchSize=arguments.batch_size)
+        print(f"{shardCount:>3} shards: {commandCount / seconds:12,.0f} commands/s")
+
+
+if __name__ == "__main__":
+    main()
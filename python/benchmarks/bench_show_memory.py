@@ -0,0 +1,35 @@
+import argparse
+import io
+import tracemalloc
+
+import benchmarks
+from benchmarks.bench_check_task import buildProgramDatas
+from console import Console
+
+
+class DiscardWriter(io.TextIOBase):
+
+    def write(self, s:str) -> int:
+        return len(s)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="peak memory allocated while streaming show")
+    parser.add_argument("sizes", nargs="*", type=int, default=[1000, 100000, 1000000])
+    arguments = parser.parse_args()
+
+    for taskCount in arguments.sizes:
+        console         = Console(io.StringIO(), DiscardWriter())
+        programDatas    = buildProgramDatas(taskCount=taskCount, console=console)
+        renderedSize    = sum(len(chunk) for chunk in programDatas.renderChunks())
+
+        tracemalloc.start()
+        console.printChunks(chunks=programDatas.renderChunks())
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{taskCount:>9} tasks: rendered {renderedSize / 1024:10.1f} KiB, show peak {peak / 1024:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
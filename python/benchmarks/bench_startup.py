@@ -0,0 +1,51 @@
+import argparse
+import io
+import shutil
+import tempfile
+import time
+
+import benchmarks
+from app import ProgramDatas
+from benchmarks.bench_check_task import buildProgramDatas
+from console import Console
+from primitiveWrapper import TaskId
+from storage import FileStorage
+
+JOURNAL_TAIL_SIZE = 10000
+
+
+def prepareDirectory(directory:str, taskCount:int, console:Console) -> None:
+    storage = FileStorage(directory=directory, compactEvery=taskCount * 10)
+    storage.load(programDatas=ProgramDatas())
+    storage.compact(programDatas=buildProgramDatas(taskCount=taskCount, console=console))
+    storage.close()
+
+    programDatas = ProgramDatas(storage=FileStorage(directory=directory, compactEvery=taskCount * 10))
+    for index in range(min(JOURNAL_TAIL_SIZE, taskCount)):
+        programDatas.checkTask(taskId=TaskId(taskIdInt=index + 1), console=console)
+    programDatas.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="startup time from a snapshot plus a journal tail")
+    parser.add_argument("sizes", nargs="*", type=int, default=[1000, 100000, 1000000])
+    arguments = parser.parse_args()
+
+    console = Console(io.StringIO(), io.StringIO())
+    for taskCount in arguments.sizes:
+        directory = tempfile.mkdtemp()
+        try:
+            prepareDirectory(directory=directory, taskCount=taskCount, console=console)
+
+            start           = time.perf_counter()
+            programDatas    = ProgramDatas(storage=FileStorage(directory=directory))
+            elapsed         = time.perf_counter() - start
+            programDatas.close()
+        finally:
+            shutil.rmtree(directory)
+
+        print(f"{taskCount:>9} tasks: startup {elapsed:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List
+
+import benchmarks
+from app import ProgramDatas, ProgramLoop
+from console import BatchConsole
+from instrumentation import Instrumentation
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+PROJECT_COUNT       = 100
+SET_DONE_COUNT      = 100000
+SHOW_COUNT          = 3
+SEED                = 20240101
+WORKLOADS           = ("add", "setDone", "show")
+TOLERANCE           = 0.25
+BENCHMARKS_DIR      = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE_PATH  = os.path.join(BENCHMARKS_DIR, "baseline.json")
+RESULTS_FILE_PATH   = os.path.join(BENCHMARKS_DIR, "results.json")
+
+
+class CommandReader:
+
+    _commands:Iterator[str]
+
+    def __init__(self, commands:Iterable[str]) -> None:
+        self._commands = iter(commands)
+
+    def readline(self) -> str:
+        return next(self._commands, "")
+
+
+def addCommands(taskCount:int) -> Iterator[str]:
+    yield from (f"add project project{index}\n" for index in range(PROJECT_COUNT))
+    yield from (f"add task project{index % PROJECT_COUNT} task {index}\n" for index in range(taskCount))
+
+
+def setDoneCommands(taskCount:int) -> Iterator[str]:
+    generator = random.Random(SEED)
+    for _ in range(min(SET_DONE_COUNT, taskCount)):
+        yield f"{generator.choice(('check', 'uncheck'))} {generator.randint(1, taskCount)}\n"
+
+
+def runWorkload(programDatas:ProgramDatas, commands:Iterable[str], commandNames:List[str]) -> Dict:
+    start = time.perf_counter()
+    ProgramLoop(BatchConsole(CommandReader(commands=commands), io.StringIO(), flushEvery=sys.maxsize), programDatas=programDatas).run()
+    seconds = time.perf_counter() - start
+
+    instrumentation = programDatas.instrumentation()
+    operations      = sum(report["count"] for commandName, report in instrumentation.report().items() if commandName in commandNames)
+    total           = instrumentation.totalReport(commandNames=commandNames)
+    return {
+        "operations"    : operations,
+        "seconds"       : seconds,
+        "throughput"    : operations / seconds,
+        "p50Us"         : total["p50Ns"] / 1000,
+        "p99Us"         : total["p99Ns"] / 1000,
+    }
+
+
+def peakMemoryBytes() -> int:
+    if resource is None:
+        return None
+    maxRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxRss if sys.platform == "darwin" else maxRss * 1024
+
+
+def runSize(taskCount:int) -> Dict:
+    programDatas    = ProgramDatas(instrumentation=Instrumentation())
+    results         = {
+        "add"       : runWorkload(programDatas=programDatas, commands=addCommands(taskCount=taskCount), commandNames=["add task"]),
+        "setDone"   : runWorkload(programDatas=programDatas, commands=setDoneCommands(taskCount=taskCount), commandNames=["check", "uncheck"]),
+        "show"      : runWorkload(programDatas=programDatas, commands=["show\n"] * SHOW_COUNT, commandNames=["show"]),
+    }
+    results["peakMemoryBytes"] = peakMemoryBytes()
+    return results
+
+
+def bestRun(runs:List[Dict]) -> Dict:
+    best = {workload: max((run[workload] for run in runs), key=lambda workloadResults: workloadResults["throughput"]) for workload in WORKLOADS}
+    peakMemories = [run["peakMemoryBytes"] for run in runs if run["peakMemoryBytes"] is not None]
+    best["peakMemoryBytes"] = min(peakMemories) if peakMemories else None
+    return best
+
+
+def compare(results:Dict, baseline:Dict, tolerance:float) -> List[str]:
+    regressions = []
+    for size, sizeResults in results.items():
+        sizeBaseline = baseline.get(size)
+        if sizeBaseline is None:
+            continue
+
+        for workload in WORKLOADS:
+            throughput, baselineThroughput = sizeResults[workload]["throughput"], sizeBaseline[workload]["throughput"]
+            if throughput < baselineThroughput * (1 - tolerance):
+                regressions.append(f"{size} tasks, {workload}: {throughput:.0f} ops/s against {baselineThroughput:.0f} ops/s")
+
+        peakMemory, baselinePeakMemory = sizeResults["peakMemoryBytes"], sizeBaseline["peakMemoryBytes"]
+        if peakMemory is not None and baselinePeakMemory is not None and peakMemory > baselinePeakMemory * (1 + tolerance):
+            regressions.append(f"{size} tasks, peak memory: {peakMemory / 2**20:.1f} MiB against {baselinePeakMemory / 2**20:.1f} MiB")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="add, check/uncheck and show workloads compared against a stored baseline")
+    parser.add_argument("sizes", nargs="*", type=int, default=[1000, 100000, 1000000])
+    parser.add_argument("--output", default=RESULTS_FILE_PATH, help="JSON file receiving the results")
+    parser.add_argument("--baseline", default=BASELINE_FILE_PATH, help="JSON file of results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh processes per size, the best run is kept")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="allowed relative slowdown or memory growth")
+    arguments = parser.parse_args()
+
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for taskCount in arguments.sizes:
+        runs = []
+        for _ in range(arguments.repeat):
+            with context.Pool(processes=1) as pool:
+                runs.append(pool.apply(runSize, (taskCount,)))
+        results[str(taskCount)] = bestRun(runs=runs)
+
+        for workload in WORKLOADS:
+            workloadResults = results[str(taskCount)][workload]
+            print(f"{taskCount:>9} tasks, {workload:>7}: {workloadResults['throughput']:12.0f} ops/s"
+                  f" p50 {workloadResults['p50Us']:10.1f} us p99 {workloadResults['p99Us']:10.1f} us")
+        peakMemory = results[str(taskCount)]["peakMemoryBytes"]
+        if peakMemory is not None:
+            print(f"{taskCount:>9} tasks, peak memory {peakMemory / 2**20:.1f} MiB")
+
+    with open(arguments.output, "w") as outputFile:
+        json.dump(results, outputFile, indent=2)
+
+    if arguments.save_baseline:
+        with open(arguments.baseline, "w") as baselineFile:
+            json.dump(results, baselineFile, indent=2)
+        return
+
+    if not os.path.exists(arguments.baseline):
+        print(f"No baseline at {arguments.baseline}; store one with --save-baseline.")
+        return
+
+    with open(arguments.baseline) as baselineFile:
+        regressions = compare(results=results, baseline=json.load(baselineFile), tolerance=arguments.tolerance)
+
+    for regression in regressions:
+        print(f"Regression: {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
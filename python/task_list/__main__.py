@@ -1,13 +1,142 @@
+import argparse
+import io
+import os
 import sys
 
-from app import ProgramLoop, Console
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def parseArguments():
+    parser = argparse.ArgumentParser(prog="task_list")
+    parser.add_argument("command", nargs="*", help="file of commands to run in batch mode, or one command to run and exit")
+    parser.add_argument("--batch", action="store_true", help="read commands from stdin without prompts and with buffered output")
+    parser.add_argument("--flush-every", type=int, default=1000, help="flush the output every N commands in batch mode")
+    parser.add_argument("--data-dir", help="directory holding the journal and snapshot of the task list")
+    parser.add_argument("--mapped-dir", help="directory holding the task list as memory-mapped fixed-width records")
+    parser.add_argument("--compact-every", type=int, default=100000, help="compact the journal into a snapshot every N entries")
+    parser.add_argument("--instrument", action="store_true", help="record per-command latency for the stats commands")
+    parser.add_argument("--shards", type=int, help="partition projects across N worker processes")
+    parser.add_argument("--serve", metavar="HOST:PORT", help="serve the task list to TCP clients")
+    parser.add_argument("--serve-unix", metavar="PATH", help="serve the task list to clients of a Unix socket")
+    arguments = parser.parse_args()
+
+    arguments.script = None
+    if len(arguments.command) == 1 and os.path.isfile(arguments.command[0]):
+        arguments.script    = arguments.command[0]
+        arguments.command   = []
+    return arguments
+
+
+def createProgramDatas(arguments):
+    from app import ProgramDatas
+
+    instrumentation = None
+    if arguments.instrument:
+        from instrumentation import Instrumentation
+        instrumentation = Instrumentation()
+
+    if arguments.mapped_dir is not None:
+        from mappedTable import MappedFormatError
+        from storage import MappedStorage
+        try:
+            return ProgramDatas(storage=MappedStorage(directory=arguments.mapped_dir), instrumentation=instrumentation)
+        except MappedFormatError as error:
+            sys.exit(f"task_list: {error}")
+    if arguments.data_dir is None:
+        return ProgramDatas(instrumentation=instrumentation)
+
+    from storage import FileStorage
+    return ProgramDatas(storage=FileStorage(directory=arguments.data_dir, compactEvery=arguments.compact_every), instrumentation=instrumentation)
+
+
+async def serve(arguments, programDatas) -> None:
+    from server import TaskListServer, serveForever
+
+    server = TaskListServer(programDatas=programDatas)
+    if arguments.serve_unix is not None:
+        await serveForever(server=await server.startUnix(path=arguments.serve_unix))
+        return
+
+    host, port = arguments.serve.rsplit(":", 1)
+    await serveForever(server=await server.startTcp(host=host, port=int(port)))
+
+
+def runShards(arguments) -> None:
+    from console import BatchConsole, Console
+    from shards import ShardRouter, ShardedProgramLoop
+
+    router = ShardRouter(shardCount=arguments.shards, dataDirectory=arguments.data_dir)
+    if arguments.command:
+        ShardedProgramLoop(BatchConsole(io.StringIO(" ".join(arguments.command) + "\n"), sys.stdout), router=router).run()
+        return
+
+    if arguments.script is not None:
+        with open(arguments.script) as script:
+            ShardedProgramLoop(BatchConsole(script, sys.stdout, flushEvery=arguments.flush_every), router=router, batchSize=arguments.flush_every).run()
+        return
+
+    if arguments.batch:
+        ShardedProgramLoop(BatchConsole(sys.stdin, sys.stdout, flushEvery=arguments.flush_every), router=router, batchSize=arguments.flush_every).run()
+        return
+
+    ShardedProgramLoop(Console(sys.stdin, sys.stdout), router=router).run()
+
+
+def runOneShot(arguments) -> None:
+    from console import BatchConsole
+
+    commandLineStr = " ".join(arguments.command)
+    if arguments.mapped_dir is not None:
+        from mappedTable import MappedFormatError
+        from oneShot import runInPlace, runsInPlace
+        if runsInPlace(commandLineStr=commandLineStr):
+            try:
+                runInPlace(commandLineStr=commandLineStr, directory=arguments.mapped_dir, console=BatchConsole(None, sys.stdout))
+            except MappedFormatError as error:
+                sys.exit(f"task_list: {error}")
+            return
+
+    from app import ProgramLoop
+    ProgramLoop(BatchConsole(io.StringIO(commandLineStr + "\n"), sys.stdout), programDatas=createProgramDatas(arguments=arguments)).run()
 
 
 def main():
-    task_list = ProgramLoop(Console(sys.stdin, sys.stdout))
+    arguments = parseArguments()
+    if arguments.shards is not None:
+        runShards(arguments=arguments)
+        return
+
+    if arguments.command:
+        runOneShot(arguments=arguments)
+        return
+
+    programDatas = createProgramDatas(arguments=arguments)
+
+    if arguments.serve is not None or arguments.serve_unix is not None:
+        import asyncio
+        try:
+            asyncio.run(serve(arguments=arguments, programDatas=programDatas))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            programDatas.close()
+        return
+
+    from app import ProgramLoop
+    from console import BatchConsole, Console
+
+    if arguments.script is not None:
+        with open(arguments.script) as script:
+            ProgramLoop(BatchConsole(script, sys.stdout, flushEvery=arguments.flush_every), programDatas=programDatas).run()
+        return
+
+    if arguments.batch:
+        ProgramLoop(BatchConsole(sys.stdin, sys.stdout, flushEvery=arguments.flush_every), programDatas=programDatas).run()
+        return
+
+    task_list = ProgramLoop(Console(sys.stdin, sys.stdout), programDatas=programDatas)
     task_list.run()
 
 
 if __name__ == "__main__":
     main()
-
@@ -1,371 +1,826 @@
-from typing import List
-
-from primitiveWrapper import ConsoleOuput, TaskDescription, TaskDone, TaskFounded, TaskId, ProjectFounded, ProjectName, CommandType, SubCommandType, LoopContinue
+import sys
+import threading
+import time
+from array import array
+from itertools import chain, repeat
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple
+
+from primitiveWrapper import ConsoleOuput, TaskDescription, TaskDone, TaskFounded, TaskId, ProjectFounded, ProjectName, LoopContinue
+from command import CommandLine
 from console import Console
+from exporter import EXPORT_FORMATS, exportLines
+from importer import batches, readRows
+from instrumentation import Instrumentation
+from storage import MemoryStorage
+from taskIdAllocator import TaskIdAllocator
+from taskRow import TaskRow
+from taskTable import TaskTable, missingTaskIdsOutputStr
+from undoLog import GROUP, REMOVE_TASK, RESTORE_TASK, SET_DONE, UndoLog
 
-class TaskIdentity:
+class Task:
 
-    _id         : TaskId
-    _description: TaskDescription
+    __slots__ = ("_taskTable", "_row")
 
-    def __init__(self, id: TaskId, description:TaskDescription) -> None:
-        self._id            = id
-        self._description   = description
+    _taskTable  :TaskTable
+    _row        :int
 
-    def __str__(self) -> str:
-        return f"{self._id}: {self._description}"
+    def __init__(self, taskTable:TaskTable, row:int) -> None:
+        self._taskTable = taskTable
+        self._row       = row
 
-    def taskFounded(self,taskId:TaskId) -> TaskFounded:
-        if self._id == taskId:
-            return TaskFounded(taskFoundedBooleanValue=True)
-        return TaskFounded(taskFoundedBooleanValue=False)
+    def __str__(self) -> str:
+        return self._taskTable.renderLine(row=self._row)
 
-class Task:
+    def record(self, projectName:ProjectName) -> List:
+        return self._taskTable.record(row=self._row, projectName=projectName)
 
-    _identity   : TaskIdentity
-    _done       : TaskDone
+class TaskList:
 
-    def __init__(self, identity:TaskIdentity, done:TaskDone=TaskDone()) -> None:
-        self._identity  = identity
-        self._done      = done
+    _projectName    :ProjectName
+    _taskTable      :TaskTable
+    _rows           :array
+    _undoneRows     :Set[int]
+    _lock           :threading.RLock
+    _renderedLines  :List[str]                  = None
+    _rendered       :str                        = None
+    _rowsLoader     :Callable[[], List[int]]    = None
+
+    def __init__(self, projectName:ProjectName, taskTable:TaskTable) -> None:
+        self._projectName   = projectName
+        self._taskTable     = taskTable
+        self._rows          = array("q")
+        self._undoneRows    = set()
+        self._lock          = threading.RLock()
 
     def __str__(self) -> str:
-        return f"  {self._done} {self._identity}"
-
-    def _setDoneIfFounded(self, taskId:TaskId, taskDone:TaskDone, taskFounded:TaskFounded) -> TaskFounded:
-        if taskFounded == TaskFounded(taskFoundedBooleanValue=True):
-            return taskFounded
+        with self._lock:
+            if self._rendered is not None:
+                return self._rendered
 
-        taskFounded = self._identity.taskFounded(taskId=taskId)
-        if taskFounded == TaskFounded(taskFoundedBooleanValue=True):
-            self._done = taskDone
+            rendered = "".join(self.renderChunks())
+            if self._taskTable.CACHES_LINES:
+                self._rendered = rendered
+            return rendered
 
-        return taskFounded
+    def lock(self) -> threading.RLock:
+        return self._lock
 
-    def checkIfFounded(self, taskId:TaskId, taskFounded:TaskFounded) -> TaskFounded:
-        taskDone = TaskDone(taskDoneBooleanValue=True)
-        return self._setDoneIfFounded(taskId=taskId, taskDone=taskDone, taskFounded=taskFounded)
+    def projectName(self) -> ProjectName:
+        return self._projectName
 
-    def uncheckIfFounded(self, taskId:TaskId, taskFounded:TaskFounded) -> TaskFounded:
-        taskDone = TaskDone(taskDoneBooleanValue=False)
-        return self._setDoneIfFounded(taskId=taskId, taskDone=taskDone, taskFounded=taskFounded)
+    def _loadRows(self) -> None:
+        if self._rowsLoader is None:
+            return
+        with self._lock:
+            if self._rowsLoader is not None:
+                rowsLoader, self._rowsLoader = self._rowsLoader, None
+                self._setRows(rows=rowsLoader())
+
+    def rows(self) -> List[int]:
+        with self._lock:
+            self._loadRows()
+            return list(self._rows)
+
+    def undoneRows(self) -> List[int]:
+        with self._lock:
+            self._loadRows()
+            return list(self._undoneRows)
+
+    def progress(self) -> Tuple[int, int]:
+        with self._lock:
+            self._loadRows()
+            return len(self._rows) - len(self._undoneRows), len(self._rows)
+
+    def _renderLines(self) -> List[str]:
+        self._loadRows()
+        if self._renderedLines is not None:
+            return self._renderedLines
+
+        renderedLines = [f"{self._taskTable.renderLine(row=row)}\n" for row in self._rows]
+        if self._taskTable.CACHES_LINES:
+            self._renderedLines = renderedLines
+        return renderedLines
+
+    def renderChunks(self) -> Iterator[str]:
+        with self._lock:
+            rendered        = self._rendered
+            renderedLines   = None
+            if rendered is None:
+                renderedLines = list(self._renderLines())
+
+        if rendered is not None:
+            yield rendered
+            return
 
+        yield from renderedLines
+        yield "\n"
+
+    def __len__(self) -> int:
+        self._loadRows()
+        return len(self._rows)
+
+    def windowLines(self, offset:int, limit:int) -> List[str]:
+        with self._lock:
+            self._loadRows()
+            if self._renderedLines is not None:
+                return self._renderedLines[offset:offset + limit]
+            return [f"{self._taskTable.renderLine(row=row)}\n" for row in self._rows[offset:offset + limit]]
+
+    def tasks(self) -> Iterator[Task]:
+        self._loadRows()
+        for row in self._rows:
+            yield Task(taskTable=self._taskTable, row=row)
+
+    def taskRows(self, projectName:ProjectName) -> Iterator[TaskRow]:
+        self._loadRows()
+        for row in self._rows:
+            yield self._taskTable.taskRow(row=row, projectName=projectName)
+
+    def addTask(self, taskId:TaskId, taskDescription:TaskDescription, taskDone:TaskDone, createdAt:int, completedAt:int) -> None:
+        with self._lock:
+            self._loadRows()
+            row = self._taskTable.addRow(
+                taskId=taskId, taskDescription=taskDescription, taskDone=taskDone, taskList=self, position=len(self._rows),
+                createdAt=createdAt, completedAt=completedAt)
+            self._rows.append(row)
+            if not taskDone:
+                self._undoneRows.add(row)
+            if self._renderedLines is not None:
+                self._renderedLines.append(f"{self._taskTable.renderLine(row=row)}\n")
+            self._rendered = None
+
+    def _setRows(self, rows:List[int]) -> None:
+        self._rows          = array("q", rows)
+        self._undoneRows    = {row for row in rows if not self._taskTable.taskDone(row=row)}
+        self._renderedLines = None
+        self._rendered      = None
+
+    def attachRows(self, rows:List[int]) -> None:
+        with self._lock:
+            self._taskTable.attachTaskList(taskList=self)
+            self._rowsLoader = None
+            self._setRows(rows=rows)
+
+    def attachRowsLoader(self, rowsLoader:Callable[[], List[int]]) -> None:
+        with self._lock:
+            self._taskTable.attachTaskList(taskList=self)
+            self._rowsLoader = rowsLoader
+
+    def setDoneRows(self, rows:List[int], taskDone:TaskDone, completedAt:int) -> bytes:
+        with self._lock:
+            self._loadRows()
+            previousDone = self._taskTable.setDoneRows(rows=rows, taskDone=taskDone, completedAt=completedAt)
+            if taskDone:
+                self._undoneRows.difference_update(rows)
+            else:
+                self._undoneRows.update(rows)
+            if self._renderedLines is not None:
+                for row in rows:
+                    self._renderedLines[self._taskTable.position(row=row)] = f"{self._taskTable.renderLine(row=row)}\n"
+            self._rendered = None
+            return previousDone
+
+    def removeTask(self, row:int) -> None:
+        with self._lock:
+            self._loadRows()
+            position = self._taskTable.position(row=row)
+            del self._rows[position]
+            for followingPosition in range(position, len(self._rows)):
+                self._taskTable.setPosition(row=self._rows[followingPosition], position=followingPosition)
+            self._undoneRows.discard(row)
+            if self._renderedLines is not None:
+                del self._renderedLines[position]
+            self._rendered = None
+            self._taskTable.removeRow(row=row)
+
+    def restoreTask(self, row:int) -> None:
+        with self._lock:
+            self._loadRows()
+            self._taskTable.restoreRow(row=row, position=len(self._rows))
+            self._rows.append(row)
+            if not self._taskTable.taskDone(row=row):
+                self._undoneRows.add(row)
+            if self._renderedLines is not None:
+                self._renderedLines.append(f"{self._taskTable.renderLine(row=row)}\n")
+            self._rendered = None
+
+    def setDone(self, row:int, taskDone:TaskDone, completedAt:int) -> None:
+        with self._lock:
+            self._loadRows()
+            self._taskTable.setDone(row=row, taskDone=taskDone, completedAt=completedAt)
+            if taskDone:
+                self._undoneRows.discard(row)
+            else:
+                self._undoneRows.add(row)
+            if self._renderedLines is not None:
+                self._renderedLines[self._taskTable.position(row=row)] = f"{self._taskTable.renderLine(row=row)}\n"
+            self._rendered = None
 
-class TaskList:
+class Project:
 
-    _tasks:List[Task]
+    _name       :ProjectName
+    _taskList   :TaskList
 
-    def __init__(self) -> None:
-        self._tasks = []
+    def __init__(self, name:ProjectName, taskTable:TaskTable) -> None:
+        self._name      = name
+        self._taskList  = TaskList(projectName=name, taskTable=taskTable)
 
     def __str__(self) -> str:
-        toString = ""
-        for task in self._tasks:
-            toString += f"{task}\n"
-        toString += "\n"
+        return "".join(self.renderChunks())
 
-        return toString
+    def lock(self) -> threading.RLock:
+        return self._taskList.lock()
 
-    def addTask(self, task:Task) -> None:
-        self._tasks.append(task)
+    def renderChunks(self) -> Iterator[str]:
+        yield f"{self._name}\n"
+        yield from self._taskList.renderChunks()
 
-    def checkIfFounded(self, taskId:TaskId, taskFounded:TaskFounded) -> TaskFounded:
+    def renderWindowChunks(self, offset:int, limit:int) -> Iterator[str]:
+        lines       = self._taskList.windowLines(offset=offset, limit=limit)
+        taskCount   = len(self._taskList)
+        yield f"{self._name}: {len(lines)} of {taskCount} tasks, offset {offset}\n"
+        yield from lines
+        if offset + len(lines) < taskCount:
+            yield f"next: show {self._name} {offset + len(lines)} {limit}\n"
+        yield "\n"
 
-        for task in self._tasks:
-            taskFounded = task.checkIfFounded(taskId=taskId, taskFounded=taskFounded)
+    def records(self) -> Iterator[List]:
+        yield ["P", str(self._name)]
+        for task in self._taskList.tasks():
+            yield task.record(projectName=self._name)
 
-        return taskFounded
+    def taskRows(self) -> Iterator[TaskRow]:
+        return self._taskList.taskRows(projectName=self._name)
 
-    def uncheckIfFounded(self, taskId:TaskId, taskFounded:TaskFounded) -> TaskFounded:
+    def rows(self) -> List[int]:
+        return self._taskList.rows()
 
-        for task in self._tasks:
-            taskFounded = task.uncheckIfFounded(taskId=taskId, taskFounded=taskFounded)
+    def undoneRows(self) -> List[int]:
+        return self._taskList.undoneRows()
 
-        return taskFounded
+    def progress(self) -> Tuple[int, int]:
+        return self._taskList.progress()
 
-class Project:
+    def attachRows(self, rows:List[int]) -> None:
+        self._taskList.attachRows(rows=rows)
 
-    _name       :ProjectName
-    _taskList   :TaskList
+    def attachRowsLoader(self, rowsLoader:Callable[[], List[int]]) -> None:
+        self._taskList.attachRowsLoader(rowsLoader=rowsLoader)
 
-    def __init__(self, name:ProjectName) -> None:
-        self._name      = name
-        self._taskList  = TaskList()
+    def addTask(self, taskId:TaskId, taskDescription:TaskDescription, taskDone:TaskDone, createdAt:int, completedAt:int) -> None:
+        self._taskList.addTask(taskId=taskId, taskDescription=taskDescription, taskDone=taskDone, createdAt=createdAt, completedAt=completedAt)
+
+class ProjectList:
+
+    _taskTable  :TaskTable
+    _projects   :Dict[ProjectName, Project]
+    _lock       :threading.Lock
+
+    def __init__(self, taskTable:TaskTable) -> None:
+        self._taskTable = taskTable
+        self._projects  = {}
+        self._lock      = threading.Lock()
+
+    def lock(self) -> threading.Lock:
+        return self._lock
 
     def __str__(self) -> str:
-        return f"{self._name}\n{self._taskList}"
+        return "".join(self.renderChunks())
 
-    def addTask(self, task:Task) -> None:
-        self._taskList.addTask(task=task)
+    def renderChunks(self) -> Iterator[str]:
+        for project in self._projects.values():
+            yield from project.renderChunks()
 
-    def checkTaskIfFounded(self, taskId:TaskId, taskFounded:TaskFounded) -> TaskFounded:
-        if taskFounded == TaskFounded(taskFoundedBooleanValue=True):
-            return taskFounded
-        return self._taskList.checkIfFounded(taskId=taskId, taskFounded=taskFounded)
+    def records(self) -> Iterator[List]:
+        for project in self._projects.values():
+            yield from project.records()
 
-    def uncheckTaskIfFounded(self, taskId:TaskId, taskFounded:TaskFounded) -> TaskFounded:
-        if taskFounded == TaskFounded(taskFoundedBooleanValue=True):
-            return taskFounded
-        return self._taskList.uncheckIfFounded(taskId=taskId, taskFounded=taskFounded)
+    def renderedProjects(self) -> List[Tuple[str, str]]:
+        return [(str(projectName), str(project)) for projectName, project in self._projects.items()]
 
-    def addTaskIfProjectFounded(self, projectName:ProjectName, taskIdentity:TaskIdentity, projectFounded:ProjectFounded) -> ProjectFounded:
-        if projectFounded == ProjectFounded(projectFoundedBooleanValue=True):
-            return projectFounded
+    def taskRows(self) -> Iterator[TaskRow]:
+        for project in self._projects.values():
+            yield from project.taskRows()
 
-        if self._name == projectName:
-            task = Task(identity=taskIdentity)
-            self._taskList.addTask(task=task)
-            return ProjectFounded(projectFoundedBooleanValue=True)
+    def undoneRows(self) -> List[int]:
+        rows = []
+        for project in self._projects.values():
+            rows.extend(project.undoneRows())
+        return rows
 
-        return ProjectFounded(projectFoundedBooleanValue=False)
+    def progress(self) -> List[Tuple[str, int, int]]:
+        return [(str(projectName), *project.progress()) for projectName, project in self._projects.items()]
 
-class ProjectList:
+    def projectFounded(self, projectName:ProjectName) -> ProjectFounded:
+        return ProjectFounded(projectFoundedBooleanValue=projectName in self._projects)
 
-    _projects:List[Project]
+    def addTaskIfProjectFounded(self, projectName:ProjectName, taskId:TaskId, taskDescription:TaskDescription, taskDone:TaskDone, createdAt:int, completedAt:int) -> ProjectFounded:
+        projectFounded = self.projectFounded(projectName=projectName)
+        if projectFounded == ProjectFounded(projectFoundedBooleanValue=True):
+            self._projects[projectName].addTask(taskId=taskId, taskDescription=taskDescription, taskDone=taskDone, createdAt=createdAt, completedAt=completedAt)
 
-    def __init__(self) -> None:
-        self._projects = []
+        return projectFounded
 
-    def __str__(self) -> str:
-        toString = ""
-        for project in self._projects:
-            toString += f"{project}"
-        return toString
+    def project(self, projectName:ProjectName) -> Project:
+        return self._projects[projectName]
 
-    def _consolePrintIfTaskNotFound(self, taskFounded:TaskFounded, taskId:TaskId, console:Console) -> None:
-        if taskFounded == TaskFounded(taskFoundedBooleanValue=False):
-            outputStr = f"Could not find a task with an ID of {taskId}"
-            console.print(output=ConsoleOuput(outputStr=outputStr))
+    def addProject(self, projectName:ProjectName) -> None:
+        projects                = dict(self._projects)
+        projects[projectName]   = Project(name=projectName, taskTable=self._taskTable)
+        self._projects          = projects
 
-    def checkTask(self, taskId:TaskId, console:Console) -> None:
-        taskFounded = TaskFounded()
-        for project in self._projects:
-            taskFounded = project.checkTaskIfFounded(taskId=taskId, taskFounded=taskFounded)
+class ProgramDatas:
 
-        self._consolePrintIfTaskNotFound(taskFounded=taskFounded, taskId=taskId, console=console)
+    _taskTable          :TaskTable
+    _projectList        :ProjectList
+    _taskIdAllocator    :TaskIdAllocator
+    _storage            :MemoryStorage
+    _instrumentation    :Instrumentation
+    _undoLog            :UndoLog
+    _clock              :Callable[[], float]
+
+    def __init__(self, storage:MemoryStorage = None, instrumentation:Instrumentation = None, taskIdAllocator:TaskIdAllocator = None, clock:Callable[[], float] = time.time) -> None:
+        self._storage           = MemoryStorage()
+        self._taskTable         = (self._storage if storage is None else storage).createTaskTable()
+        self._projectList       = ProjectList(taskTable=self._taskTable)
+        self._taskIdAllocator   = TaskIdAllocator() if taskIdAllocator is None else taskIdAllocator
+        self._instrumentation   = instrumentation
+        self._undoLog           = UndoLog()
+        self._clock             = clock
+
+        if storage is not None:
+            storage.load(programDatas=self)
+            self._storage       = storage
+
+    def close(self) -> None:
+        self._storage.close()
+
+    def records(self) -> Iterator[List]:
+        return self._projectList.records()
 
-    def uncheckTask(self, taskId:TaskId, console:Console) -> None:
-        taskFounded = TaskFounded()
-        for project in self._projects:
-            taskFounded = project.uncheckTaskIfFounded(taskId=taskId, taskFounded=taskFounded)
+    def __str__(self) -> str:
+        return str(self._projectList)
 
-        self._consolePrintIfTaskNotFound(taskFounded=taskFounded, taskId=taskId, console=console)
+    def instrumentation(self) -> Instrumentation:
+        return self._instrumentation
 
-    def addTaskIfProjectFounded(self, projectName:ProjectName, taskIdentity:TaskIdentity) -> ProjectFounded:
-        projectFounded = ProjectFounded()
-        for project in self._projects:
-            projectFound = project.addTaskIfProjectFounded(projectName=projectName, taskIdentity=taskIdentity, projectFounded=projectFounded)
+    def _now(self) -> int:
+        return int(self._clock())
 
-        return projectFound
+    def renderChunks(self) -> Iterator[str]:
+        return self._projectList.renderChunks()
 
-    def addProject(self, project:Project) -> None:
-        self._projects.append(project)
+    def renderedProjects(self) -> List[Tuple[str, str]]:
+        return self._projectList.renderedProjects()
 
+    def showChunks(self, projectName:ProjectName = None, offset:int = 0, limit:int = None) -> Iterator[str]:
+        if projectName is None:
+            return chain(self.renderChunks(), ("\n",))
 
-class ProgramDatas:
+        if self._projectList.projectFounded(projectName=projectName) == ProjectFounded(projectFoundedBooleanValue=False):
+            return iter((f"Could not find a project with the name {projectName}.\n",))
 
-    _projectList:ProjectList
-    _lastTaskId :TaskId
+        if limit is None:
+            limit = sys.maxsize
+        project = self._projectList.project(projectName=projectName)
+        return chain(project.renderWindowChunks(offset=offset, limit=limit), ("\n",))
 
-    def __init__(self) -> None:
-        self._projectList   = ProjectList()
-        self._lastTaskId    = TaskId()
+    def nextTaskId(self) -> TaskId:
+        return self._taskIdAllocator.nextTaskId()
 
-    def __str__(self) -> str:
-        return str(self._projectList)
+    def reserveTaskIds(self, count:int) -> range:
+        reserved = self._taskIdAllocator.reserve(count=count)
+        self._storage.recordNextTaskId(nextTaskId=self._taskIdAllocator.nextTaskId())
+        return reserved
 
     def addTask(self, projectName:ProjectName, taskDescription:TaskDescription, console:Console) -> None:
 
-        taskId          = self._lastTaskId.nextOne()
-        taskIdentity    = TaskIdentity(id=taskId, description=taskDescription)
-        projectFounded  = self._projectList.addTaskIfProjectFounded(projectName=projectName, taskIdentity=taskIdentity)
-
-        if projectFounded == ProjectFounded(projectFoundedBooleanValue=False):
+        if self._projectList.projectFounded(projectName=projectName) == ProjectFounded(projectFoundedBooleanValue=False):
             outputStr = f"Could not find a project with the name {projectName}."
             console.print(output=ConsoleOuput(outputStr=outputStr))
             return None
 
-        self._lastTaskId = taskId
+        project     = self._projectList.project(projectName=projectName)
+        taskId      = self._taskIdAllocator.allocate()
+        createdAt   = self._now()
+        with project.lock():
+            project.addTask(taskId=taskId, taskDescription=taskDescription, taskDone=TaskDone(), createdAt=createdAt, completedAt=0)
+            self._storage.recordAddTask(taskId=taskId, projectName=projectName, taskDescription=taskDescription, createdAt=createdAt)
+            self._undoLog.record(entry=(REMOVE_TASK, self._taskTable.row(taskId=taskId)))
 
-    def addProject(self, project:Project) -> None:
-        self._projectList.addProject(project=project)
+        self._storage.compactIfNeeded(programDatas=self)
 
-    def checkTask(self, taskId:TaskId, console:Console) -> None:
-        self._projectList.checkTask(taskId=taskId, console=console)
+    def addProject(self, projectName:ProjectName, console:Console) -> None:
+        with self._projectList.lock():
+            projectFounded = self._projectList.projectFounded(projectName=projectName)
+            if projectFounded == ProjectFounded(projectFoundedBooleanValue=False):
+                self._projectList.addProject(projectName=projectName)
+                self._storage.recordAddProject(projectName=projectName)
 
-    def uncheckTask(self, taskId:TaskId, console:Console) -> None:
-        self._projectList.uncheckTask(taskId=taskId, console=console)
+        if projectFounded == ProjectFounded(projectFoundedBooleanValue=True):
+            outputStr = f"A project with the name {projectName} already exists."
+            console.print(output=ConsoleOuput(outputStr=outputStr))
+            return None
 
-class ArgumentLine:
-    pass
+        self._storage.compactIfNeeded(programDatas=self)
+
+    def _importProject(self, projectName:ProjectName) -> Project:
+        with self._projectList.lock():
+            if self._projectList.projectFounded(projectName=projectName) == ProjectFounded(projectFoundedBooleanValue=False):
+                self._projectList.addProject(projectName=projectName)
+                self._storage.recordAddProject(projectName=projectName)
+
+        return self._projectList.project(projectName=projectName)
+
+    def _importProjectRows(self, projectName:str, rows:List[TaskRow]) -> int:
+        project     = self._importProject(projectName=ProjectName(projetNameStr=projectName))
+        records     = []
+        createdAt   = self._now()
+
+        with project.lock():
+            for row in rows:
+                taskId = TaskId(taskIdInt=row.taskId)
+                if self._taskTable.taskFounded(taskId=taskId) == TaskFounded(taskFoundedBooleanValue=True):
+                    continue
+
+                completedAt = createdAt if row.taskDone else 0
+                project.addTask(
+                    taskId=taskId,
+                    taskDescription=TaskDescription(taskDescriptionStr=row.taskDescription),
+                    taskDone=TaskDone(taskDoneBooleanValue=row.taskDone),
+                    createdAt=createdAt,
+                    completedAt=completedAt)
+                self._taskIdAllocator.observe(taskId=taskId)
+                records.append(["T", int(taskId), projectName, row.taskDescription, row.taskDone, createdAt, completedAt])
+
+            self._storage.recordRecords(records=records)
+
+        return len(records)
+
+    def _importBatch(self, batch:List[TaskRow]) -> Tuple[int, int]:
+        rowsByProject   :Dict[str, List[TaskRow]] = {}
+        taskIdInts      :Set[int]                 = set()
+        acceptedRows    :List[TaskRow]            = []
+        importedCount   = 0
+
+        for row in batch:
+            if row.taskId is not None:
+                if row.taskId in taskIdInts or self._taskTable.taskFounded(taskId=TaskId(taskIdInt=row.taskId)) == TaskFounded(taskFoundedBooleanValue=True):
+                    continue
+                taskIdInts.add(row.taskId)
+            acceptedRows.append(row)
+
+        newTaskIdCount  = sum(1 for row in acceptedRows if row.taskId is None)
+        newTaskIdInts   :List[int] = []
+        while len(newTaskIdInts) < newTaskIdCount:
+            newTaskIdInts.extend(taskIdInt for taskIdInt in self._taskIdAllocator.reserve(count=newTaskIdCount - len(newTaskIdInts)) if taskIdInt not in taskIdInts)
+
+        newTaskIds = iter(newTaskIdInts)
+        for row in acceptedRows:
+            if row.taskId is None:
+                row = TaskRow(next(newTaskIds), row.projectName, row.taskDescription, row.taskDone)
+            rowsByProject.setdefault(row.projectName, []).append(row)
+
+        for projectName, rows in rowsByProject.items():
+            importedCount += self._importProjectRows(projectName=projectName, rows=rows)
+
+        self._storage.compactIfNeeded(programDatas=self)
+        return importedCount, len(batch) - importedCount
+
+    def importTasks(self, rows:Iterable[TaskRow], batchSize:int = 10000) -> Tuple[int, int]:
+        importedCount   = 0
+        skippedCount    = 0
+        for batch in batches(rows=rows, batchSize=batchSize):
+            batchImportedCount, batchSkippedCount = self._importBatch(batch=batch)
+            importedCount   += batchImportedCount
+            skippedCount    += batchSkippedCount
+
+        return importedCount, skippedCount
+
+    def importFile(self, filePath:str, console:Console) -> None:
+        try:
+            with open(filePath, newline="", encoding="utf-8") as taskFile:
+                importedCount, skippedCount = self.importTasks(rows=readRows(taskFile=taskFile, filePath=filePath))
+        except (OSError, ValueError, KeyError) as error:
+            console.print(output=ConsoleOuput(outputStr=f"Could not import {filePath}: {error}"))
+            return None
 
-class ArgumentLineAdd(ArgumentLine):
+        outputStr = f"Imported {importedCount} tasks."
+        if skippedCount > 0:
+            outputStr += f" Skipped {skippedCount} tasks with an existing ID."
+        console.print(output=ConsoleOuput(outputStr=outputStr))
 
-    _projectName    :ProjectName
-    _taskDescription:TaskDescription = None
+    def exportRows(self) -> Iterator[TaskRow]:
+        return self._projectList.taskRows()
 
-    def __init__(self, projectName:ProjectName, taskDescription:TaskDescription=None) -> None:
-        self._projectName       = projectName
-        self._taskDescription   = taskDescription
+    def exportLines(self, exportFormat:str) -> Iterator[str]:
+        return exportLines(rows=self.exportRows(), exportFormat=exportFormat)
 
-    def addProject(self, programDatas:ProgramDatas) -> None:
-        programDatas.addProject(Project(name=self._projectName))
+    def exportTasks(self, exportFormat:str, filePath:str, console:Console) -> None:
+        if exportFormat not in EXPORT_FORMATS:
+            console.print(output=ConsoleOuput(outputStr=f"Could not export to the unknown format {exportFormat}."))
+            return None
 
-    def addTask(self, programDatas:ProgramDatas, console:Console) -> None:
-        programDatas.addTask(projectName=self._projectName, taskDescription=self._taskDescription, console=console)
+        if filePath is None:
+            console.writeChunks(chunks=self.exportLines(exportFormat=exportFormat))
+            return None
 
-class ArgumentLineSetDone(ArgumentLine):
+        try:
+            with open(filePath, "w", newline="", encoding="utf-8") as taskFile:
+                taskFile.writelines(self.exportLines(exportFormat=exportFormat))
+        except OSError as error:
+            console.print(output=ConsoleOuput(outputStr=f"Could not export to {filePath}: {error}"))
 
-    _taskId:TaskId
+    def _queryChunks(self, rows:List[int]) -> Iterator[str]:
+        for row in sorted(rows):
+            yield self._taskTable.renderQueryLine(row=row)
 
-    def __init__(self, taskId:TaskId) -> None:
-        self._taskId = taskId
+    def _projectRowsOrPrint(self, projectName:ProjectName, console:Console, undone:bool) -> List[int]:
+        if self._projectList.projectFounded(projectName=projectName) == ProjectFounded(projectFoundedBooleanValue=False):
+            outputStr = f"Could not find a project with the name {projectName}."
+            console.print(output=ConsoleOuput(outputStr=outputStr))
+            return None
 
-    def check(self, programDatas:ProgramDatas, console:Console) -> None:
-        programDatas.checkTask(taskId=self._taskId, console=console)
+        project = self._projectList.project(projectName=projectName)
+        return project.undoneRows() if undone else project.rows()
 
-    def uncheck(self, programDatas:ProgramDatas, console:Console) -> None:
-        programDatas.uncheckTask(taskId=self._taskId, console=console)
+    def listUndone(self, projectName:ProjectName, console:Console) -> None:
+        if projectName is None:
+            console.printChunks(chunks=self._queryChunks(rows=self._projectList.undoneRows()))
+            return None
 
-class SubCommand:
+        rows = self._projectRowsOrPrint(projectName=projectName, console=console, undone=True)
+        if rows is not None:
+            console.printChunks(chunks=self._queryChunks(rows=rows))
 
-    _type:SubCommandType
+    def listProject(self, projectName:ProjectName, console:Console) -> None:
+        rows = self._projectRowsOrPrint(projectName=projectName, console=console, undone=False)
+        if rows is not None:
+            console.printChunks(chunks=self._queryChunks(rows=rows))
 
-    def __init__(self, type:SubCommandType) -> None:
-        self._type = type
+    def listWord(self, word:str, console:Console) -> None:
+        console.printChunks(chunks=self._queryChunks(rows=self._taskTable.rowsWithToken(token=word)))
 
-    def createArgumentLineAdd(self, argumentLineStr:str) -> ArgumentLineAdd:
-        if self._type.isProject():
-            projectName = ProjectName(projetNameStr=argumentLineStr)
-            return ArgumentLineAdd(projectName=projectName)
+    def listPrefix(self, prefix:str, console:Console) -> None:
+        console.printChunks(chunks=self._queryChunks(rows=self._taskTable.rowsWithPrefix(prefix=prefix)))
 
-        if self._type.isTask():
-            argumentLineSplited = argumentLineStr.split(" ")
-            projectName         = ProjectName(projetNameStr=argumentLineSplited[0])
-            taskDescription     = TaskDescription(taskDescriptionStr=argumentLineSplited[1])
-            return ArgumentLineAdd(projectName=projectName, taskDescription=taskDescription)
+    def search(self, tokens:List[str], prefixes:List[str], console:Console) -> None:
+        console.printChunks(chunks=self._queryChunks(rows=self._taskTable.rowsMatchingAll(tokens=tokens, prefixes=prefixes)))
 
-    def executeAdd(self, argumentLine:ArgumentLineAdd, programDatas:ProgramDatas, console:Console) -> None:
-        if self._type.isProject():
-            argumentLine.addProject(programDatas=programDatas)
+    def listCompletedSince(self, since:int, console:Console) -> None:
+        console.printChunks(chunks=(self._taskTable.renderCompletedLine(row=row) for row in self._taskTable.rowsCompletedSince(since=since)))
 
-        if self._type.isTask():
-            argumentLine.addTask(programDatas=programDatas, console=console)
+    def completedCountLines(self) -> Iterator[str]:
+        for day, counts in sorted(self._taskTable.completedCountsByDay().items()):
+            projectCounts = ", ".join(f"{projectName} {count}" for projectName, count in sorted(counts.items()))
+            yield f"{day}: {sum(counts.values())} ({projectCounts})\n"
 
-class CommandRest:
+    def printCompletedCounts(self, console:Console) -> None:
+        console.printChunks(chunks=self.completedCountLines())
 
-    _subCommand     :SubCommand
-    _argumentLine   :ArgumentLine
+    def progress(self) -> List[Tuple[str, int, int]]:
+        return self._projectList.progress()
 
-    def __init__(self, subCommand:SubCommand=None, argumentLineStr:str=None, taskId:TaskId=None) -> None:
-        if subCommand is not None:
-            self._subCommand    = subCommand
-            self._argumentLine  = self._subCommand.createArgumentLineAdd(argumentLineStr=argumentLineStr)
-            return
+    def progressLines(self) -> Iterator[str]:
+        doneCount   = 0
+        taskCount   = 0
+        for projectName, projectDoneCount, projectTaskCount in self.progress():
+            doneCount += projectDoneCount
+            taskCount += projectTaskCount
+            yield f"{projectName}: {projectDoneCount} of {projectTaskCount} tasks done\n"
+        yield f"all projects: {doneCount} of {taskCount} tasks done\n"
 
-        if taskId is not None:
-            self._argumentLine = ArgumentLineSetDone(taskId=taskId)
-            return
+    def printProgress(self, console:Console) -> None:
+        console.printChunks(chunks=self.progressLines())
 
-    def executeAdd(self, programDatas:ProgramDatas, console:Console) -> None:
-        self._subCommand.executeAdd(argumentLine=self._argumentLine, programDatas=programDatas, console=console)
+    def _instrumentationOrPrint(self, console:Console) -> Instrumentation:
+        if self._instrumentation is None:
+            console.print(output=ConsoleOuput(outputStr="Instrumentation is off. Start the task list with --instrument."))
+        return self._instrumentation
 
-    def executeCheck(self, programDatas:ProgramDatas, console:Console) -> None:
-        self._argumentLine.check(programDatas=programDatas, console=console)
+    def printLatencyStats(self, console:Console) -> None:
+        instrumentation = self._instrumentationOrPrint(console=console)
+        if instrumentation is not None:
+            console.printChunks(chunks=instrumentation.reportLines())
 
-    def executeUncheck(self, programDatas:ProgramDatas, console:Console) -> None:
-        self._argumentLine.uncheck(programDatas=programDatas, console=console)
+    def dumpLatencyStats(self, filePath:str, console:Console) -> None:
+        instrumentation = self._instrumentationOrPrint(console=console)
+        if instrumentation is None:
+            return None
 
-class Command:
+        if filePath is None:
+            console.writeChunks(chunks=instrumentation.jsonLines())
+            return None
 
-    _type:CommandType
+        try:
+            with open(filePath, "w", encoding="utf-8") as statsFile:
+                statsFile.writelines(instrumentation.jsonLines())
+        except OSError as error:
+            console.print(output=ConsoleOuput(outputStr=f"Could not write the stats to {filePath}: {error}"))
 
-    def __init__(self, type:CommandType) -> None:
-        self._type = type
+    def profileCommands(self, commandCount:int, filePath:str, console:Console) -> None:
+        instrumentation = self._instrumentationOrPrint(console=console)
+        if instrumentation is None:
+            return None
 
-    def createCommandRest(self, commandRestStr:str) -> CommandRest:
-        if self._type.isAdd():
-            commandRestStrSplited   = commandRestStr.split(" ", 1)
-            subCommandStr           = commandRestStrSplited[0]
-            argumentLineStr         = commandRestStrSplited[1]
-            subCommand              = SubCommand(type=SubCommandType(subCommandStr=subCommandStr))
-            return CommandRest(subCommand=subCommand, argumentLineStr=argumentLineStr)
+        try:
+            open(filePath, "wb").close()
+        except OSError as error:
+            console.print(output=ConsoleOuput(outputStr=f"Could not write the profile to {filePath}: {error}"))
+            return None
+        instrumentation.startProfile(commandCount=commandCount, filePath=filePath)
 
-        if self._type.isCheck() or self._type.isUncheck():
-            taskId = TaskId(taskIdInt=int(commandRestStr))
-            return CommandRest(taskId=taskId)
+    def restoreProject(self, projectName:ProjectName) -> None:
+        if self._projectList.projectFounded(projectName=projectName) == ProjectFounded(projectFoundedBooleanValue=False):
+            self._projectList.addProject(projectName=projectName)
 
-    def loopContinue(self) -> LoopContinue:
-        if self._type.isQuit():
-            return LoopContinue(loopContinueBooleanValue=False)
-        return LoopContinue(loopContinueBooleanValue=True)
+    def restoreTask(self, taskId:TaskId, projectName:ProjectName, taskDescription:TaskDescription, taskDone:TaskDone, createdAt:int, completedAt:int) -> None:
+        if self._taskTable.taskFounded(taskId=taskId) == TaskFounded(taskFoundedBooleanValue=True):
+            return None
 
-    def execute(self, commandRest:CommandRest, programDatas:ProgramDatas, console:Console) -> None:
+        self._projectList.addTaskIfProjectFounded(
+            projectName=projectName, taskId=taskId, taskDescription=taskDescription, taskDone=taskDone, createdAt=createdAt, completedAt=completedAt)
+        self._taskIdAllocator.observe(taskId=taskId)
 
-        if self._type.isShow():
-            console.print(output=ConsoleOuput(outputStr=str(programDatas)))
-            return
+    def restoreProjectRows(self, projectName:ProjectName, rows:List[int]) -> None:
+        self._projectList.project(projectName=projectName).attachRows(rows=rows)
 
-        if self._type.isAdd():
-            commandRest.executeAdd(programDatas=programDatas, console=console)
-            return
+    def restoreProjectRowsLoader(self, projectName:ProjectName, rowsLoader:Callable[[], List[int]]) -> None:
+        self._projectList.project(projectName=projectName).attachRowsLoader(rowsLoader=rowsLoader)
 
-        if self._type.isCheck():
-            commandRest.executeCheck(programDatas=programDatas, console=console)
-            return
+    def restoreNextTaskId(self, nextTaskId:TaskId) -> None:
+        self._taskIdAllocator.advanceTo(nextTaskId=nextTaskId)
 
-        if self._type.isUncheck():
-            commandRest.executeUncheck(programDatas=programDatas, console=console)
-            return
+    def restoreTaskRemoved(self, taskId:TaskId) -> None:
+        if self._taskTable.taskFounded(taskId=taskId) == TaskFounded(taskFoundedBooleanValue=True):
+            row = self._taskTable.row(taskId=taskId)
+            self._taskTable.taskList(row=row).removeTask(row=row)
 
-        if self._type.isHelp():
-            console.print(output=ConsoleOuput())
-            return
+    def restoreTaskDone(self, taskId:TaskId, taskDone:TaskDone, completedAt:int) -> None:
+        if self._taskTable.taskFounded(taskId=taskId) == TaskFounded(taskFoundedBooleanValue=True):
+            row = self._taskTable.row(taskId=taskId)
+            self._taskTable.taskList(row=row).setDone(row=row, taskDone=taskDone, completedAt=completedAt)
 
-        if self._type.isError():
-            outputStr = f"I don't know what the command {self._type} is."
+    def _consolePrintIfTaskNotFound(self, taskFounded:TaskFounded, taskId:TaskId, console:Console) -> None:
+        if taskFounded == TaskFounded(taskFoundedBooleanValue=False):
+            outputStr = f"Could not find a task with an ID of {taskId}"
             console.print(output=ConsoleOuput(outputStr=outputStr))
-            return
 
-class CommandLine:
+    def _setTaskDone(self, taskId:TaskId, taskDone:TaskDone, console:Console) -> None:
+        taskFounded = self._taskTable.taskFounded(taskId=taskId)
+        self._consolePrintIfTaskNotFound(taskFounded=taskFounded, taskId=taskId, console=console)
+        if taskFounded == TaskFounded(taskFoundedBooleanValue=False):
+            return None
+
+        row         = self._taskTable.row(taskId=taskId)
+        taskList    = self._taskTable.taskList(row=row)
+        completedAt = self._now()
+        with taskList.lock():
+            self._undoLog.record(entry=(SET_DONE, row, int(bool(self._taskTable.taskDone(row=row))), self._taskTable.completedAt(row=row)))
+            taskList.setDone(row=row, taskDone=taskDone, completedAt=completedAt)
+            self._storage.recordTaskDone(taskId=taskId, taskDone=taskDone, completedAt=completedAt)
 
-    _command    :Command
-    _commandRest:CommandRest = None
+        self._storage.compactIfNeeded(programDatas=self)
 
-    def __init__(self, commandLineStr:str) -> None:
+    def checkTask(self, taskId:TaskId, console:Console) -> None:
+        self._setTaskDone(taskId=taskId, taskDone=TaskDone(taskDoneBooleanValue=True), console=console)
 
-        commandLineStr      = commandLineStr.strip()
-        commandLineSplited  = commandLineStr.split(" ", 1)
-        commandStr          = commandLineSplited[0]
-        self._command       = Command(type=CommandType(commandStr=commandStr))
+    def uncheckTask(self, taskId:TaskId, console:Console) -> None:
+        self._setTaskDone(taskId=taskId, taskDone=TaskDone(taskDoneBooleanValue=False), console=console)
+
+    def _consolePrintMissingRanges(self, missingRanges:List[List[int]], console:Console) -> None:
+        if missingRanges:
+            console.print(output=ConsoleOuput(outputStr=missingTaskIdsOutputStr(missingRanges=missingRanges)))
+
+    def setTasksDone(self, taskIdRanges:List[range], taskDone:TaskDone, console:Console) -> None:
+        rows, missingRanges = self._taskTable.rowsInIdRanges(taskIdRanges=taskIdRanges, nextTaskIdInt=int(self._taskIdAllocator.nextTaskId()))
+        self._consolePrintMissingRanges(missingRanges=missingRanges, console=console)
+
+        rowsByTaskList:Dict[TaskList, List[int]] = {}
+        for row in rows:
+            rowsByTaskList.setdefault(self._taskTable.taskList(row=row), []).append(row)
+
+        completedAt = self._now()
+        for taskList, taskListRows in rowsByTaskList.items():
+            with taskList.lock():
+                previousCompleted   = self._taskTable.completedAts(rows=taskListRows)
+                previousDone        = taskList.setDoneRows(rows=taskListRows, taskDone=taskDone, completedAt=completedAt)
+                self._undoLog.recordMany(entries=zip(repeat(SET_DONE), taskListRows, previousDone, previousCompleted))
+                self._storage.recordRecords(records=[["D", taskIdInt, bool(taskDone), completedAt] for taskIdInt in self._taskTable.taskIdInts(rows=taskListRows)])
+
+        if rows:
+            self._undoLog.record(entry=(GROUP, len(rows)))
+        self._storage.compactIfNeeded(programDatas=self)
+
+    def _applyUndoEntry(self, entry:Tuple[int, ...]) -> Tuple[int, ...]:
+        kind, row   = entry[0], entry[1]
+        taskList    = self._taskTable.taskList(row=row)
+        taskId      = self._taskTable.taskId(row=row)
+
+        with taskList.lock():
+            if (kind == RESTORE_TASK) != self._taskTable.rowRemoved(row=row):
+                return None
+
+            if kind == SET_DONE:
+                inverse     = (SET_DONE, row, int(bool(self._taskTable.taskDone(row=row))), self._taskTable.completedAt(row=row))
+                taskDone    = TaskDone(taskDoneBooleanValue=bool(entry[2]))
+                completedAt = entry[3]
+                taskList.setDone(row=row, taskDone=taskDone, completedAt=completedAt)
+                self._storage.recordTaskDone(taskId=taskId, taskDone=taskDone, completedAt=completedAt)
+                return inverse
+
+            if kind == REMOVE_TASK:
+                taskList.removeTask(row=row)
+                self._storage.recordRemoveTask(taskId=taskId)
+                return (RESTORE_TASK, row)
+
+            taskList.restoreTask(row=row)
+            self._storage.recordRecords(records=[self._taskTable.record(row=row, projectName=taskList.projectName())])
+            return (REMOVE_TASK, row)
+
+    def _applyUndoEntries(self, entry:Tuple[int, ...], popEntry:Callable[[], Tuple[int, ...]], pushInverse:Callable[[Tuple[int, ...]], None]) -> None:
+        entries = [entry]
+        if entry[0] == GROUP:
+            entries = [popEntry() for _ in range(entry[1])]
+
+        inverseCount = 0
+        for groupedEntry in entries:
+            if groupedEntry is None:
+                break
+            inverse = self._applyUndoEntry(entry=groupedEntry)
+            if inverse is not None:
+                pushInverse(inverse)
+                inverseCount += 1
+
+        if entry[0] == GROUP:
+            pushInverse((GROUP, inverseCount))
+        self._storage.compactIfNeeded(programDatas=self)
+
+    def undo(self, console:Console) -> None:
+        entry = self._undoLog.popUndo()
+        if entry is None:
+            console.print(output=ConsoleOuput(outputStr="Nothing to undo."))
+            return None
 
-        if len(commandLineSplited) > 1:
-            self._commandRest = self._command.createCommandRest(commandRestStr=commandLineSplited[1])
+        self._applyUndoEntries(entry=entry, popEntry=self._undoLog.popUndo, pushInverse=self._undoLog.pushRedo)
 
-    def execute(self, programDatas:ProgramDatas, console:Console) -> None:
-        self._command.execute(commandRest=self._commandRest, programDatas=programDatas, console=console)
+    def redo(self, console:Console) -> None:
+        entry = self._undoLog.popRedo()
+        if entry is None:
+            console.print(output=ConsoleOuput(outputStr="Nothing to redo."))
+            return None
 
-    def loopContinue(self) -> LoopContinue:
-        return self._command.loopContinue()
+        self._applyUndoEntries(entry=entry, popEntry=self._undoLog.popRedo, pushInverse=self._undoLog.pushUndo)
 
 class ProgramLoop:
 
     _console        :Console
     _programDatas   :ProgramDatas
 
-    def __init__(self, console: Console) -> None:
+    def __init__(self, console: Console, programDatas:ProgramDatas = None) -> None:
 
         self._console       = console
-        self._programDatas  = ProgramDatas()
+        self._programDatas  = programDatas
+        if self._programDatas is None:
+            self._programDatas = ProgramDatas()
+
+    def _runInstrumented(self, commandLineStr:str, instrumentation:Instrumentation) -> LoopContinue:
+        allocatedBlocks = sys.getallocatedblocks()
+        started         = time.perf_counter_ns()
+        commandLine     = CommandLine(commandLineStr=commandLineStr)
+        parsed          = time.perf_counter_ns()
+        commandLine.execute(programDatas=self._programDatas, console=self._console)
+        executed        = time.perf_counter_ns()
+
+        instrumentation.record(
+            commandName=commandLine.commandName(),
+            parseNs=parsed - started,
+            executeNs=executed - parsed,
+            allocatedBlocks=sys.getallocatedblocks() - allocatedBlocks)
+        profileError = instrumentation.popProfileError()
+        if profileError is not None:
+            self._console.print(output=ConsoleOuput(outputStr=profileError))
+        return commandLine.loopContinue()
 
     def run(self) -> None:
         
-        loopContinue = LoopContinue()
+        instrumentation = self._programDatas.instrumentation()
+        loopContinue    = LoopContinue()
         while loopContinue == LoopContinue(loopContinueBooleanValue=True):
 
             commandLineStr  = self._console.inputPrompt()
+            if commandLineStr == "":
+                break
+
+            if instrumentation is not None:
+                loopContinue = self._runInstrumented(commandLineStr=commandLineStr, instrumentation=instrumentation)
+                continue
+
             commandLine     = CommandLine(commandLineStr=commandLineStr)
 
             loopContinue = commandLine.loopContinue()
 
-            commandLine.execute(programDatas=self._programDatas, console=self._console)
\ No newline at end of file
+            commandLine.execute(programDatas=self._programDatas, console=self._console)
+
+        self._console.flush()
+        self._programDatas.close()
@@ -0,0 +1,458 @@
+from typing import Dict, Iterator, List, Type, Union
+
+from completionIndex import startOfDay
+from console import Console
+from descriptionIndex import parseSearchTerms
+from primitiveWrapper import ConsoleOuput, LoopContinue, ProjectName, TaskDescription, TaskDone, TaskId
+
+class Command:
+
+    ARGUMENT_COUNT  :int    = 0
+    READ_ONLY       :bool   = False
+
+    _filePath       :str    = None
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        pass
+
+    def filePath(self) -> str:
+        return self._filePath
+
+    def outputChunks(self, programDatas:'ProgramDatas') -> Iterator[str]:
+        return None
+
+    def loopContinue(self) -> LoopContinue:
+        return LoopContinue(loopContinueBooleanValue=True)
+
+    @classmethod
+    def parse(cls, commandStr:str, arguments:List[str]) -> 'Command':
+        if len(arguments) < cls.ARGUMENT_COUNT:
+            return ErrorCommand(commandStr=commandStr)
+        return cls.create(arguments=arguments)
+
+    @classmethod
+    def create(cls, arguments:List[str]) -> 'Command':
+        return cls()
+
+class ErrorCommand(Command):
+
+    READ_ONLY = True
+
+    _commandStr:str
+
+    def __init__(self, commandStr:str) -> None:
+        self._commandStr = commandStr
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        outputStr = f"I don't know what the command {self._commandStr} is."
+        console.print(output=ConsoleOuput(outputStr=outputStr))
+
+class ShowCommand(Command):
+
+    PAGE_SIZE   :int    = 50
+    READ_ONLY   :bool   = True
+
+    _projectName    :ProjectName
+    _offset         :int
+    _limit          :int
+
+    def __init__(self, projectName:ProjectName=None, offset:int=0, limit:int=None) -> None:
+        self._projectName   = projectName
+        self._offset        = offset
+        self._limit         = limit
+
+    @classmethod
+    def parse(cls, commandStr:str, arguments:List[str]) -> Command:
+        if len(arguments) == 0:
+            return cls()
+        if len(arguments) > 3 or not all(argument.isdigit() for argument in arguments[1:]):
+            return ErrorCommand(commandStr=commandStr)
+
+        projectName = ProjectName(projetNameStr=arguments[0])
+        if len(arguments) == 1:
+            return cls(projectName=projectName)
+        limit = int(arguments[2]) if len(arguments) == 3 else cls.PAGE_SIZE
+        if limit == 0:
+            return ErrorCommand(commandStr=commandStr)
+        return cls(projectName=projectName, offset=int(arguments[1]), limit=limit)
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        console.writeChunks(chunks=self.outputChunks(programDatas=programDatas))
+
+    def outputChunks(self, programDatas:'ProgramDatas') -> Iterator[str]:
+        return programDatas.showChunks(projectName=self._projectName, offset=self._offset, limit=self._limit)
+
+class AddProjectCommand(Command):
+
+    ARGUMENT_COUNT = 1
+
+    _projectName:ProjectName
+
+    def __init__(self, projectName:ProjectName) -> None:
+        self._projectName = projectName
+
+    @classmethod
+    def create(cls, arguments:List[str]) -> Command:
+        return cls(projectName=ProjectName(projetNameStr=" ".join(arguments)))
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.addProject(projectName=self._projectName, console=console)
+
+class AddTaskCommand(Command):
+
+    ARGUMENT_COUNT = 2
+
+    _projectName    :ProjectName
+    _taskDescription:TaskDescription
+
+    def __init__(self, projectName:ProjectName, taskDescription:TaskDescription) -> None:
+        self._projectName       = projectName
+        self._taskDescription   = taskDescription
+
+    @classmethod
+    def create(cls, arguments:List[str]) -> Command:
+        return cls(projectName=ProjectName(projetNameStr=arguments[0]), taskDescription=TaskDescription(taskDescriptionStr=" ".join(arguments[1:])))
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.addTask(projectName=self._projectName, taskDescription=self._taskDescription, console=console)
+
+class SetDoneCommand(Command):
+
+    ARGUMENT_COUNT = 1
+
+    _taskIdRanges:List[range]
+
+    def __init__(self, taskIdRanges:List[range]) -> None:
+        self._taskIdRanges = taskIdRanges
+
+    @classmethod
+    def parse(cls, commandStr:str, arguments:List[str]) -> Command:
+        if len(arguments) != 1:
+            return ErrorCommand(commandStr=commandStr)
+
+        taskIdRanges = []
+        for part in arguments[0].split(","):
+            start, dash, end = part.partition("-")
+            if not dash:
+                end = start
+            if not start.isdigit() or not end.isdigit() or int(end) < int(start):
+                return ErrorCommand(commandStr=commandStr)
+            taskIdRanges.append(range(int(start), int(end) + 1))
+        return cls(taskIdRanges=taskIdRanges)
+
+    def _singleTaskId(self) -> TaskId:
+        if len(self._taskIdRanges) == 1 and len(self._taskIdRanges[0]) == 1:
+            return TaskId(taskIdInt=self._taskIdRanges[0].start)
+        return None
+
+class CheckCommand(SetDoneCommand):
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        taskId = self._singleTaskId()
+        if taskId is not None:
+            programDatas.checkTask(taskId=taskId, console=console)
+            return
+        programDatas.setTasksDone(taskIdRanges=self._taskIdRanges, taskDone=TaskDone(taskDoneBooleanValue=True), console=console)
+
+class UncheckCommand(SetDoneCommand):
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        taskId = self._singleTaskId()
+        if taskId is not None:
+            programDatas.uncheckTask(taskId=taskId, console=console)
+            return
+        programDatas.setTasksDone(taskIdRanges=self._taskIdRanges, taskDone=TaskDone(taskDoneBooleanValue=False), console=console)
+
+class ImportCommand(Command):
+
+    ARGUMENT_COUNT = 1
+
+    _filePath:str
+
+    def __init__(self, filePath:str) -> None:
+        self._filePath = filePath
+
+    @classmethod
+    def create(cls, arguments:List[str]) -> Command:
+        return cls(filePath=" ".join(arguments))
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.importFile(filePath=self._filePath, console=console)
+
+class ExportCommand(Command):
+
+    ARGUMENT_COUNT = 1
+    READ_ONLY      = True
+
+    _exportFormat   :str
+    _filePath       :str
+
+    def __init__(self, exportFormat:str, filePath:str=None) -> None:
+        self._exportFormat  = exportFormat
+        self._filePath      = filePath
+
+    @classmethod
+    def create(cls, arguments:List[str]) -> Command:
+        return cls(exportFormat=arguments[0], filePath=" ".join(arguments[1:]) or None)
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.exportTasks(exportFormat=self._exportFormat, filePath=self._filePath, console=console)
+
+class ListUndoneCommand(Command):
+
+    READ_ONLY = True
+
+    _projectName:ProjectName
+
+    def __init__(self, projectName:ProjectName=None) -> None:
+        self._projectName = projectName
+
+    @classmethod
+    def create(cls, arguments:List[str]) -> Command:
+        if len(arguments) == 0:
+            return cls()
+        return cls(projectName=ProjectName(projetNameStr=" ".join(arguments)))
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.listUndone(projectName=self._projectName, console=console)
+
+class ListProjectCommand(Command):
+
+    ARGUMENT_COUNT = 1
+    READ_ONLY      = True
+
+    _projectName:ProjectName
+
+    def __init__(self, projectName:ProjectName) -> None:
+        self._projectName = projectName
+
+    @classmethod
+    def create(cls, arguments:List[str]) -> Command:
+        return cls(projectName=ProjectName(projetNameStr=" ".join(arguments)))
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.listProject(projectName=self._projectName, console=console)
+
+class ListWordCommand(Command):
+
+    ARGUMENT_COUNT = 1
+    READ_ONLY      = True
+
+    _word:str
+
+    def __init__(self, word:str) -> None:
+        self._word = word
+
+    @classmethod
+    def create(cls, arguments:List[str]) -> Command:
+        return cls(word=" ".join(arguments))
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.listWord(word=self._word, console=console)
+
+class ListPrefixCommand(ListWordCommand):
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.listPrefix(prefix=self._word, console=console)
+
+class SearchCommand(Command):
+
+    ARGUMENT_COUNT = 1
+    READ_ONLY      = True
+
+    _tokens     :List[str]
+    _prefixes   :List[str]
+
+    def __init__(self, tokens:List[str], prefixes:List[str]) -> None:
+        self._tokens    = tokens
+        self._prefixes  = prefixes
+
+    @classmethod
+    def parse(cls, commandStr:str, arguments:List[str]) -> Command:
+        tokens, prefixes = parseSearchTerms(queryStr=" ".join(arguments))
+        if not tokens and not prefixes:
+            return ErrorCommand(commandStr=commandStr)
+        return cls(tokens=tokens, prefixes=prefixes)
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.search(tokens=self._tokens, prefixes=self._prefixes, console=console)
+
+class CompletedSinceCommand(Command):
+
+    ARGUMENT_COUNT = 1
+    READ_ONLY      = True
+
+    _since:int
+
+    def __init__(self, since:int) -> None:
+        self._since = since
+
+    @classmethod
+    def parse(cls, commandStr:str, arguments:List[str]) -> Command:
+        if len(arguments) != cls.ARGUMENT_COUNT:
+            return ErrorCommand(commandStr=commandStr)
+        try:
+            return cls(since=startOfDay(dayStr=arguments[0]))
+        except ValueError:
+            return ErrorCommand(commandStr=commandStr)
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.listCompletedSince(since=self._since, console=console)
+
+class CompletedCountCommand(Command):
+
+    READ_ONLY = True
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.printCompletedCounts(console=console)
+
+class StatsLatencyCommand(Command):
+
+    READ_ONLY = True
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.printLatencyStats(console=console)
+
+class StatsProgressCommand(Command):
+
+    READ_ONLY = True
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.printProgress(console=console)
+
+class StatsJsonCommand(Command):
+
+    READ_ONLY = True
+
+    _filePath:str
+
+    def __init__(self, filePath:str=None) -> None:
+        self._filePath = filePath
+
+    @classmethod
+    def create(cls, arguments:List[str]) -> Command:
+        return cls(filePath=" ".join(arguments) or None)
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.dumpLatencyStats(filePath=self._filePath, console=console)
+
+class StatsProfileCommand(Command):
+
+    ARGUMENT_COUNT = 2
+
+    _commandCount   :int
+    _filePath       :str
+
+    def __init__(self, commandCount:int, filePath:str) -> None:
+        self._commandCount  = commandCount
+        self._filePath      = filePath
+
+    @classmethod
+    def parse(cls, commandStr:str, arguments:List[str]) -> Command:
+        if len(arguments) < cls.ARGUMENT_COUNT or not arguments[0].isdigit():
+            return ErrorCommand(commandStr=commandStr)
+        return cls(commandCount=int(arguments[0]), filePath=" ".join(arguments[1:]))
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.profileCommands(commandCount=self._commandCount, filePath=self._filePath, console=console)
+
+class UndoCommand(Command):
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.undo(console=console)
+
+class RedoCommand(Command):
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        programDatas.redo(console=console)
+
+class HelpCommand(Command):
+
+    READ_ONLY = True
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        console.print(output=ConsoleOuput())
+
+class QuitCommand(Command):
+
+    def loopContinue(self) -> LoopContinue:
+        return LoopContinue(loopContinueBooleanValue=False)
+
+COMMAND_TABLE:Dict[str, Union[Type[Command], Dict[str, Type[Command]]]] = {
+    "show"      : ShowCommand,
+    "add"       : {
+        "project"   : AddProjectCommand,
+        "task"      : AddTaskCommand,
+    },
+    "check"     : CheckCommand,
+    "uncheck"   : UncheckCommand,
+    "undo"      : UndoCommand,
+    "redo"      : RedoCommand,
+    "list"      : {
+        "undone"    : ListUndoneCommand,
+        "project"   : ListProjectCommand,
+        "word"      : ListWordCommand,
+        "prefix"    : ListPrefixCommand,
+    },
+    "search"    : SearchCommand,
+    "completed" : {
+        "since"     : CompletedSinceCommand,
+        "count"     : CompletedCountCommand,
+    },
+    "stats"     : {
+        "latency"   : StatsLatencyCommand,
+        "json"      : StatsJsonCommand,
+        "profile"   : StatsProfileCommand,
+        "progress"  : StatsProgressCommand,
+    },
+    "import"    : ImportCommand,
+    "export"    : ExportCommand,
+    "help"      : HelpCommand,
+    "quit"      : QuitCommand,
+}
+
+MAX_SPLIT = max(
+    max(command.ARGUMENT_COUNT for command in entry.values()) + 1 if isinstance(entry, dict) else entry.ARGUMENT_COUNT
+    for entry in COMMAND_TABLE.values())
+
+class CommandLine:
+
+    _command    :Command
+    _commandName:str
+
+    def __init__(self, commandLineStr:str) -> None:
+
+        commandLineStr  = commandLineStr.strip()
+        tokens          = commandLineStr.split(" ", MAX_SPLIT)
+        entry           = COMMAND_TABLE.get(tokens[0])
+        argumentsStart  = 1
+
+        if isinstance(entry, dict):
+            entry           = entry.get(tokens[1]) if len(tokens) > 1 else None
+            argumentsStart  = 2
+
+        if entry is None:
+            self._command       = ErrorCommand(commandStr=tokens[0])
+            self._commandName   = "error"
+            return
+
+        self._command       = entry.parse(commandStr=commandLineStr, arguments=tokens[argumentsStart:])
+        self._commandName   = " ".join(tokens[:argumentsStart])
+
+    def commandName(self) -> str:
+        return self._commandName
+
+    def execute(self, programDatas:'ProgramDatas', console:Console) -> None:
+        self._command.execute(programDatas=programDatas, console=console)
+
+    def outputChunks(self, programDatas:'ProgramDatas') -> Iterator[str]:
+        return self._command.outputChunks(programDatas=programDatas)
+
+    def readOnly(self) -> bool:
+        return self._command.READ_ONLY
+
+    def filePath(self) -> str:
+        return self._command.filePath()
+
+    def loopContinue(self) -> LoopContinue:
+        return self._command.loopContinue()
@@ -0,0 +1,97 @@
+import time
+from array import array
+from bisect import bisect_left
+from operator import itemgetter
+from typing import Dict, List, Sequence
+
+DAY_FORMAT          = "%Y-%m-%d"
+MINUTE_FORMAT       = "%Y-%m-%d %H:%M"
+QUARTER_HOUR        = 15 * 60
+
+def dayOf(timestamp:int) -> str:
+    return time.strftime(DAY_FORMAT, time.localtime(timestamp))
+
+def minuteOf(timestamp:int) -> str:
+    return time.strftime(MINUTE_FORMAT, time.localtime(timestamp))
+
+def startOfDay(dayStr:str) -> int:
+    return int(time.mktime(time.strptime(dayStr, DAY_FORMAT)))
+
+class CompletionIndex:
+
+    __slots__ = ("_completedAt", "_times", "_rows", "_sorted", "_staleCount", "_countsByDay", "_dayByQuarterHour")
+
+    _completedAt        :Sequence[int]
+    _times              :array
+    _rows               :array
+    _sorted             :bool
+    _staleCount         :int
+    _countsByDay        :Dict[str, Dict[str, int]]
+    _dayByQuarterHour   :Dict[int, str]
+
+    def __init__(self, completedAt:Sequence[int]) -> None:
+        self._completedAt       = completedAt
+        self._times             = array("q")
+        self._rows              = array("q")
+        self._sorted            = True
+        self._staleCount        = 0
+        self._countsByDay       = {}
+        self._dayByQuarterHour  = {}
+
+    def _day(self, completedAt:int) -> str:
+        quarterHour = completedAt // QUARTER_HOUR
+        day         = self._dayByQuarterHour.get(quarterHour)
+        if day is None:
+            day = self._dayByQuarterHour[quarterHour] = dayOf(timestamp=completedAt)
+        return day
+
+    def addRow(self, row:int, completedAt:int, projectName:str) -> None:
+        if self._times and completedAt < self._times[-1]:
+            self._sorted = False
+        self._times.append(completedAt)
+        self._rows.append(row)
+
+        counts              = self._countsByDay.setdefault(self._day(completedAt=completedAt), {})
+        counts[projectName] = counts.get(projectName, 0) + 1
+
+    def addRows(self, rows:Sequence[int], completedAt:int, projectName:str) -> None:
+        if self._times and completedAt < self._times[-1]:
+            self._sorted = False
+        self._times.extend([completedAt] * len(rows))
+        self._rows.extend(rows)
+
+        counts              = self._countsByDay.setdefault(self._day(completedAt=completedAt), {})
+        counts[projectName] = counts.get(projectName, 0) + len(rows)
+
+    def discardRow(self, completedAt:int, projectName:str) -> None:
+        day                 = self._day(completedAt=completedAt)
+        counts              = self._countsByDay[day]
+        counts[projectName] -= 1
+        if counts[projectName] == 0:
+            del counts[projectName]
+            if not counts:
+                del self._countsByDay[day]
+        self._staleCount += 1
+
+    def _compact(self) -> None:
+        completedAt = self._completedAt
+        entries     = sorted(dict.fromkeys(entry for entry in zip(self._times, self._rows) if completedAt[entry[1]] == entry[0]), key=itemgetter(0))
+        self._times         = array("q", (completedTime for completedTime, _ in entries))
+        self._rows          = array("q", (row for _, row in entries))
+        self._sorted        = True
+        self._staleCount    = 0
+
+    def rowsSince(self, since:int) -> List[int]:
+        if not self._sorted or self._staleCount * 2 > len(self._times):
+            self._compact()
+
+        completedAt = self._completedAt
+        rows        = {}
+        for index in range(bisect_left(self._times, since), len(self._times)):
+            row = self._rows[index]
+            if completedAt[row] == self._times[index]:
+                rows[row] = None
+        return list(rows)
+
+    def countsByDay(self) -> Dict[str, Dict[str, int]]:
+        return self._countsByDay
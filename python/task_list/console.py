@@ -1,4 +1,5 @@
-from typing import IO
+from itertools import chain
+from typing import IO, Iterable, List
  
 from primitiveWrapper import ConsoleOuput
 
@@ -6,10 +7,12 @@ class Console:
 
     _input_reader   :IO
     _output_writer  :IO
+    _bufferSize     :int
 
-    def __init__(self, input_reader: IO, output_writer: IO) -> None:
+    def __init__(self, input_reader: IO, output_writer: IO, bufferSize:int = 64 * 1024) -> None:
         self._input_reader  = input_reader
         self._output_writer = output_writer
+        self._bufferSize    = bufferSize
 
     def _write(self, output:ConsoleOuput) -> None:
 
@@ -21,9 +24,51 @@ class Console:
         self._write(output=promptOutput)
 
     def print(self, output:ConsoleOuput) -> None:
-        output.addNewLine()
-        self._write(output=output)
+        self._output_writer.write(f"{output}")
+        self._write(output=ConsoleOuput(outputStr="\n"))
+
+    def writeChunks(self, chunks:Iterable[str]) -> None:
+        batch       :List[str]  = []
+        batchSize   :int        = 0
+
+        for chunk in chunks:
+            batch.append(chunk)
+            batchSize += len(chunk)
+            if batchSize >= self._bufferSize:
+                self._output_writer.write("".join(batch))
+                batch       = []
+                batchSize   = 0
+
+        self._write(output=ConsoleOuput(outputStr="".join(batch)))
+
+    def printChunks(self, chunks:Iterable[str]) -> None:
+        self.writeChunks(chunks=chain(chunks, ("\n",)))
 
     def inputPrompt(self) -> str:
         self._printPrompt()
-        return self._input_reader.readline()
\ No newline at end of file
+        return self._input_reader.readline()
+
+    def flush(self) -> None:
+        self._output_writer.flush()
+
+class BatchConsole(Console):
+
+    _flushEvery     :int
+    _commandCount   :int
+
+    def __init__(self, input_reader: IO, output_writer: IO, bufferSize:int = 64 * 1024, flushEvery:int = 1000) -> None:
+        super().__init__(input_reader=input_reader, output_writer=output_writer, bufferSize=bufferSize)
+        self._flushEvery    = flushEvery
+        self._commandCount  = 0
+
+    def _write(self, output:ConsoleOuput) -> None:
+        self._output_writer.write(f"{output}")
+
+    def inputPrompt(self) -> str:
+        if self._commandCount == self._flushEvery:
+            self.flush()
+            self._commandCount = 0
+
+        self._commandCount += 1
+        return self._input_reader.readline()
+
@@ -0,0 +1,107 @@
+import re
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+
+TOKEN_PATTERN       = re.compile(r"\w+")
+PREFIX_MARK         = "*"
+PROBED_TOKEN_LIMIT  = 16
+
+def tokenize(text:str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+def parseSearchTerms(queryStr:str) -> Tuple[List[str], List[str]]:
+    tokens      :List[str] = []
+    prefixes    :List[str] = []
+    for word in queryStr.split():
+        wordTokens = tokenize(text=word)
+        if word.endswith(PREFIX_MARK) and wordTokens:
+            prefixes.append(wordTokens.pop())
+        tokens.extend(wordTokens)
+    return tokens, prefixes
+
+def containsSorted(rows:Sequence[int], row:int) -> bool:
+    index = bisect_left(rows, row)
+    return index < len(rows) and rows[index] == row
+
+class DescriptionIndex:
+
+    __slots__ = ("_rowsByToken", "_tokens", "_tokensSorted")
+
+    _rowsByToken    :Dict[str, Union[int, array]]
+    _tokens         :List[str]
+    _tokensSorted   :bool
+
+    def __init__(self) -> None:
+        self._rowsByToken   = {}
+        self._tokens        = []
+        self._tokensSorted  = True
+
+    def addRow(self, row:int, description:str) -> None:
+        rowsByToken = self._rowsByToken
+        for token in set(tokenize(text=description)):
+            rows = rowsByToken.get(token)
+            if rows is None:
+                rowsByToken[token] = row
+                self._tokens.append(token)
+                self._tokensSorted = False
+            elif type(rows) is int:
+                rowsByToken[token] = array("q", (rows, row))
+            else:
+                rows.append(row)
+
+    def _postings(self, token:str) -> Sequence[int]:
+        rows = self._rowsByToken.get(token)
+        if rows is None:
+            return ()
+        if type(rows) is int:
+            return (rows,)
+        return rows
+
+    def rowsWithToken(self, token:str) -> Sequence[int]:
+        return self._postings(token=token.lower())
+
+    def tokensWithPrefix(self, prefix:str) -> Iterator[str]:
+        if not self._tokensSorted:
+            self._tokens.sort()
+            self._tokensSorted = True
+        prefix  = prefix.lower()
+        tokens  = self._tokens
+        index   = bisect_left(tokens, prefix)
+        while index < len(tokens) and tokens[index].startswith(prefix):
+            yield tokens[index]
+            index += 1
+
+    def _rowsWithTokens(self, tokens:List[str]) -> List[int]:
+        rows = set()
+        for token in tokens:
+            rows.update(self._postings(token=token))
+        return sorted(rows)
+
+    def _rowCount(self, tokens:List[str]) -> int:
+        return sum(len(self._postings(token=token)) for token in tokens)
+
+    def rowsWithPrefix(self, prefix:str) -> List[int]:
+        return self._rowsWithTokens(tokens=list(self.tokensWithPrefix(prefix=prefix)))
+
+    def rowsMatchingAll(self, tokens:List[str], prefixes:List[str]) -> List[int]:
+        tokenRows       = sorted((self.rowsWithToken(token=token) for token in tokens), key=len)
+        prefixTokens    = sorted((list(self.tokensWithPrefix(prefix=prefix)) for prefix in prefixes), key=self._rowCount)
+        if (tokenRows and len(tokenRows[0]) == 0) or (prefixTokens and not prefixTokens[0]):
+            return []
+
+        if tokenRows and (not prefixTokens or len(tokenRows[0]) <= self._rowCount(tokens=prefixTokens[0])):
+            rows = list(tokenRows.pop(0))
+        else:
+            rows = self._rowsWithTokens(tokens=prefixTokens.pop(0))
+
+        for otherRows in tokenRows:
+            rows = [row for row in rows if containsSorted(rows=otherRows, row=row)]
+        for otherTokens in prefixTokens:
+            if len(otherTokens) > PROBED_TOKEN_LIMIT:
+                otherRows   = set(self._rowsWithTokens(tokens=otherTokens))
+                rows        = [row for row in rows if row in otherRows]
+                continue
+            postings    = [self._postings(token=token) for token in otherTokens]
+            rows        = [row for row in rows if any(containsSorted(rows=otherRows, row=row) for otherRows in postings)]
+        return rows
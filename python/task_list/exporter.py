@@ -0,0 +1,36 @@
+import csv
+import json
+from typing import Iterable, Iterator
+
+from taskRow import TaskRow
+
+EXPORT_FORMATS  = ("csv", "jsonl")
+CSV_HEADER      = ("id", "project", "description", "done")
+
+class _LastLine:
+
+    __slots__ = ("line",)
+
+    line:str
+
+    def write(self, line:str) -> None:
+        self.line = line
+
+def csvLines(rows:Iterable[TaskRow]) -> Iterator[str]:
+    lastLine    = _LastLine()
+    writer      = csv.writer(lastLine, lineterminator="\n")
+
+    writer.writerow(CSV_HEADER)
+    yield lastLine.line
+    for row in rows:
+        writer.writerow((row.taskId, row.projectName, row.taskDescription, "true" if row.taskDone else "false"))
+        yield lastLine.line
+
+def jsonLinesLines(rows:Iterable[TaskRow]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps({"id": row.taskId, "project": row.projectName, "description": row.taskDescription, "done": row.taskDone}) + "\n"
+
+def exportLines(rows:Iterable[TaskRow], exportFormat:str) -> Iterator[str]:
+    if exportFormat == "csv":
+        return csvLines(rows=rows)
+    return jsonLinesLines(rows=rows)
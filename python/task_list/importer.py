@@ -0,0 +1,61 @@
+import csv
+import json
+from itertools import islice
+from typing import IO, Iterable, Iterator, List
+
+from taskRow import TaskRow
+
+TRUE_VALUES = {"1", "true", "x", "yes"}
+
+def _parseTaskId(value) -> int:
+    if value is None or value == "":
+        return None
+    return int(value)
+
+def _parseTaskDone(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in TRUE_VALUES
+
+def _parseTaskRow(fields, lineNumber:int) -> TaskRow:
+    if not isinstance(fields, dict):
+        raise ValueError(f"line {lineNumber}: expected an object with a project and a description")
+    for fieldName in ("project", "description"):
+        if not isinstance(fields.get(fieldName), str):
+            raise ValueError(f"line {lineNumber}: missing {fieldName}")
+    try:
+        taskId = _parseTaskId(fields.get("id"))
+    except (TypeError, ValueError):
+        raise ValueError(f"line {lineNumber}: invalid id {fields.get('id')!r}") from None
+    return TaskRow(
+        taskId=taskId,
+        projectName=fields["project"],
+        taskDescription=fields["description"],
+        taskDone=_parseTaskDone(fields.get("done", False)))
+
+def readCsvRows(csvFile:IO) -> Iterator[TaskRow]:
+    reader = csv.DictReader(csvFile)
+    for fields in reader:
+        yield _parseTaskRow(fields=fields, lineNumber=reader.line_num)
+
+def readJsonLinesRows(jsonLinesFile:IO) -> Iterator[TaskRow]:
+    for lineNumber, line in enumerate(jsonLinesFile, start=1):
+        if line.strip() == "":
+            continue
+        try:
+            fields = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"line {lineNumber}: {error.msg}") from None
+        yield _parseTaskRow(fields=fields, lineNumber=lineNumber)
+
+def readRows(taskFile:IO, filePath:str) -> Iterator[TaskRow]:
+    if filePath.endswith(".csv"):
+        return readCsvRows(csvFile=taskFile)
+    return readJsonLinesRows(jsonLinesFile=taskFile)
+
+def batches(rows:Iterable[TaskRow], batchSize:int) -> Iterator[List[TaskRow]]:
+    rows = iter(rows)
+    batch = list(islice(rows, batchSize))
+    while batch:
+        yield batch
+        batch = list(islice(rows, batchSize))
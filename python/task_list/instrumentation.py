@@ -0,0 +1,173 @@
+import cProfile
+import json
+import math
+import threading
+from typing import Dict, Iterable, Iterator
+
+BUCKETS_PER_OCTAVE  = 8
+PERCENTILES         = (50, 90, 99)
+
+class LatencyHistogram:
+
+    __slots__ = ("_bucketCounts", "_count")
+
+    _bucketCounts   :Dict[int, int]
+    _count          :int
+
+    def __init__(self) -> None:
+        self._bucketCounts  = {}
+        self._count         = 0
+
+    def add(self, nanoseconds:int) -> None:
+        bucket = int(math.log2(nanoseconds) * BUCKETS_PER_OCTAVE) if nanoseconds > 1 else 0
+        self._bucketCounts[bucket] = self._bucketCounts.get(bucket, 0) + 1
+        self._count += 1
+
+    def percentile(self, percent:int) -> int:
+        rank    = math.ceil(self._count * percent / 100)
+        seen    = 0
+        for bucket in sorted(self._bucketCounts):
+            seen += self._bucketCounts[bucket]
+            if seen >= rank:
+                return round(2 ** ((bucket + 1) / BUCKETS_PER_OCTAVE))
+        return 0
+
+    def merge(self, other:'LatencyHistogram') -> None:
+        for bucket, count in other._bucketCounts.items():
+            self._bucketCounts[bucket] = self._bucketCounts.get(bucket, 0) + count
+        self._count += other._count
+
+class PhaseStats:
+
+    __slots__ = ("_totalNs", "_histogram")
+
+    _totalNs    :int
+    _histogram  :LatencyHistogram
+
+    def __init__(self) -> None:
+        self._totalNs   = 0
+        self._histogram = LatencyHistogram()
+
+    def add(self, nanoseconds:int) -> None:
+        self._totalNs += nanoseconds
+        self._histogram.add(nanoseconds=nanoseconds)
+
+    def merge(self, other:'PhaseStats') -> None:
+        self._totalNs += other._totalNs
+        self._histogram.merge(other=other._histogram)
+
+    def report(self) -> Dict[str, int]:
+        report = {"totalNs": self._totalNs}
+        for percent in PERCENTILES:
+            report[f"p{percent}Ns"] = self._histogram.percentile(percent=percent)
+        return report
+
+class CommandStats:
+
+    __slots__ = ("_count", "_parse", "_execute", "_total", "_allocatedBlocks")
+
+    _count          :int
+    _parse          :PhaseStats
+    _execute        :PhaseStats
+    _total          :PhaseStats
+    _allocatedBlocks:int
+
+    def __init__(self) -> None:
+        self._count             = 0
+        self._parse             = PhaseStats()
+        self._execute           = PhaseStats()
+        self._total             = PhaseStats()
+        self._allocatedBlocks   = 0
+
+    def record(self, parseNs:int, executeNs:int, allocatedBlocks:int) -> None:
+        self._count             += 1
+        self._allocatedBlocks   += allocatedBlocks
+        self._parse.add(nanoseconds=parseNs)
+        self._execute.add(nanoseconds=executeNs)
+        self._total.add(nanoseconds=parseNs + executeNs)
+
+    def total(self) -> PhaseStats:
+        return self._total
+
+    def report(self) -> Dict:
+        return {
+            "count"             : self._count,
+            "parse"             : self._parse.report(),
+            "execute"           : self._execute.report(),
+            "total"             : self._total.report(),
+            "allocatedBlocks"   : self._allocatedBlocks,
+        }
+
+def _phaseLine(phase:Dict[str, int]) -> str:
+    percentiles = ", ".join(f"p{percent} {phase[f'p{percent}Ns'] / 1000:.1f}us" for percent in PERCENTILES)
+    return f"{phase['totalNs'] / 1000:.1f}us ({percentiles})"
+
+class Instrumentation:
+
+    _lock               :threading.Lock
+    _commandStats       :Dict[str, CommandStats]
+    _profile            :cProfile.Profile   = None
+    _profileRemaining   :int                = 0
+    _profileFilePath    :str                = None
+    _profileError       :str                = None
+
+    def __init__(self) -> None:
+        self._lock          = threading.Lock()
+        self._commandStats  = {}
+
+    def record(self, commandName:str, parseNs:int, executeNs:int, allocatedBlocks:int) -> None:
+        with self._lock:
+            commandStats = self._commandStats.get(commandName)
+            if commandStats is None:
+                commandStats = self._commandStats[commandName] = CommandStats()
+            commandStats.record(parseNs=parseNs, executeNs=executeNs, allocatedBlocks=allocatedBlocks)
+
+            if self._profile is not None:
+                self._profileRemaining -= 1
+                if self._profileRemaining <= 0:
+                    self._stopProfile()
+
+    def startProfile(self, commandCount:int, filePath:str) -> None:
+        with self._lock:
+            if self._profile is not None:
+                self._stopProfile()
+            self._profile           = cProfile.Profile()
+            self._profileRemaining  = commandCount + 1
+            self._profileFilePath   = filePath
+            self._profile.enable()
+
+    def _stopProfile(self) -> None:
+        self._profile.disable()
+        try:
+            self._profile.dump_stats(self._profileFilePath)
+        except OSError as error:
+            self._profileError = f"Could not write the profile to {self._profileFilePath}: {error}"
+        finally:
+            self._profile = None
+
+    def popProfileError(self) -> str:
+        with self._lock:
+            profileError, self._profileError = self._profileError, None
+            return profileError
+
+    def report(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {commandName: commandStats.report() for commandName, commandStats in self._commandStats.items()}
+
+    def totalReport(self, commandNames:Iterable[str]) -> Dict[str, int]:
+        total = PhaseStats()
+        with self._lock:
+            for commandName in commandNames:
+                commandStats = self._commandStats.get(commandName)
+                if commandStats is not None:
+                    total.merge(other=commandStats.total())
+        return total.report()
+
+    def reportLines(self) -> Iterator[str]:
+        for commandName, report in self.report().items():
+            yield (f"{commandName}: {report['count']} commands, parse {_phaseLine(phase=report['parse'])}, "
+                   f"execute {_phaseLine(phase=report['execute'])}, {report['allocatedBlocks']} blocks allocated\n")
+
+    def jsonLines(self) -> Iterator[str]:
+        yield json.dumps({"commands": self.report()})
+        yield "\n"
@@ -0,0 +1,493 @@
+import json
+import mmap
+import os
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+from typing import IO, Dict, List, Sequence, Tuple
+
+from taskTable import REMOVED_POSITION, TaskTable
+
+MAGIC                       = b"TASKMAP2"
+EMPTY_MAGIC                 = bytes(8)
+HEADER                      = struct.Struct("<8sqqq")
+INDEX_MAGIC                 = b"TASKIDX1"
+INDEX_HEADER                = struct.Struct("<8sqq")
+ROWS_MAGIC                  = b"TASKROW1"
+ROWS_HEADER                 = struct.Struct("<8sqq")
+RECORD                      = struct.Struct("<qqqqqiiB7x")
+ID_FIELD                    = (0, struct.Struct("<q"))
+DESCRIPTION_START_FIELD     = (8, struct.Struct("<q"))
+POSITION_FIELD              = (16, struct.Struct("<q"))
+CREATED_FIELD               = (24, struct.Struct("<q"))
+COMPLETED_FIELD             = (32, struct.Struct("<q"))
+DESCRIPTION_LENGTH_FIELD    = (40, struct.Struct("<i"))
+PROJECT_FIELD               = (44, struct.Struct("<i"))
+DONE_FIELD                  = (48, struct.Struct("<B"))
+INITIAL_CAPACITY            = 1024
+
+class MappedFormatError(ValueError):
+    pass
+
+class MappedFile:
+
+    _path       :str
+    _headerSize :int
+    _itemSize   :int
+    _file       :IO
+    _map        :mmap.mmap  = None
+    _capacity   :int
+
+    def __init__(self, path:str, headerSize:int, itemSize:int) -> None:
+        self._path          = path
+        self._headerSize    = headerSize
+        self._itemSize      = itemSize
+        if not os.path.exists(path):
+            with open(path, "wb") as newFile:
+                newFile.truncate(headerSize + itemSize * INITIAL_CAPACITY)
+        self._file = open(path, "r+b")
+        self._remap()
+
+    def _remap(self) -> None:
+        size            = os.fstat(self._file.fileno()).st_size
+        self._capacity  = (size - self._headerSize) // self._itemSize
+        self._map       = mmap.mmap(self._file.fileno(), size)
+
+    def buffer(self) -> mmap.mmap:
+        return self._map
+
+    def capacity(self) -> int:
+        return self._capacity
+
+    def ensureCapacity(self, itemCount:int) -> None:
+        if itemCount <= self._capacity:
+            return
+
+        capacity = max(self._capacity * 2, itemCount)
+        self._map.flush()
+        self._file.truncate(self._headerSize + self._itemSize * capacity)
+        self._remap()
+
+    def flush(self) -> None:
+        self._map.flush()
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+class MappedTaskFile:
+
+    RECORDS_FILE_NAME       = "tasks.bin"
+    DESCRIPTIONS_FILE_NAME  = "descriptions.bin"
+    PROJECTS_FILE_NAME      = "projects.jsonl"
+    INDEX_FILE_NAME         = "index.bin"
+    ROWS_FILE_NAME          = "rows.bin"
+
+    _directory      :str
+    _records        :MappedFile
+    _descriptions   :MappedFile
+    _projects       :IO
+    _projectNames   :List[str]
+    _projectNumbers :Dict[str, int]
+    _recordCount    :int
+    _nextTaskIdInt  :int
+    _descriptionSize:int
+    _lock           :threading.RLock
+
+    def __init__(self, directory:str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        recordsPath = os.path.join(directory, self.RECORDS_FILE_NAME)
+        if os.path.exists(recordsPath) and os.path.getsize(recordsPath) < HEADER.size:
+            raise MappedFormatError(f"{recordsPath} is too short to hold a task record header")
+
+        self._directory     = directory
+        self._records       = MappedFile(path=recordsPath, headerSize=HEADER.size, itemSize=RECORD.size)
+        self._descriptions  = MappedFile(path=os.path.join(directory, self.DESCRIPTIONS_FILE_NAME), headerSize=0, itemSize=1)
+        self._lock          = threading.RLock()
+
+        magic, self._recordCount, self._nextTaskIdInt, self._descriptionSize = HEADER.unpack_from(self._records.buffer(), 0)
+        if magic == EMPTY_MAGIC:
+            self._recordCount, self._nextTaskIdInt, self._descriptionSize = 0, 1, 0
+            self._writeHeader()
+        elif magic != MAGIC:
+            self._closeRecords()
+            raise MappedFormatError(f"{recordsPath} holds task records of an unknown format {magic!r}, expected {MAGIC!r}")
+        elif not 0 <= self._recordCount <= self._records.capacity() or not 0 <= self._descriptionSize <= self._descriptions.capacity():
+            self._closeRecords()
+            raise MappedFormatError(f"{recordsPath} counts {self._recordCount} records and {self._descriptionSize} description bytes, more than the files hold")
+
+        projectsPath        = os.path.join(directory, self.PROJECTS_FILE_NAME)
+        self._projectNames  = []
+        if os.path.exists(projectsPath):
+            with open(projectsPath, encoding="utf-8") as projects:
+                self._projectNames = [json.loads(line) for line in projects if line.endswith("\n")]
+        self._projectNumbers    = {projectName: number for number, projectName in enumerate(self._projectNames)}
+        self._projects          = open(projectsPath, "a", encoding="utf-8")
+
+    def _writeHeader(self) -> None:
+        HEADER.pack_into(self._records.buffer(), 0, MAGIC, self._recordCount, self._nextTaskIdInt, self._descriptionSize)
+
+    def __len__(self) -> int:
+        return self._recordCount
+
+    def indexPath(self) -> str:
+        return os.path.join(self._directory, self.INDEX_FILE_NAME)
+
+    def rowsPath(self) -> str:
+        return os.path.join(self._directory, self.ROWS_FILE_NAME)
+
+    def projectNames(self) -> List[str]:
+        return self._projectNames
+
+    def projectNumber(self, projectName:str) -> int:
+        return self._projectNumbers[projectName]
+
+    def addProject(self, projectName:str) -> None:
+        with self._lock:
+            if projectName in self._projectNumbers:
+                return
+            self._projectNumbers[projectName] = len(self._projectNames)
+            self._projectNames.append(projectName)
+            self._projects.write(json.dumps(projectName) + "\n")
+            self._projects.flush()
+
+    def nextTaskIdInt(self) -> int:
+        return self._nextTaskIdInt
+
+    def setNextTaskIdInt(self, nextTaskIdInt:int) -> None:
+        with self._lock:
+            self._nextTaskIdInt = nextTaskIdInt
+            self._writeHeader()
+
+    def appendRecord(self, taskIdInt:int, taskDone:bool, description:str, projectNumber:int, position:int, createdAt:int, completedAt:int) -> None:
+        with self._lock:
+            descriptionBytes = description.encode("utf-8")
+            self._descriptions.ensureCapacity(itemCount=self._descriptionSize + len(descriptionBytes))
+            self._descriptions.buffer()[self._descriptionSize:self._descriptionSize + len(descriptionBytes)] = descriptionBytes
+
+            self._records.ensureCapacity(itemCount=self._recordCount + 1)
+            RECORD.pack_into(
+                self._records.buffer(), HEADER.size + self._recordCount * RECORD.size,
+                taskIdInt, self._descriptionSize, position, createdAt, completedAt, len(descriptionBytes), projectNumber, taskDone)
+
+            self._descriptionSize   += len(descriptionBytes)
+            self._recordCount       += 1
+            self._writeHeader()
+
+    def readField(self, row:int, field:Tuple[int, struct.Struct]) -> int:
+        return field[1].unpack_from(self._records.buffer(), HEADER.size + row * RECORD.size + field[0])[0]
+
+    def writeField(self, row:int, field:Tuple[int, struct.Struct], value:int) -> None:
+        field[1].pack_into(self._records.buffer(), HEADER.size + row * RECORD.size + field[0], value)
+
+    def description(self, row:int) -> str:
+        start = self.readField(row=row, field=DESCRIPTION_START_FIELD)
+        return self._descriptions.buffer()[start:start + self.readField(row=row, field=DESCRIPTION_LENGTH_FIELD)].decode("utf-8")
+
+    def flush(self) -> None:
+        with self._lock:
+            self._records.flush()
+            self._descriptions.flush()
+
+    def _closeRecords(self) -> None:
+        self._records.close()
+        self._descriptions.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closeRecords()
+            self._projects.close()
+
+class MappedField:
+
+    __slots__ = ("_taskFile", "_field")
+
+    _taskFile   :MappedTaskFile
+    _field      :Tuple[int, struct.Struct]
+
+    def __init__(self, taskFile:MappedTaskFile, field:Tuple[int, struct.Struct]) -> None:
+        self._taskFile  = taskFile
+        self._field     = field
+
+    def __len__(self) -> int:
+        return len(self._taskFile)
+
+    def __getitem__(self, row:int) -> int:
+        return self._taskFile.readField(row=row, field=self._field)
+
+    def __setitem__(self, row:int, value:int) -> None:
+        self._taskFile.writeField(row=row, field=self._field, value=value)
+
+class MappedDescriptions:
+
+    __slots__ = ("_taskFile",)
+
+    _taskFile:MappedTaskFile
+
+    def __init__(self, taskFile:MappedTaskFile) -> None:
+        self._taskFile = taskFile
+
+    def __getitem__(self, row:int) -> str:
+        return self._taskFile.description(row=row)
+
+class MappedTaskLists:
+
+    __slots__ = ("_projectNumbers", "_taskListsByNumber")
+
+    _projectNumbers     :MappedField
+    _taskListsByNumber  :Dict[int, 'TaskList']
+
+    def __init__(self, projectNumbers:MappedField) -> None:
+        self._projectNumbers    = projectNumbers
+        self._taskListsByNumber = {}
+
+    def __getitem__(self, row:int) -> 'TaskList':
+        return self._taskListsByNumber[self._projectNumbers[row]]
+
+    def register(self, projectNumber:int, taskList:'TaskList') -> None:
+        self._taskListsByNumber[projectNumber] = taskList
+
+class MappedRowIndex:
+
+    __slots__ = ("_positions", "_sortedIds", "_sortedRows", "_overflow", "_savedRecordCount", "_indexFile", "_indexMap", "_indexView")
+
+    _positions          :MappedField
+    _sortedIds          :Sequence[int]
+    _sortedRows         :Sequence[int]
+    _overflow           :Dict[int, int]
+    _savedRecordCount   :int
+    _indexFile          :IO
+    _indexMap           :mmap.mmap
+    _indexView          :memoryview
+
+    def __init__(self, ids:MappedField, positions:MappedField, indexPath:str) -> None:
+        self._positions = positions
+        self._overflow  = {}
+        self._indexFile = None
+        if self._map(indexPath=indexPath, recordCount=len(ids)):
+            for row in range(self._savedRecordCount, len(ids)):
+                self[ids[row]] = row
+            return
+
+        rows                    = sorted(range(len(ids)), key=ids.__getitem__)
+        self._sortedIds         = array("q", (ids[row] for row in rows))
+        self._sortedRows        = array("q", rows)
+        self._savedRecordCount  = None
+
+    def _map(self, indexPath:str, recordCount:int) -> bool:
+        if not os.path.exists(indexPath) or os.path.getsize(indexPath) < INDEX_HEADER.size:
+            return False
+
+        indexFile   = open(indexPath, "rb")
+        indexMap    = mmap.mmap(indexFile.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, savedRecordCount, entryCount = INDEX_HEADER.unpack_from(indexMap, 0)
+        if magic != INDEX_MAGIC or savedRecordCount > recordCount or len(indexMap) != INDEX_HEADER.size + 16 * entryCount:
+            indexMap.close()
+            indexFile.close()
+            return False
+
+        self._indexFile         = indexFile
+        self._indexMap          = indexMap
+        self._indexView         = memoryview(indexMap)[INDEX_HEADER.size:].cast("q")
+        self._sortedIds         = self._indexView[:entryCount]
+        self._sortedRows        = self._indexView[entryCount:]
+        self._savedRecordCount  = savedRecordCount
+        return True
+
+    def _unmap(self) -> None:
+        if self._indexFile is None:
+            return
+        self._sortedIds     = array("q", self._sortedIds)
+        self._sortedRows    = array("q", self._sortedRows)
+        self._indexView.release()
+        self._indexMap.close()
+        self._indexFile.close()
+        self._indexFile = None
+
+    def close(self, indexPath:str, recordCount:int) -> None:
+        if self._savedRecordCount == recordCount:
+            self._unmap()
+            return
+
+        rowById = dict(zip(self._sortedIds, self._sortedRows))
+        rowById.update(self._overflow)
+        self._unmap()
+        taskIdInts          = sorted(rowById)
+        self._sortedIds     = array("q", taskIdInts)
+        self._sortedRows    = array("q", (rowById[taskIdInt] for taskIdInt in taskIdInts))
+        self._overflow      = {}
+
+        temporaryPath = indexPath + ".tmp"
+        with open(temporaryPath, "wb") as indexFile:
+            indexFile.write(INDEX_HEADER.pack(INDEX_MAGIC, recordCount, len(self._sortedIds)))
+            self._sortedIds.tofile(indexFile)
+            self._sortedRows.tofile(indexFile)
+        os.replace(temporaryPath, indexPath)
+        self._savedRecordCount = recordCount
+
+    def _find(self, taskIdInt:int) -> int:
+        row = self._overflow.get(taskIdInt)
+        if row is not None:
+            return row
+        index = bisect_left(self._sortedIds, taskIdInt)
+        if index < len(self._sortedIds) and self._sortedIds[index] == taskIdInt:
+            return self._sortedRows[index]
+        return None
+
+    def get(self, taskIdInt:int, default:int = None) -> int:
+        row = self._find(taskIdInt=taskIdInt)
+        if row is None or self._positions[row] == REMOVED_POSITION:
+            return default
+        return row
+
+    def __contains__(self, taskIdInt:int) -> bool:
+        return self.get(taskIdInt=taskIdInt) is not None
+
+    def __getitem__(self, taskIdInt:int) -> int:
+        row = self.get(taskIdInt=taskIdInt)
+        if row is None:
+            raise KeyError(taskIdInt)
+        return row
+
+    def __setitem__(self, taskIdInt:int, row:int) -> None:
+        if self._find(taskIdInt=taskIdInt) == row:
+            return
+        if self._indexFile is None and (not self._sortedIds or self._sortedIds[-1] < taskIdInt):
+            self._sortedIds.append(taskIdInt)
+            self._sortedRows.append(row)
+        else:
+            self._overflow[taskIdInt] = row
+
+    def __delitem__(self, taskIdInt:int) -> None:
+        if taskIdInt not in self:
+            raise KeyError(taskIdInt)
+
+class MappedProjectRows:
+
+    __slots__ = ("_taskFile", "_projectNumbers", "_positions", "_savedRecordCount", "_spans", "_appendedRows")
+
+    _taskFile           :MappedTaskFile
+    _projectNumbers     :MappedField
+    _positions          :MappedField
+    _savedRecordCount   :int
+    _spans              :array
+    _appendedRows       :Dict[int, List[int]]
+
+    def __init__(self, taskFile:MappedTaskFile, positions:MappedField) -> None:
+        self._taskFile          = taskFile
+        self._projectNumbers    = MappedField(taskFile=taskFile, field=PROJECT_FIELD)
+        self._positions         = positions
+        self._savedRecordCount  = 0
+        self._spans             = array("q")
+        self._read()
+        self._appendedRows      = self._rowsSince(recordCount=self._savedRecordCount)
+
+    def _read(self) -> None:
+        rowsPath = self._taskFile.rowsPath()
+        if not os.path.exists(rowsPath) or os.path.getsize(rowsPath) < ROWS_HEADER.size:
+            return
+
+        with open(rowsPath, "rb") as rowsFile:
+            magic, savedRecordCount, projectCount = ROWS_HEADER.unpack(rowsFile.read(ROWS_HEADER.size))
+            if magic != ROWS_MAGIC or savedRecordCount > len(self._taskFile) or os.path.getsize(rowsPath) != ROWS_HEADER.size + 16 * projectCount + 8 * savedRecordCount:
+                return
+            self._spans.fromfile(rowsFile, 2 * projectCount)
+        self._savedRecordCount = savedRecordCount
+
+    def _rowsSince(self, recordCount:int) -> Dict[int, List[int]]:
+        rowsByProject :Dict[int, List[int]] = {}
+        for row in range(recordCount, len(self._taskFile)):
+            rowsByProject.setdefault(self._projectNumbers[row], []).append(row)
+        return rowsByProject
+
+    def _savedRows(self, projectNumber:int) -> array:
+        rows = array("q")
+        if 2 * projectNumber >= len(self._spans):
+            return rows
+
+        start, count = self._spans[2 * projectNumber], self._spans[2 * projectNumber + 1]
+        with open(self._taskFile.rowsPath(), "rb") as rowsFile:
+            rowsFile.seek(ROWS_HEADER.size + 8 * len(self._spans) + 8 * start)
+            rows.fromfile(rowsFile, count)
+        return rows
+
+    def rows(self, projectNumber:int) -> List[int]:
+        rows :List[int] = []
+        for row in self._savedRows(projectNumber=projectNumber).tolist() + self._appendedRows.get(projectNumber, []):
+            position = self._positions[row]
+            if position == REMOVED_POSITION:
+                continue
+            if position >= len(rows):
+                rows.extend([REMOVED_POSITION] * (position + 1 - len(rows)))
+            rows[position] = row
+        return [row for row in rows if row != REMOVED_POSITION]
+
+    def save(self) -> None:
+        recordCount = len(self._taskFile)
+        if self._savedRecordCount == recordCount and os.path.exists(self._taskFile.rowsPath()):
+            return
+
+        appendedRows    = self._rowsSince(recordCount=self._savedRecordCount)
+        projectCount    = len(self._taskFile.projectNames())
+        spans           = array("q")
+        start           = 0
+        for projectNumber in range(projectCount):
+            count = (self._spans[2 * projectNumber + 1] if 2 * projectNumber < len(self._spans) else 0) + len(appendedRows.get(projectNumber, []))
+            spans.extend((start, count))
+            start += count
+
+        rowsPath        = self._taskFile.rowsPath()
+        temporaryPath   = rowsPath + ".tmp"
+        with open(temporaryPath, "wb") as rowsFile:
+            rowsFile.write(ROWS_HEADER.pack(ROWS_MAGIC, recordCount, projectCount))
+            spans.tofile(rowsFile)
+            for projectNumber in range(projectCount):
+                self._savedRows(projectNumber=projectNumber).tofile(rowsFile)
+                array("q", appendedRows.get(projectNumber, [])).tofile(rowsFile)
+        os.replace(temporaryPath, rowsPath)
+        self._savedRecordCount  = recordCount
+        self._spans             = spans
+        self._appendedRows      = {}
+
+class MappedTaskTable(TaskTable):
+
+    __slots__ = ("_taskFile", "_projectRows")
+
+    CACHES_LINES:bool = False
+
+    _taskFile       :MappedTaskFile
+    _projectRows    :MappedProjectRows
+
+    def __init__(self, taskFile:MappedTaskFile) -> None:
+        self._taskFile          = taskFile
+        self._ids               = MappedField(taskFile=taskFile, field=ID_FIELD)
+        self._done              = MappedField(taskFile=taskFile, field=DONE_FIELD)
+        self._descriptions      = MappedDescriptions(taskFile=taskFile)
+        self._taskLists         = MappedTaskLists(projectNumbers=MappedField(taskFile=taskFile, field=PROJECT_FIELD))
+        self._positions         = MappedField(taskFile=taskFile, field=POSITION_FIELD)
+        self._created           = MappedField(taskFile=taskFile, field=CREATED_FIELD)
+        self._completed         = MappedField(taskFile=taskFile, field=COMPLETED_FIELD)
+        self._rowById           = MappedRowIndex(ids=self._ids, positions=self._positions, indexPath=taskFile.indexPath())
+        self._projectRows       = MappedProjectRows(taskFile=taskFile, positions=self._positions)
+        self._descriptionIndex  = None
+        self._completionIndex   = None
+        self._lock              = threading.Lock()
+
+    def _appendRow(self, taskIdInt:int, taskDone:bool, description:str, taskList:'TaskList', position:int, createdAt:int, completedAt:int) -> None:
+        projectNumber = self._taskFile.projectNumber(projectName=str(taskList.projectName()))
+        self._taskLists.register(projectNumber=projectNumber, taskList=taskList)
+        self._taskFile.appendRecord(
+            taskIdInt=taskIdInt, taskDone=taskDone, description=description, projectNumber=projectNumber, position=position,
+            createdAt=createdAt, completedAt=completedAt)
+
+    def projectRows(self, projectNumber:int) -> List[int]:
+        return self._projectRows.rows(projectNumber=projectNumber)
+
+    def attachTaskList(self, taskList:'TaskList') -> None:
+        self._taskLists.register(projectNumber=self._taskFile.projectNumber(projectName=str(taskList.projectName())), taskList=taskList)
+
+    def saveIndex(self) -> None:
+        with self._lock:
+            self._rowById.close(indexPath=self._taskFile.indexPath(), recordCount=len(self._taskFile))
+            self._projectRows.save()
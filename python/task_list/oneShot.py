@@ -0,0 +1,47 @@
+import time
+from typing import List
+
+from command import CommandLine
+from console import Console
+from mappedTable import MappedTaskFile, MappedTaskTable
+from primitiveWrapper import ConsoleOuput, TaskDone, TaskId
+from taskTable import missingTaskIdsOutputStr
+
+IN_PLACE_COMMANDS = ("check", "uncheck")
+
+class MappedDoneWriter:
+
+    _taskFile   :MappedTaskFile
+    _taskTable  :MappedTaskTable
+
+    def __init__(self, directory:str) -> None:
+        self._taskFile  = MappedTaskFile(directory=directory)
+        self._taskTable = MappedTaskTable(taskFile=self._taskFile)
+
+    def setTasksDone(self, taskIdRanges:List[range], taskDone:TaskDone, console:Console) -> None:
+        rows, missingRanges = self._taskTable.rowsInIdRanges(taskIdRanges=taskIdRanges, nextTaskIdInt=self._taskFile.nextTaskIdInt())
+        if missingRanges:
+            console.print(output=ConsoleOuput(outputStr=missingTaskIdsOutputStr(missingRanges=missingRanges)))
+        self._taskTable.setDoneRows(rows=rows, taskDone=taskDone, completedAt=int(time.time()))
+
+    def checkTask(self, taskId:TaskId, console:Console) -> None:
+        self.setTasksDone(taskIdRanges=[range(int(taskId), int(taskId) + 1)], taskDone=TaskDone(taskDoneBooleanValue=True), console=console)
+
+    def uncheckTask(self, taskId:TaskId, console:Console) -> None:
+        self.setTasksDone(taskIdRanges=[range(int(taskId), int(taskId) + 1)], taskDone=TaskDone(taskDoneBooleanValue=False), console=console)
+
+    def close(self) -> None:
+        self._taskTable.saveIndex()
+        self._taskFile.flush()
+        self._taskFile.close()
+
+def runsInPlace(commandLineStr:str) -> bool:
+    return commandLineStr.strip().split(" ", 1)[0] in IN_PLACE_COMMANDS
+
+def runInPlace(commandLineStr:str, directory:str, console:Console) -> None:
+    writer = MappedDoneWriter(directory=directory)
+    try:
+        CommandLine(commandLineStr=commandLineStr).execute(programDatas=writer, console=console)
+    finally:
+        writer.close()
+    console.flush()
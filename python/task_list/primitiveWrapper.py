@@ -1,9 +1,7 @@
-from typing import List
-
-from copy import deepcopy
-
 class ConsoleOuput:
 
+    __slots__ = ("_outputStr",)
+
     _outputStr:str
 
     def __init__(self, outputStr:str = None) -> None:
@@ -12,21 +10,35 @@ class ConsoleOuput:
         if self._outputStr is None:
             self._outputStr = "\n".join([
                 "Commands:",
-                "  show",
+                "  show [project name [offset [limit]]]",
                 "  add project <project name>",
                 "  add task <project name> <task description>",
-                "  check <task ID>",
-                "  uncheck <task ID>"
+                "  check <task IDs, e.g. 1-500,702>",
+                "  uncheck <task IDs, e.g. 1-500,702>",
+                "  undo",
+                "  redo",
+                "  list undone [project name]",
+                "  list project <project name>",
+                "  list word <word>",
+                "  list prefix <prefix>",
+                "  search <words, prefix*>",
+                "  completed since <YYYY-MM-DD>",
+                "  completed count",
+                "  import <file.csv|file.jsonl>",
+                "  export <csv|jsonl> [file]",
+                "  stats latency",
+                "  stats json [file]",
+                "  stats profile <command count> <file>",
+                "  stats progress"
             ])
 
     def __str__(self) -> str:
         return self._outputStr
 
-    def addNewLine(self) -> None:
-        self._outputStr += "\n"
-
 class ProjectName:
 
+    __slots__ = ("_value",)
+
     _value:str
 
     def __init__(self, projetNameStr:str) -> None:
@@ -38,8 +50,13 @@ class ProjectName:
     def __eq__(self, otherProjectName: object) -> bool:
         return self._value == otherProjectName._value
 
+    def __hash__(self) -> int:
+        return hash(self._value)
+
 class ProjectFounded:
 
+    __slots__ = ("_value",)
+
     _value:bool
 
     def __init__(self, projectFoundedBooleanValue:bool = False) -> None:
@@ -50,6 +67,8 @@ class ProjectFounded:
 
 class TaskId:
 
+    __slots__ = ("_value",)
+
     _value:int
 
     def __init__(self, taskIdInt:int=0) -> None:
@@ -58,19 +77,22 @@ class TaskId:
     def __str__(self) -> str:
         return str(self._value)
 
+    def __int__(self) -> int:
+        return self._value
+
     def __eq__(self, otherTaskId: object) -> bool:
         return self._value == otherTaskId._value
 
-    def _valuePlusOne(self) -> None:
-        self._value += 1
+    def __hash__(self) -> int:
+        return hash(self._value)
 
     def nextOne(self) -> 'TaskId':
-        nextTaskId = deepcopy(self)
-        nextTaskId._valuePlusOne()
-        return nextTaskId
+        return TaskId(taskIdInt=self._value + 1)
 
 class TaskDescription:
 
+    __slots__ = ("_value",)
+
     _value:str
 
     def __init__(self, taskDescriptionStr:str) -> None:
@@ -81,11 +103,16 @@ class TaskDescription:
 
 class TaskDone:
 
+    __slots__ = ("_value",)
+
     _value:bool
 
     def __init__(self, taskDoneBooleanValue:bool = False) -> None:
         self._value = taskDoneBooleanValue
 
+    def __bool__(self) -> bool:
+        return self._value
+
     def __str__(self) -> str:
         if self._value:
             return "[x]"
@@ -93,6 +120,8 @@ class TaskDone:
 
 class TaskFounded:
 
+    __slots__ = ("_value",)
+
     _value:bool
 
     def __init__(self, taskFoundedBooleanValue:bool = False) -> None:
@@ -101,57 +130,10 @@ class TaskFounded:
     def __eq__(self, otherTaskFounded: object) -> bool:
         return self._value == otherTaskFounded._value
 
-class SubCommandType:
-
-    _expectedValue = ["project", "task"]
-    _value: str
-
-    def __init__(self, subCommandStr:str) -> None:
-        self._value = subCommandStr
-
-    def isProject(self) -> bool:
-        return self._value == "project"
-
-    def isTask(self) -> bool:
-        return self._value == "task"
-
-    def isError(self) -> bool:
-        return self._value not in self._expectedValue
-
-class CommandType:
-
-    _expectedValue:List[str] = ["show", "add", "check", "uncheck", "help", "quit"]
-    _value:str
-
-    def __init__(self, commandStr:str) -> None:
-        self._value = commandStr
-
-    def __str__(self) -> str:
-        return self._value
-
-    def isShow(self) -> bool:
-        return self._value == "show"
-
-    def isAdd(self) -> bool:
-        return self._value == "add"
-
-    def isCheck(self) -> bool:
-        return self._value == "check"
-
-    def isUncheck(self) -> bool:
-        return self._value == "uncheck"
-
-    def isHelp(self) -> bool:
-        return self._value == "help"
-
-    def isQuit(self) -> bool:
-        return self._value == "quit"
-
-    def isError(self) -> bool:
-        return self._value not in self._expectedValue
-
 class LoopContinue:
 
+    __slots__ = ("_value",)
+
     _value:bool
 
     def __init__(self, loopContinueBooleanValue:bool = True) -> None:
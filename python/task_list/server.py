@@ -0,0 +1,180 @@
+import asyncio
+import sys
+import time
+from typing import List
+
+from app import CommandLine, ProgramDatas
+from console import Console
+from primitiveWrapper import ConsoleOuput, LoopContinue
+
+PROMPT      = b"> "
+READ_LIMIT  = 64 * 1024
+
+class ReadWriteLock:
+
+    _condition      :asyncio.Condition
+    _readerCount    :int
+    _writing        :bool
+    _waitingWriters :int
+
+    def __init__(self) -> None:
+        self._condition         = asyncio.Condition()
+        self._readerCount       = 0
+        self._writing           = False
+        self._waitingWriters    = 0
+
+    async def acquireRead(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: not self._writing and self._waitingWriters == 0)
+            self._readerCount += 1
+
+    async def releaseRead(self) -> None:
+        async with self._condition:
+            self._readerCount -= 1
+            self._condition.notify_all()
+
+    async def acquireWrite(self) -> None:
+        async with self._condition:
+            self._waitingWriters += 1
+            await self._condition.wait_for(lambda: not self._writing and self._readerCount == 0)
+            self._waitingWriters -= 1
+            self._writing = True
+
+    async def releaseWrite(self) -> None:
+        async with self._condition:
+            self._writing = False
+            self._condition.notify_all()
+
+class StreamWriterOutput:
+
+    _writer:asyncio.StreamWriter
+
+    def __init__(self, writer:asyncio.StreamWriter) -> None:
+        self._writer = writer
+
+    def write(self, outputStr:str) -> int:
+        self._writer.write(outputStr.encode("utf-8"))
+        return len(outputStr)
+
+    def flush(self) -> None:
+        pass
+
+class TaskListServer:
+
+    _programDatas   :ProgramDatas
+    _lock           :ReadWriteLock
+    _bufferSize     :int
+
+    def __init__(self, programDatas:ProgramDatas, bufferSize:int = 64 * 1024) -> None:
+        self._programDatas  = programDatas
+        self._lock          = ReadWriteLock()
+        self._bufferSize    = bufferSize
+
+    async def _streamChunks(self, chunks:List[str], writer:asyncio.StreamWriter) -> None:
+        batch       :List[str]  = []
+        batchSize   :int        = 0
+
+        for chunk in chunks:
+            batch.append(chunk)
+            batchSize += len(chunk)
+            if batchSize >= self._bufferSize:
+                writer.write("".join(batch).encode("utf-8"))
+                batch       = []
+                batchSize   = 0
+                await writer.drain()
+
+        writer.write("".join(batch).encode("utf-8"))
+
+    async def _execute(self, commandLine:CommandLine, console:Console, writer:asyncio.StreamWriter) -> None:
+        if commandLine.filePath() is not None:
+            console.print(output=ConsoleOuput(outputStr=f"The command {commandLine.commandName()} is not available to remote clients."))
+            return
+
+        if not commandLine.readOnly():
+            await self._lock.acquireWrite()
+            try:
+                commandLine.execute(programDatas=self._programDatas, console=console)
+            finally:
+                await self._lock.releaseWrite()
+            return
+
+        await self._lock.acquireRead()
+        try:
+            chunks = commandLine.outputChunks(programDatas=self._programDatas)
+            if chunks is None:
+                commandLine.execute(programDatas=self._programDatas, console=console)
+                return
+            chunks = list(chunks)
+        finally:
+            await self._lock.releaseRead()
+        await self._streamChunks(chunks=chunks, writer=writer)
+
+    def _record(self, commandLine:CommandLine, started:int, parsed:int, allocatedBlocks:int) -> None:
+        instrumentation = self._programDatas.instrumentation()
+        if instrumentation is not None:
+            instrumentation.record(
+                commandName=commandLine.commandName(),
+                parseNs=parsed - started,
+                executeNs=time.perf_counter_ns() - parsed,
+                allocatedBlocks=sys.getallocatedblocks() - allocatedBlocks)
+
+    async def _readCommandLine(self, reader:asyncio.StreamReader) -> bytes:
+        try:
+            return await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as error:
+            return error.partial
+        except asyncio.LimitOverrunError as error:
+            overrun = error
+
+        while True:
+            await reader.readexactly(overrun.consumed)
+            try:
+                await reader.readuntil(b"\n")
+                break
+            except asyncio.IncompleteReadError:
+                break
+            except asyncio.LimitOverrunError as error:
+                overrun = error
+        raise ValueError(f"command line longer than {READ_LIMIT} bytes")
+
+    async def handleConnection(self, reader:asyncio.StreamReader, writer:asyncio.StreamWriter) -> None:
+        console = Console(None, StreamWriterOutput(writer=writer))
+        try:
+            writer.write(PROMPT)
+            await writer.drain()
+
+            while True:
+                try:
+                    commandLineBytes = await self._readCommandLine(reader=reader)
+                except ValueError:
+                    writer.write(f"The command line is longer than {READ_LIMIT} bytes.\n".encode("utf-8") + PROMPT)
+                    await writer.drain()
+                    continue
+                if commandLineBytes == b"":
+                    break
+
+                allocatedBlocks = sys.getallocatedblocks()
+                started         = time.perf_counter_ns()
+                commandLine     = CommandLine(commandLineStr=commandLineBytes.decode("utf-8", errors="replace"))
+                parsed          = time.perf_counter_ns()
+                if commandLine.loopContinue() == LoopContinue(loopContinueBooleanValue=False):
+                    break
+
+                await self._execute(commandLine=commandLine, console=console, writer=writer)
+                self._record(commandLine=commandLine, started=started, parsed=parsed, allocatedBlocks=allocatedBlocks)
+                writer.write(PROMPT)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def startTcp(self, host:str, port:int) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handleConnection, host=host, port=port, limit=READ_LIMIT)
+
+    async def startUnix(self, path:str) -> asyncio.AbstractServer:
+        return await asyncio.start_unix_server(self.handleConnection, path=path, limit=READ_LIMIT)
+
+async def serveForever(server:asyncio.AbstractServer) -> None:
+    async with server:
+        await server.serve_forever()
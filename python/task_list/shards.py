@@ -0,0 +1,204 @@
+import io
+import multiprocessing
+import multiprocessing.connection
+import os
+import zlib
+from typing import Dict, List, Set, Tuple
+
+from app import ProgramDatas
+from command import COMMAND_TABLE, CommandLine
+from console import Console
+from descriptionIndex import parseSearchTerms
+from primitiveWrapper import LoopContinue
+from storage import FileStorage
+from taskIdAllocator import TaskIdAllocator
+
+SHARD_DIRECTORY_NAME    = "shard{shardIndex}"
+BROADCAST               = -1
+SHARDED_COMMANDS        = ("show", "add", "check", "uncheck", "list", "search", "help")
+
+def createShardProgramDatas(shardIndex:int, shardCount:int, dataDirectory:str) -> ProgramDatas:
+    taskIdAllocator = TaskIdAllocator(nextTaskIdInt=shardIndex + 1, stride=shardCount)
+    if dataDirectory is None:
+        return ProgramDatas(taskIdAllocator=taskIdAllocator)
+
+    shardDirectory = os.path.join(dataDirectory, SHARD_DIRECTORY_NAME.format(shardIndex=shardIndex))
+    return ProgramDatas(storage=FileStorage(directory=shardDirectory), taskIdAllocator=taskIdAllocator)
+
+def serveShard(connection:multiprocessing.connection.Connection, shardIndex:int, shardCount:int, dataDirectory:str) -> None:
+    programDatas    = createShardProgramDatas(shardIndex=shardIndex, shardCount=shardCount, dataDirectory=dataDirectory)
+    output          = io.StringIO()
+    console         = Console(None, output)
+
+    while True:
+        kind, payload = connection.recv()
+        if kind == "close":
+            programDatas.close()
+            connection.send(None)
+            return
+
+        if kind == "projects":
+            connection.send(programDatas.renderedProjects())
+            continue
+
+        outputs = []
+        for commandLineStr in payload:
+            CommandLine(commandLineStr=commandLineStr).execute(programDatas=programDatas, console=console)
+            outputs.append(output.getvalue())
+            output.seek(0)
+            output.truncate()
+        connection.send(outputs)
+
+def _taskIdOfLine(line:str) -> int:
+    return int(line[6:line.index(":", 6)])
+
+class ShardRouter:
+
+    _shardCount     :int
+    _connections    :List[multiprocessing.connection.Connection]
+    _processes      :List[multiprocessing.Process]
+    _projectNames   :List[str]
+    _projectNameSet :Set[str]
+
+    def __init__(self, shardCount:int, dataDirectory:str = None) -> None:
+        context             = multiprocessing.get_context("spawn")
+        self._shardCount    = shardCount
+        self._connections   = []
+        self._processes     = []
+        for shardIndex in range(shardCount):
+            routerConnection, shardConnection = context.Pipe()
+            process = context.Process(target=serveShard, args=(shardConnection, shardIndex, shardCount, dataDirectory), daemon=True)
+            process.start()
+            self._connections.append(routerConnection)
+            self._processes.append(process)
+
+        self._projectNames      = []
+        self._projectNameSet    = set()
+        for projectNames in self._broadcast(message=("projects", None)):
+            for projectName, _ in projectNames:
+                self._addProjectName(projectName=projectName)
+
+    def _addProjectName(self, projectName:str) -> None:
+        if projectName not in self._projectNameSet:
+            self._projectNameSet.add(projectName)
+            self._projectNames.append(projectName)
+
+    def _broadcast(self, message:Tuple) -> List:
+        for connection in self._connections:
+            connection.send(message)
+        return [connection.recv() for connection in self._connections]
+
+    def shardOfProject(self, projectName:str) -> int:
+        return zlib.crc32(projectName.encode("utf-8")) % self._shardCount
+
+    def shardOfTaskId(self, taskIdInt:int) -> int:
+        return (taskIdInt - 1) % self._shardCount
+
+    def route(self, commandLineStr:str) -> int:
+        commandLineStr  = commandLineStr.strip()
+        tokens          = commandLineStr.split(" ", 2)
+        verb            = tokens[0]
+        subVerb         = tokens[1] if len(tokens) > 1 else None
+
+        if verb == "add" and len(tokens) > 2:
+            if subVerb == "project":
+                self._addProjectName(projectName=tokens[2])
+                return self.shardOfProject(projectName=tokens[2])
+            return self.shardOfProject(projectName=tokens[2].split(" ", 1)[0])
+
+        if verb in ("check", "uncheck"):
+            return self.shardOfTaskId(taskIdInt=int(subVerb)) if len(tokens) == 2 and subVerb.isdigit() else None
+
+        if verb == "show":
+            return BROADCAST if subVerb is None else self.shardOfProject(projectName=subVerb)
+
+        if verb == "list" and len(tokens) > 2 and subVerb in ("project", "undone"):
+            return self.shardOfProject(projectName=tokens[2])
+
+        if verb == "list" and (subVerb == "undone" or (subVerb in ("word", "prefix") and len(tokens) > 2)):
+            return BROADCAST
+
+        if verb == "search" and any(parseSearchTerms(queryStr=commandLineStr[len(verb):])):
+            return BROADCAST
+
+        if verb in COMMAND_TABLE and verb not in SHARDED_COMMANDS:
+            return None
+        return 0
+
+    def _gatherShow(self) -> str:
+        renderedByName:Dict[str, str] = {}
+        for projectNames in self._broadcast(message=("projects", None)):
+            renderedByName.update(projectNames)
+        return "".join(renderedByName[projectName] for projectName in self._projectNames if projectName in renderedByName) + "\n"
+
+    def _gatherList(self, commandLineStr:str) -> str:
+        lines = []
+        for outputs in self._broadcast(message=("commands", [commandLineStr])):
+            lines.extend(line for line in outputs[0].split("\n")[:-2])
+        lines.sort(key=_taskIdOfLine)
+        return "".join(f"{line}\n" for line in lines) + "\n"
+
+    def _executeBroadcast(self, commandLineStr:str) -> str:
+        if commandLineStr.strip() == "show":
+            return self._gatherShow()
+        return self._gatherList(commandLineStr=commandLineStr)
+
+    def execute(self, commandLineStrs:List[str]) -> List[str]:
+        outputs                                         = [None] * len(commandLineStrs)
+        batches :Dict[int, List[Tuple[int, str]]]       = {}
+
+        def flush() -> None:
+            for shardIndex, batch in batches.items():
+                self._connections[shardIndex].send(("commands", [commandLineStr for _, commandLineStr in batch]))
+            for shardIndex, batch in batches.items():
+                for (index, _), output in zip(batch, self._connections[shardIndex].recv()):
+                    outputs[index] = output
+            batches.clear()
+
+        for index, commandLineStr in enumerate(commandLineStrs):
+            shardIndex = self.route(commandLineStr=commandLineStr)
+            if shardIndex is None:
+                outputs[index] = f"The command {commandLineStr.strip()} is not available with shards.\n"
+            elif shardIndex == BROADCAST:
+                flush()
+                outputs[index] = self._executeBroadcast(commandLineStr=commandLineStr)
+            else:
+                batches.setdefault(shardIndex, []).append((index, commandLineStr))
+        flush()
+        return outputs
+
+    def close(self) -> None:
+        self._broadcast(message=("close", None))
+        for process in self._processes:
+            process.join()
+
+class ShardedProgramLoop:
+
+    _console    :Console
+    _router     :ShardRouter
+    _batchSize  :int
+
+    def __init__(self, console:Console, router:ShardRouter, batchSize:int = 1) -> None:
+        self._console   = console
+        self._router    = router
+        self._batchSize = batchSize
+
+    def run(self) -> None:
+        loopContinue = LoopContinue()
+        while loopContinue == LoopContinue(loopContinueBooleanValue=True):
+            commandLineStrs = []
+            while len(commandLineStrs) < self._batchSize:
+                commandLineStr = self._console.inputPrompt()
+                if commandLineStr == "":
+                    loopContinue = LoopContinue(loopContinueBooleanValue=False)
+                    break
+
+                if commandLineStr.strip().split(" ", 1)[0] == "quit":
+                    loopContinue = LoopContinue(loopContinueBooleanValue=False)
+                    break
+                commandLineStrs.append(commandLineStr)
+
+            self._console.writeChunks(chunks=self._router.execute(commandLineStrs=commandLineStrs))
+
+        self._console.flush()
+        self._router.close()
@@ -0,0 +1,249 @@
+import json
+import os
+import threading
+from typing import IO, Iterable, List
+
+from mappedTable import MappedTaskFile, MappedTaskTable
+from primitiveWrapper import ProjectName, TaskDescription, TaskDone, TaskId
+from taskTable import TaskTable
+
+class MemoryStorage:
+
+    def createTaskTable(self) -> TaskTable:
+        return TaskTable()
+
+    def load(self, programDatas:'ProgramDatas') -> None:
+        pass
+
+    def recordAddProject(self, projectName:ProjectName) -> None:
+        pass
+
+    def recordAddTask(self, taskId:TaskId, projectName:ProjectName, taskDescription:TaskDescription, createdAt:int) -> None:
+        pass
+
+    def recordTaskDone(self, taskId:TaskId, taskDone:TaskDone, completedAt:int) -> None:
+        pass
+
+    def recordRemoveTask(self, taskId:TaskId) -> None:
+        pass
+
+    def recordNextTaskId(self, nextTaskId:TaskId) -> None:
+        pass
+
+    def recordRecords(self, records:List[List]) -> None:
+        pass
+
+    def compactIfNeeded(self, programDatas:'ProgramDatas') -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+class FileStorage(MemoryStorage):
+
+    SNAPSHOT_FILE_NAME  = "snapshot.jsonl"
+    JOURNAL_FILE_NAME   = "journal.jsonl"
+
+    _snapshotPath       :str
+    _journalPath        :str
+    _journal            :IO = None
+    _sequence           :int
+    _journalEntryCount  :int
+    _compactEvery       :int
+    _fsync              :bool
+    _lock               :threading.RLock
+
+    def __init__(self, directory:str, compactEvery:int = 100000, fsync:bool = False) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self._snapshotPath      = os.path.join(directory, self.SNAPSHOT_FILE_NAME)
+        self._journalPath       = os.path.join(directory, self.JOURNAL_FILE_NAME)
+        self._sequence          = 0
+        self._journalEntryCount = 0
+        self._compactEvery      = compactEvery
+        self._fsync             = fsync
+        self._lock              = threading.RLock()
+
+    def _applyRecord(self, record:List, programDatas:'ProgramDatas') -> None:
+        kind = record[0]
+        if kind == "P":
+            programDatas.restoreProject(projectName=ProjectName(projetNameStr=record[1]))
+            return
+
+        if kind == "T":
+            programDatas.restoreTask(
+                taskId=TaskId(taskIdInt=record[1]),
+                projectName=ProjectName(projetNameStr=record[2]),
+                taskDescription=TaskDescription(taskDescriptionStr=record[3]),
+                taskDone=TaskDone(taskDoneBooleanValue=record[4]),
+                createdAt=record[5] if len(record) > 5 else 0,
+                completedAt=record[6] if len(record) > 6 else 0)
+            return
+
+        if kind == "D":
+            programDatas.restoreTaskDone(
+                taskId=TaskId(taskIdInt=record[1]),
+                taskDone=TaskDone(taskDoneBooleanValue=record[2]),
+                completedAt=record[3] if len(record) > 3 else 0)
+            return
+
+        if kind == "R":
+            programDatas.restoreTaskRemoved(taskId=TaskId(taskIdInt=record[1]))
+            return
+
+        if kind == "N":
+            programDatas.restoreNextTaskId(nextTaskId=TaskId(taskIdInt=record[1]))
+            return
+
+    def _loadSnapshot(self, programDatas:'ProgramDatas') -> None:
+        if not os.path.exists(self._snapshotPath):
+            return
+
+        with open(self._snapshotPath, encoding="utf-8") as snapshot:
+            header          = json.loads(snapshot.readline())
+            self._sequence  = header[1]
+            if len(header) > 2:
+                programDatas.restoreNextTaskId(nextTaskId=TaskId(taskIdInt=header[2]))
+            for line in snapshot:
+                self._applyRecord(record=json.loads(line), programDatas=programDatas)
+
+    def _loadJournal(self, programDatas:'ProgramDatas') -> int:
+        validSize = 0
+        if not os.path.exists(self._journalPath):
+            return validSize
+
+        with open(self._journalPath, "rb") as journal:
+            for line in journal:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+
+                validSize += len(line)
+                if entry[0] <= self._sequence:
+                    continue
+
+                self._applyRecord(record=entry[1:], programDatas=programDatas)
+                self._sequence          = entry[0]
+                self._journalEntryCount += 1
+
+        return validSize
+
+    def load(self, programDatas:'ProgramDatas') -> None:
+        self._loadSnapshot(programDatas=programDatas)
+        validSize = self._loadJournal(programDatas=programDatas)
+
+        self._journal = open(self._journalPath, "a", encoding="utf-8")
+        self._journal.truncate(validSize)
+
+    def _sync(self) -> None:
+        self._journal.flush()
+        if self._fsync:
+            os.fsync(self._journal.fileno())
+
+    def _write(self, record:List) -> None:
+        self._sequence          += 1
+        self._journalEntryCount += 1
+        self._journal.write(json.dumps([self._sequence] + record) + "\n")
+
+    def _append(self, record:List) -> None:
+        with self._lock:
+            self._write(record=record)
+            self._sync()
+
+    def recordRecords(self, records:List[List]) -> None:
+        with self._lock:
+            for record in records:
+                self._write(record=record)
+            self._sync()
+
+    def recordAddProject(self, projectName:ProjectName) -> None:
+        self._append(record=["P", str(projectName)])
+
+    def recordAddTask(self, taskId:TaskId, projectName:ProjectName, taskDescription:TaskDescription, createdAt:int) -> None:
+        self._append(record=["T", int(taskId), str(projectName), str(taskDescription), False, createdAt, 0])
+
+    def recordTaskDone(self, taskId:TaskId, taskDone:TaskDone, completedAt:int) -> None:
+        self._append(record=["D", int(taskId), bool(taskDone), completedAt])
+
+    def recordRemoveTask(self, taskId:TaskId) -> None:
+        self._append(record=["R", int(taskId)])
+
+    def recordNextTaskId(self, nextTaskId:TaskId) -> None:
+        self._append(record=["N", int(nextTaskId)])
+
+    def _writeSnapshot(self, records:Iterable[List], nextTaskId:TaskId) -> None:
+        temporaryPath = self._snapshotPath + ".tmp"
+        with open(temporaryPath, "w", encoding="utf-8") as snapshot:
+            snapshot.write(json.dumps(["S", self._sequence, int(nextTaskId)]) + "\n")
+            for record in records:
+                snapshot.write(json.dumps(record) + "\n")
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+
+        os.replace(temporaryPath, self._snapshotPath)
+
+    def compact(self, programDatas:'ProgramDatas') -> None:
+        with self._lock:
+            self._writeSnapshot(records=programDatas.records(), nextTaskId=programDatas.nextTaskId())
+            self._journal.truncate(0)
+            self._journalEntryCount = 0
+
+    def compactIfNeeded(self, programDatas:'ProgramDatas') -> None:
+        if self._journalEntryCount < self._compactEvery:
+            return
+
+        with self._lock:
+            if self._journalEntryCount >= self._compactEvery:
+                self.compact(programDatas=programDatas)
+
+    def close(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+class MappedStorage(MemoryStorage):
+
+    _taskFile   :MappedTaskFile
+    _taskTable  :MappedTaskTable
+
+    def __init__(self, directory:str) -> None:
+        self._taskFile  = MappedTaskFile(directory=directory)
+        self._taskTable = MappedTaskTable(taskFile=self._taskFile)
+
+    def createTaskTable(self) -> TaskTable:
+        return self._taskTable
+
+    def load(self, programDatas:'ProgramDatas') -> None:
+        for projectNumber, projectName in enumerate(self._taskFile.projectNames()):
+            programDatas.restoreProject(projectName=ProjectName(projetNameStr=projectName))
+            programDatas.restoreProjectRowsLoader(
+                projectName=ProjectName(projetNameStr=projectName),
+                rowsLoader=lambda projectNumber=projectNumber: self._taskTable.projectRows(projectNumber=projectNumber))
+        programDatas.restoreNextTaskId(nextTaskId=TaskId(taskIdInt=self._taskFile.nextTaskIdInt()))
+
+    def _observeTaskId(self, taskIdInt:int) -> None:
+        if taskIdInt >= self._taskFile.nextTaskIdInt():
+            self._taskFile.setNextTaskIdInt(nextTaskIdInt=taskIdInt + 1)
+
+    def recordAddProject(self, projectName:ProjectName) -> None:
+        self._taskFile.addProject(projectName=str(projectName))
+
+    def recordAddTask(self, taskId:TaskId, projectName:ProjectName, taskDescription:TaskDescription, createdAt:int) -> None:
+        self._observeTaskId(taskIdInt=int(taskId))
+
+    def recordNextTaskId(self, nextTaskId:TaskId) -> None:
+        self._observeTaskId(taskIdInt=int(nextTaskId) - 1)
+
+    def recordRecords(self, records:List[List]) -> None:
+        for record in records:
+            if record[0] == "P":
+                self._taskFile.addProject(projectName=record[1])
+            elif record[0] == "T":
+                self._observeTaskId(taskIdInt=record[1])
+
+    def close(self) -> None:
+        self._taskTable.saveIndex()
+        self._taskFile.flush()
+        self._taskFile.close()
@@ -0,0 +1,39 @@
+import threading
+
+from primitiveWrapper import TaskId
+
+class TaskIdAllocator:
+
+    __slots__ = ("_nextTaskIdInt", "_stride", "_lock")
+
+    _nextTaskIdInt  :int
+    _stride         :int
+    _lock           :threading.Lock
+
+    def __init__(self, nextTaskIdInt:int = 1, stride:int = 1) -> None:
+        self._nextTaskIdInt = nextTaskIdInt
+        self._stride        = stride
+        self._lock          = threading.Lock()
+
+    def nextTaskId(self) -> TaskId:
+        return TaskId(taskIdInt=self._nextTaskIdInt)
+
+    def allocate(self) -> TaskId:
+        with self._lock:
+            taskId = TaskId(taskIdInt=self._nextTaskIdInt)
+            self._nextTaskIdInt += self._stride
+        return taskId
+
+    def reserve(self, count:int) -> range:
+        with self._lock:
+            reserved = range(self._nextTaskIdInt, self._nextTaskIdInt + count * self._stride, self._stride)
+            self._nextTaskIdInt += count * self._stride
+        return reserved
+
+    def advanceTo(self, nextTaskId:TaskId) -> None:
+        with self._lock:
+            if int(nextTaskId) > self._nextTaskIdInt:
+                self._nextTaskIdInt = int(nextTaskId) + (self._nextTaskIdInt - int(nextTaskId)) % self._stride
+
+    def observe(self, taskId:TaskId) -> None:
+        self.advanceTo(nextTaskId=taskId.nextOne())
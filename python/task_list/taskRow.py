@@ -0,0 +1,8 @@
+from typing import NamedTuple, Optional
+
+class TaskRow(NamedTuple):
+
+    taskId          :Optional[int]
+    projectName     :str
+    taskDescription :str
+    taskDone        :bool
@@ -0,0 +1,237 @@
+import sys
+import threading
+from array import array
+from typing import Dict, List, Tuple
+
+from completionIndex import CompletionIndex, minuteOf
+from descriptionIndex import DescriptionIndex
+from primitiveWrapper import ProjectName, TaskDescription, TaskDone, TaskFounded, TaskId
+from taskRow import TaskRow
+
+REMOVED_POSITION    = -1
+DONE_MARKS          = (str(TaskDone(taskDoneBooleanValue=False)), str(TaskDone(taskDoneBooleanValue=True)))
+
+def missingTaskIdsOutputStr(missingRanges:List[List[int]]) -> str:
+    if len(missingRanges) == 1 and missingRanges[0][1] - missingRanges[0][0] == 1:
+        return f"Could not find a task with an ID of {missingRanges[0][0]}"
+    taskIds = ", ".join(str(start) if stop - start == 1 else f"{start}-{stop - 1}" for start, stop in missingRanges)
+    return f"Could not find tasks with the IDs {taskIds}"
+
+class TaskTable:
+
+    CACHES_LINES:bool = True
+
+    __slots__ = ("_ids", "_done", "_descriptions", "_taskLists", "_positions", "_created", "_completed", "_rowById", "_descriptionIndex", "_completionIndex", "_lock")
+
+    _ids                :array
+    _done               :bytearray
+    _descriptions       :List[str]
+    _taskLists          :List['TaskList']
+    _positions          :array
+    _created            :array
+    _completed          :array
+    _rowById            :Dict[int, int]
+    _descriptionIndex   :DescriptionIndex
+    _completionIndex    :CompletionIndex
+    _lock               :threading.Lock
+
+    def __init__(self) -> None:
+        self._ids               = array("q")
+        self._done              = bytearray()
+        self._descriptions      = []
+        self._taskLists         = []
+        self._positions         = array("q")
+        self._created           = array("q")
+        self._completed         = array("q")
+        self._rowById           = {}
+        self._descriptionIndex  = DescriptionIndex()
+        self._completionIndex   = CompletionIndex(completedAt=self._completed)
+        self._lock              = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _appendRow(self, taskIdInt:int, taskDone:bool, description:str, taskList:'TaskList', position:int, createdAt:int, completedAt:int) -> None:
+        self._ids.append(taskIdInt)
+        self._done.append(taskDone)
+        self._descriptions.append(sys.intern(description))
+        self._taskLists.append(taskList)
+        self._positions.append(position)
+        self._created.append(createdAt)
+        self._completed.append(completedAt)
+
+    def addRow(self, taskId:TaskId, taskDescription:TaskDescription, taskDone:TaskDone, taskList:'TaskList', position:int, createdAt:int, completedAt:int) -> int:
+        completedAt = completedAt if taskDone else 0
+        with self._lock:
+            row = len(self._ids)
+            self._appendRow(
+                taskIdInt=int(taskId), taskDone=bool(taskDone), description=str(taskDescription), taskList=taskList, position=position,
+                createdAt=createdAt, completedAt=completedAt)
+            self._rowById[int(taskId)] = row
+            if self._descriptionIndex is not None:
+                self._descriptionIndex.addRow(row=row, description=str(taskDescription))
+            if self._completionIndex is not None and completedAt:
+                self._completionIndex.addRow(row=row, completedAt=completedAt, projectName=str(taskList.projectName()))
+        return row
+
+    def _loadedDescriptionIndex(self) -> DescriptionIndex:
+        if self._descriptionIndex is None:
+            descriptionIndex = DescriptionIndex()
+            for row in range(len(self._ids)):
+                descriptionIndex.addRow(row=row, description=self._descriptions[row])
+            self._descriptionIndex = descriptionIndex
+        return self._descriptionIndex
+
+    def _loadedCompletionIndex(self) -> CompletionIndex:
+        if self._completionIndex is None:
+            completionIndex = CompletionIndex(completedAt=self._completed)
+            for row in range(len(self._ids)):
+                completedAt = self._completed[row]
+                if completedAt and self._positions[row] != REMOVED_POSITION:
+                    completionIndex.addRow(row=row, completedAt=completedAt, projectName=str(self._taskLists[row].projectName()))
+            self._completionIndex = completionIndex
+        return self._completionIndex
+
+    def removeRow(self, row:int) -> None:
+        with self._lock:
+            del self._rowById[self._ids[row]]
+            self._positions[row] = REMOVED_POSITION
+            if self._completionIndex is not None and self._completed[row]:
+                self._completionIndex.discardRow(completedAt=self._completed[row], projectName=str(self._taskLists[row].projectName()))
+
+    def restoreRow(self, row:int, position:int) -> None:
+        with self._lock:
+            self._rowById[self._ids[row]]   = row
+            self._positions[row]            = position
+            if self._completionIndex is not None and self._completed[row]:
+                self._completionIndex.addRow(row=row, completedAt=self._completed[row], projectName=str(self._taskLists[row].projectName()))
+
+    def rowRemoved(self, row:int) -> bool:
+        return self._positions[row] == REMOVED_POSITION
+
+    def taskFounded(self, taskId:TaskId) -> TaskFounded:
+        return TaskFounded(taskFoundedBooleanValue=int(taskId) in self._rowById)
+
+    def row(self, taskId:TaskId) -> int:
+        return self._rowById[int(taskId)]
+
+    def rowsInIdRange(self, taskIdRange:range, rows:List[int], missingRanges:List[List[int]]) -> None:
+        rowById = self._rowById
+        for taskIdInt in taskIdRange:
+            row = rowById.get(taskIdInt)
+            if row is not None:
+                rows.append(row)
+            elif missingRanges and missingRanges[-1][1] == taskIdInt:
+                missingRanges[-1][1] = taskIdInt + 1
+            else:
+                missingRanges.append([taskIdInt, taskIdInt + 1])
+
+    def rowsInIdRanges(self, taskIdRanges:List[range], nextTaskIdInt:int) -> Tuple[List[int], List[List[int]]]:
+        rows            :List[int]          = []
+        missingRanges   :List[List[int]]    = []
+        for taskIdRange in taskIdRanges:
+            self.rowsInIdRange(taskIdRange=range(taskIdRange.start, min(taskIdRange.stop, nextTaskIdInt)), rows=rows, missingRanges=missingRanges)
+            if taskIdRange.stop > nextTaskIdInt:
+                missingRanges.append([max(taskIdRange.start, nextTaskIdInt), taskIdRange.stop])
+        return list(dict.fromkeys(rows)), missingRanges
+
+    def taskId(self, row:int) -> TaskId:
+        return TaskId(taskIdInt=self._ids[row])
+
+    def taskDone(self, row:int) -> TaskDone:
+        return TaskDone(taskDoneBooleanValue=bool(self._done[row]))
+
+    def completedAt(self, row:int) -> int:
+        return self._completed[row]
+
+    def rowsCompletedSince(self, since:int) -> List[int]:
+        with self._lock:
+            return [row for row in self._loadedCompletionIndex().rowsSince(since=since) if self._positions[row] != REMOVED_POSITION]
+
+    def completedCountsByDay(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {day: dict(counts) for day, counts in self._loadedCompletionIndex().countsByDay().items()}
+
+    def rowsWithToken(self, token:str) -> List[int]:
+        with self._lock:
+            return [row for row in self._loadedDescriptionIndex().rowsWithToken(token=token) if self._positions[row] != REMOVED_POSITION]
+
+    def rowsWithPrefix(self, prefix:str) -> List[int]:
+        with self._lock:
+            return [row for row in self._loadedDescriptionIndex().rowsWithPrefix(prefix=prefix) if self._positions[row] != REMOVED_POSITION]
+
+    def rowsMatchingAll(self, tokens:List[str], prefixes:List[str]) -> List[int]:
+        with self._lock:
+            return [row for row in self._loadedDescriptionIndex().rowsMatchingAll(tokens=tokens, prefixes=prefixes) if self._positions[row] != REMOVED_POSITION]
+
+    def taskList(self, row:int) -> 'TaskList':
+        return self._taskLists[row]
+
+    def position(self, row:int) -> int:
+        return self._positions[row]
+
+    def setPosition(self, row:int, position:int) -> None:
+        self._positions[row] = position
+
+    def _setCompletedRows(self, rows:List[int], completedAt:int) -> None:
+        completed = self._completed
+        if self._completionIndex is None:
+            for row in rows:
+                completed[row] = completedAt
+            return
+
+        with self._lock:
+            rowsByTaskList:Dict['TaskList', List[int]] = {}
+            for row in rows:
+                if self._positions[row] == REMOVED_POSITION:
+                    completed[row] = completedAt
+                else:
+                    rowsByTaskList.setdefault(self._taskLists[row], []).append(row)
+
+            for taskList, taskListRows in rowsByTaskList.items():
+                projectName = str(taskList.projectName())
+                for row in taskListRows:
+                    if completed[row]:
+                        self._completionIndex.discardRow(completedAt=completed[row], projectName=projectName)
+                    completed[row] = completedAt
+                if completedAt:
+                    self._completionIndex.addRows(rows=taskListRows, completedAt=completedAt, projectName=projectName)
+
+    def setDone(self, row:int, taskDone:TaskDone, completedAt:int) -> None:
+        if self._done[row] == bool(taskDone):
+            return
+        self._done[row] = bool(taskDone)
+        self._setCompletedRows(rows=[row], completedAt=completedAt if taskDone else 0)
+
+    def setDoneRows(self, rows:List[int], taskDone:TaskDone, completedAt:int) -> bytes:
+        done            = self._done
+        previousDone    = bytes(done[row] for row in rows)
+        doneInt         = int(bool(taskDone))
+        changedRows     = [row for row, wasDone in zip(rows, previousDone) if wasDone != doneInt]
+        for row in changedRows:
+            done[row] = doneInt
+        self._setCompletedRows(rows=changedRows, completedAt=completedAt if taskDone else 0)
+        return previousDone
+
+    def taskIdInts(self, rows:List[int]) -> List[int]:
+        ids = self._ids
+        return [ids[row] for row in rows]
+
+    def completedAts(self, rows:List[int]) -> List[int]:
+        completed = self._completed
+        return [completed[row] for row in rows]
+
+    def renderLine(self, row:int) -> str:
+        return f"  {DONE_MARKS[self._done[row]]} {self._ids[row]}: {self._descriptions[row]}"
+
+    def renderQueryLine(self, row:int) -> str:
+        return f"{self.renderLine(row=row)} ({self._taskLists[row].projectName()})\n"
+
+    def renderCompletedLine(self, row:int) -> str:
+        return f"{self.renderLine(row=row)} ({self._taskLists[row].projectName()}) completed {minuteOf(timestamp=self._completed[row])}\n"
+
+    def record(self, row:int, projectName:ProjectName) -> List:
+        return ["T", self._ids[row], str(projectName), self._descriptions[row], bool(self._done[row]), self._created[row], self._completed[row]]
+
+    def taskRow(self, row:int, projectName:ProjectName) -> TaskRow:
+        return TaskRow(self._ids[row], str(projectName), self._descriptions[row], bool(self._done[row]))
@@ -0,0 +1,48 @@
+import threading
+from collections import deque
+from typing import Deque, Iterable, List, Tuple
+
+SET_DONE        = 0
+REMOVE_TASK     = 1
+RESTORE_TASK    = 2
+GROUP           = 3
+UNDO_LIMIT      = 10000
+
+class UndoLog:
+
+    __slots__ = ("_undoEntries", "_redoEntries", "_lock")
+
+    _undoEntries    :Deque[Tuple[int, ...]]
+    _redoEntries    :List[Tuple[int, ...]]
+    _lock           :threading.Lock
+
+    def __init__(self, limit:int = UNDO_LIMIT) -> None:
+        self._undoEntries   = deque(maxlen=limit)
+        self._redoEntries   = []
+        self._lock          = threading.Lock()
+
+    def record(self, entry:Tuple[int, ...]) -> None:
+        with self._lock:
+            self._undoEntries.append(entry)
+            self._redoEntries.clear()
+
+    def recordMany(self, entries:Iterable[Tuple[int, ...]]) -> None:
+        with self._lock:
+            self._undoEntries.extend(entries)
+            self._redoEntries.clear()
+
+    def popUndo(self) -> Tuple[int, ...]:
+        with self._lock:
+            return self._undoEntries.pop() if self._undoEntries else None
+
+    def popRedo(self) -> Tuple[int, ...]:
+        with self._lock:
+            return self._redoEntries.pop() if self._redoEntries else None
+
+    def pushUndo(self, entry:Tuple[int, ...]) -> None:
+        with self._lock:
+            self._undoEntries.append(entry)
+
+    def pushRedo(self, entry:Tuple[int, ...]) -> None:
+        with self._lock:
+            self._redoEntries.append(entry)
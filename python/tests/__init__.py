@@ -0,0 +1,14 @@
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "task_list"))
+
+from app import ProgramLoop
+from console import BatchConsole
+
+
+def executeCommands(programDatas, *commands):
+    output = io.StringIO()
+    ProgramLoop(BatchConsole(io.StringIO("".join(command + "\n" for command in commands)), output), programDatas=programDatas).run()
+    return output.getvalue()
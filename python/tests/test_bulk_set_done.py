@@ -0,0 +1,61 @@
+import tempfile
+import unittest
+
+from app import ProgramDatas
+from storage import FileStorage
+from taskRow import TaskRow
+from tests import executeCommands
+
+
+class BulkSetDoneTest(unittest.TestCase):
+
+    def setUp(self):
+        self.programDatas = ProgramDatas()
+        self.programDatas.importTasks(rows=[TaskRow(None, f"project{index // 3}", f"Task {index + 1}", False) for index in range(6)])
+
+    def test_check_ranges_and_lists(self):
+        self.assertEqual("", executeCommands(self.programDatas, "check 1-3,5"))
+        self.assertEqual(
+            "  [ ] 4: Task 4 (project1)\n"
+            "  [ ] 6: Task 6 (project1)\n"
+            "\n",
+            executeCommands(self.programDatas, "list undone"))
+
+    def test_uncheck_ranges(self):
+        self.assertEqual(
+            "  [ ] 3: Task 3 (project0)\n"
+            "  [ ] 4: Task 4 (project1)\n"
+            "\n",
+            executeCommands(self.programDatas, "check 1-6", "uncheck 3-4", "list undone"))
+
+    def test_missing_ids_are_reported_together(self):
+        self.assertEqual(
+            "Could not find tasks with the IDs 0, 7-9, 100\n"
+            "Could not find a task with an ID of 8\n",
+            executeCommands(self.programDatas, "check 0-2,7-9,6,100", "uncheck 8"))
+        self.assertEqual("  [ ] 3: Task 3 (project0)\n  [ ] 4: Task 4 (project1)\n  [ ] 5: Task 5 (project1)\n\n", executeCommands(self.programDatas, "list undone"))
+
+    def test_malformed_ranges_are_errors(self):
+        self.assertEqual(
+            "I don't know what the command check 3-1 is.\n"
+            "I don't know what the command check 1,,2 is.\n"
+            "I don't know what the command check 1-a is.\n"
+            "I don't know what the command check 1- is.\n"
+            "I don't know what the command uncheck 1-3,-2 is.\n"
+            "I don't know what the command check  1 is.\n",
+            executeCommands(self.programDatas, "check 3-1", "check 1,,2", "check 1-a", "check 1-", "uncheck 1-3,-2", "check  1"))
+
+    def test_bulk_check_is_one_undo_step(self):
+        self.assertEqual(
+            "".join(f"  [ ] {index + 1}: Task {index + 1} (project{index // 3})\n" for index in range(6)) + "\n",
+            executeCommands(self.programDatas, "uncheck 1", "check 1-6", "undo", "list undone"))
+        self.assertEqual("\n", executeCommands(self.programDatas, "redo", "list undone"))
+
+    def test_bulk_check_is_journaled(self):
+        with tempfile.TemporaryDirectory() as directory:
+            programDatas = ProgramDatas(storage=FileStorage(directory=directory))
+            programDatas.importTasks(rows=[TaskRow(None, "secrets", f"Task {index + 1}", False) for index in range(4)])
+            executeCommands(programDatas, "check 2-4", "uncheck 3")
+
+            restored = ProgramDatas(storage=FileStorage(directory=directory))
+            self.assertEqual("secrets\n  [ ] 1: Task 1\n  [x] 2: Task 2\n  [ ] 3: Task 3\n  [x] 4: Task 4\n\n", str(restored))
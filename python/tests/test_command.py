@@ -0,0 +1,34 @@
+import io
+import unittest
+
+from app import ProgramLoop
+from console import BatchConsole
+
+
+class CommandLineTest(unittest.TestCase):
+
+    def run_commands(self, *commands):
+        output = io.StringIO()
+        ProgramLoop(BatchConsole(io.StringIO("".join(command + "\n" for command in commands)), output)).run()
+        return output.getvalue()
+
+    def test_add_task_keeps_the_whole_description(self):
+        self.assertEqual(
+            "secrets\n  [ ] 1: Eat more  donuts.\n\n\n",
+            self.run_commands("add project secrets", "add task secrets Eat more  donuts.", "show"))
+
+    def test_add_project_keeps_the_whole_name(self):
+        self.assertEqual(
+            "secret plans\n\n\n",
+            self.run_commands("add project secret plans", "show"))
+
+    def test_malformed_commands_are_reported(self):
+        self.assertEqual(
+            "I don't know what the command fly is.\n"
+            "I don't know what the command check one is.\n"
+            "I don't know what the command add task secrets is.\n"
+            "I don't know what the command add is.\n",
+            self.run_commands("fly", "check one", "add task secrets", "add thing x"))
+
+    def test_quit_stops_the_loop(self):
+        self.assertEqual("", self.run_commands("quit", "show"))
@@ -0,0 +1,105 @@
+import tempfile
+import unittest
+
+from app import ProgramDatas
+from completionIndex import startOfDay
+from storage import FileStorage, MappedStorage
+from tests import executeCommands
+
+MINUTE  = 60
+HOUR    = 60 * MINUTE
+DAY     = 24 * HOUR
+
+
+class Clock:
+
+    def __init__(self, dayStr):
+        self.now = startOfDay(dayStr=dayStr) + 9 * HOUR
+
+    def __call__(self):
+        return self.now
+
+
+class CompletedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock          = Clock(dayStr="2026-10-12")
+        self.programDatas   = ProgramDatas(clock=self.clock)
+        executeCommands(self.programDatas, "add project secrets", "add task secrets Eat", "add task secrets Sleep", "add project training", "add task training SOLID")
+
+    def completeOnDays(self, openProgramDatas=None):
+        openProgramDatas = openProgramDatas or (lambda: self.programDatas)
+        executeCommands(openProgramDatas(), "check 2")
+        self.clock.now += DAY
+        executeCommands(openProgramDatas(), "check 3")
+        self.clock.now += MINUTE
+        executeCommands(openProgramDatas(), "check 1")
+        self.clock.now += HOUR
+        executeCommands(openProgramDatas(), "check 1")
+
+    def test_completed_since_lists_tasks_in_completion_order(self):
+        self.completeOnDays()
+
+        self.assertEqual(
+            "  [x] 2: Sleep (secrets) completed 2026-10-12 09:00\n"
+            "  [x] 3: SOLID (training) completed 2026-10-13 09:00\n"
+            "  [x] 1: Eat (secrets) completed 2026-10-13 09:01\n"
+            "\n"
+            "  [x] 3: SOLID (training) completed 2026-10-13 09:00\n"
+            "  [x] 1: Eat (secrets) completed 2026-10-13 09:01\n"
+            "\n"
+            "\n",
+            executeCommands(self.programDatas, "completed since 2026-10-01", "completed since 2026-10-13", "completed since 2026-10-14"))
+
+    def test_uncheck_and_undo_move_the_counts(self):
+        self.completeOnDays()
+        self.assertEqual("2026-10-12: 1 (secrets 1)\n2026-10-13: 2 (secrets 1, training 1)\n\n", executeCommands(self.programDatas, "completed count"))
+
+        self.clock.now += DAY
+        self.assertEqual(
+            "2026-10-13: 2 (secrets 1, training 1)\n\n"
+            "2026-10-12: 1 (secrets 1)\n2026-10-13: 2 (secrets 1, training 1)\n\n"
+            "  [x] 2: Sleep (secrets) completed 2026-10-12 09:00\n"
+            "  [x] 3: SOLID (training) completed 2026-10-13 09:00\n"
+            "  [x] 1: Eat (secrets) completed 2026-10-13 09:01\n\n"
+            "2026-10-12: 1 (secrets 1)\n2026-10-13: 2 (secrets 1, training 1)\n\n"
+            "2026-10-13: 1 (secrets 1)\n2026-10-14: 1 (training 1)\n\n",
+            executeCommands(
+                self.programDatas,
+                "uncheck 2", "completed count", "undo", "completed count", "completed since 2026-10-12",
+                "uncheck 1-3", "undo", "completed count",
+                "uncheck 2-3", "check 3", "undo", "redo", "completed count"))
+
+    def test_bulk_check_does_not_count_checked_tasks_twice(self):
+        self.assertEqual(
+            "2026-10-12: 3 (secrets 2, training 1)\n\n"
+            "2026-10-12: 4 (secrets 2, training 2)\n\n"
+            "2026-10-12: 3 (secrets 2, training 1)\n\n",
+            executeCommands(self.programDatas, "check 1-3", "completed count", "add task training Coupling", "check 1-4", "completed count", "undo", "completed count"))
+
+    def test_overlapping_ranges_count_each_task_once(self):
+        self.assertEqual(
+            "2026-10-12: 3 (secrets 2, training 1)\n\n"
+            "2026-10-12: 1 (secrets 1)\n\n",
+            executeCommands(self.programDatas, "check 1,1", "check 1-3,2", "completed count", "uncheck 2-3,3,2", "completed count"))
+
+    def test_malformed_dates_are_errors(self):
+        self.assertEqual(
+            "I don't know what the command completed since yesterday is.\n"
+            "I don't know what the command completed since 2026-13-01 is.\n",
+            executeCommands(self.programDatas, "completed since yesterday", "completed since 2026-13-01"))
+
+    def test_timestamps_survive_a_restart(self):
+        for createStorage in (FileStorage, MappedStorage):
+            with tempfile.TemporaryDirectory() as directory:
+                self.clock      = Clock(dayStr="2026-10-12")
+                programDatas    = ProgramDatas(storage=createStorage(directory=directory), clock=self.clock)
+                executeCommands(programDatas, "add project secrets", "add task secrets Eat", "add task secrets Sleep", "add project training", "add task training SOLID")
+                self.completeOnDays(openProgramDatas=lambda: ProgramDatas(storage=createStorage(directory=directory), clock=self.clock))
+
+                self.assertEqual(
+                    "  [x] 3: SOLID (training) completed 2026-10-13 09:00\n"
+                    "  [x] 1: Eat (secrets) completed 2026-10-13 09:01\n"
+                    "\n"
+                    "2026-10-12: 1 (secrets 1)\n2026-10-13: 2 (secrets 1, training 1)\n\n",
+                    executeCommands(ProgramDatas(storage=createStorage(directory=directory)), "completed since 2026-10-13", "completed count"))
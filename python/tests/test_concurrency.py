@@ -0,0 +1,77 @@
+import io
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+from app import ProgramDatas
+from console import Console
+from primitiveWrapper import ProjectName, TaskDescription, TaskId
+from storage import FileStorage
+
+THREAD_COUNT    = 8
+TASK_COUNT      = 300
+
+
+class ProgramDatasConcurrencyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.switchInterval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.directory      = tempfile.mkdtemp()
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switchInterval)
+        shutil.rmtree(self.directory)
+
+    def hammer(self, programDatas, threadIndex, errors):
+        console     = Console(io.StringIO(), io.StringIO())
+        projectName = ProjectName(projetNameStr=f"project{threadIndex % 3}")
+        try:
+            programDatas.addProject(projectName=projectName, console=console)
+            for index in range(TASK_COUNT):
+                programDatas.addTask(
+                    projectName=projectName,
+                    taskDescription=TaskDescription(taskDescriptionStr=f"{threadIndex}:{index}"),
+                    console=console)
+            for row in list(programDatas.exportRows()):
+                owner, index = map(int, row.taskDescription.split(":"))
+                if owner != threadIndex:
+                    continue
+                programDatas.checkTask(taskId=TaskId(taskIdInt=row.taskId), console=console)
+                if index % 2 == 0:
+                    programDatas.uncheckTask(taskId=TaskId(taskIdInt=row.taskId), console=console)
+                str(programDatas)
+        except Exception as error:
+            errors.append(error)
+
+    def assertConsistent(self, programDatas):
+        rows = list(programDatas.exportRows())
+
+        self.assertEqual(THREAD_COUNT * TASK_COUNT, len(rows))
+        self.assertEqual(len(rows), len({row.taskId for row in rows}))
+        self.assertEqual(set(range(1, len(rows) + 1)), {row.taskId for row in rows})
+        for row in rows:
+            index = int(row.taskDescription.split(":")[1])
+            self.assertEqual(index % 2 == 1, row.taskDone, row)
+
+        self.assertEqual(
+            "".join(f"  {'[x]' if row.taskDone else '[ ]'} {row.taskId}: {row.taskDescription}\n" for row in rows),
+            "".join(line for line in str(programDatas).splitlines(keepends=True) if line.startswith("  ")))
+
+    def test_add_check_and_uncheck_from_many_threads(self):
+        programDatas    = ProgramDatas(storage=FileStorage(directory=self.directory, compactEvery=500))
+        errors          = []
+        threads         = [threading.Thread(target=self.hammer, args=(programDatas, threadIndex, errors)) for threadIndex in range(THREAD_COUNT)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        self.assertConsistent(programDatas)
+        programDatas.close()
+
+        self.assertConsistent(ProgramDatas(storage=FileStorage(directory=self.directory)))
@@ -0,0 +1,61 @@
+import io
+import unittest
+
+from app import ProgramLoop
+from console import BatchConsole, Console
+from primitiveWrapper import ConsoleOuput
+
+
+class FlushCountingWriter(io.StringIO):
+
+    def __init__(self):
+        super().__init__()
+        self.writes     = 0
+        self.flushes    = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+    def flush(self):
+        self.flushes += 1
+
+
+class ConsoleTest(unittest.TestCase):
+
+    def test_print_appends_a_new_line(self):
+        output = io.StringIO()
+        Console(io.StringIO(), output).print(output=ConsoleOuput(outputStr="hello"))
+
+        self.assertEqual("hello\n", output.getvalue())
+
+    def test_print_chunks_writes_in_batches_and_flushes_once(self):
+        output  = FlushCountingWriter()
+        console = Console(io.StringIO(), output, bufferSize=10)
+
+        console.printChunks(chunks=(f"line {index}\n" for index in range(100)))
+
+        self.assertEqual("".join(f"line {index}\n" for index in range(100)) + "\n", output.getvalue())
+        self.assertEqual(51, output.writes)
+        self.assertEqual(1, output.flushes)
+
+
+class BatchConsoleTest(unittest.TestCase):
+
+    def test_batch_run_has_no_prompt_and_flushes_every_n_commands(self):
+        commands    = "add project secrets\n" + "add task secrets Eat\n" * 5 + "check 1\nshow\n"
+        output      = FlushCountingWriter()
+
+        ProgramLoop(BatchConsole(io.StringIO(commands), output, flushEvery=3)).run()
+
+        self.assertEqual(
+            "secrets\n  [x] 1: Eat\n  [ ] 2: Eat\n  [ ] 3: Eat\n  [ ] 4: Eat\n  [ ] 5: Eat\n\n\n",
+            output.getvalue())
+        self.assertEqual(3, output.flushes)
+
+    def test_interactive_run_stops_at_end_of_input(self):
+        output = io.StringIO()
+
+        ProgramLoop(Console(io.StringIO("add project secrets\n"), output)).run()
+
+        self.assertEqual("> > ", output.getvalue())
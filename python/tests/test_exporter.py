@@ -0,0 +1,53 @@
+import io
+import os
+import tempfile
+import unittest
+
+from app import ProgramDatas, ProgramLoop
+from console import BatchConsole
+from exporter import csvLines, jsonLinesLines
+from taskRow import TaskRow
+
+ROWS = [TaskRow(1, "secrets", "Eat, more \"donuts\".", True), TaskRow(2, "training", "SOLID", False)]
+
+
+class ExporterTest(unittest.TestCase):
+
+    def test_csv_lines(self):
+        self.assertEqual(
+            ["id,project,description,done\n", "1,secrets,\"Eat, more \"\"donuts\"\".\",true\n", "2,training,SOLID,false\n"],
+            list(csvLines(rows=ROWS)))
+
+    def test_json_lines_lines(self):
+        self.assertEqual(
+            ['{"id": 1, "project": "secrets", "description": "Eat, more \\"donuts\\".", "done": true}\n',
+             '{"id": 2, "project": "training", "description": "SOLID", "done": false}\n'],
+            list(jsonLinesLines(rows=ROWS)))
+
+    def test_export_round_trips_through_import(self):
+        programDatas = ProgramDatas()
+        programDatas.importTasks(rows=ROWS + [TaskRow(9, "secrets", "Sleep", False)])
+
+        with tempfile.TemporaryDirectory() as directory:
+            for exportFormat in ("csv", "jsonl"):
+                filePath    = os.path.join(directory, f"tasks.{exportFormat}")
+                output      = io.StringIO()
+                ProgramLoop(BatchConsole(io.StringIO(f"export {exportFormat} {filePath}\n"), output), programDatas=programDatas).run()
+
+                imported    = ProgramDatas()
+                ProgramLoop(BatchConsole(io.StringIO(f"import {filePath}\n"), output), programDatas=imported).run()
+
+                self.assertEqual(str(programDatas), str(imported))
+                self.assertEqual(list(programDatas.exportRows()), list(imported.exportRows()))
+
+    def test_export_to_console(self):
+        programDatas = ProgramDatas()
+        programDatas.importTasks(rows=ROWS[1:])
+        output = io.StringIO()
+
+        ProgramLoop(BatchConsole(io.StringIO("export csv\nexport xml\n"), output), programDatas=programDatas).run()
+
+        self.assertEqual(
+            "id,project,description,done\n2,training,SOLID,false\n"
+            "Could not export to the unknown format xml.\n",
+            output.getvalue())
@@ -0,0 +1,84 @@
+import io
+import os
+import tempfile
+import unittest
+
+from app import ProgramDatas, ProgramLoop
+from console import BatchConsole, Console
+from importer import readCsvRows, readJsonLinesRows
+from primitiveWrapper import ProjectName, TaskId
+from taskRow import TaskRow
+
+
+class ImporterTest(unittest.TestCase):
+
+    def test_read_csv_rows(self):
+        csvFile = io.StringIO("id,project,description,done\n7,secrets,\"Eat, more donuts.\",true\n,training,SOLID,\n")
+
+        self.assertEqual(
+            [TaskRow(7, "secrets", "Eat, more donuts.", True), TaskRow(None, "training", "SOLID", False)],
+            list(readCsvRows(csvFile=csvFile)))
+
+    def test_read_json_lines_rows(self):
+        jsonLinesFile = io.StringIO('{"project": "secrets", "description": "Eat", "done": true}\n\n{"id": 3, "project": "secrets", "description": "Sleep"}\n')
+
+        self.assertEqual(
+            [TaskRow(None, "secrets", "Eat", True), TaskRow(3, "secrets", "Sleep", False)],
+            list(readJsonLinesRows(jsonLinesFile=jsonLinesFile)))
+
+    def test_malformed_rows_are_reported_with_their_line(self):
+        for reader, fileStr, messageStr in (
+            (readJsonLinesRows, '{"project": "secrets", "description": "Eat"}\n[1, 2]\n', "line 2: expected an object with a project and a description"),
+            (readJsonLinesRows, '{"project": "secrets"}\n', "line 1: missing description"),
+            (readJsonLinesRows, '\n{"project": "secrets", "description": "Eat", "id": "seven"}\n', "line 2: invalid id 'seven'"),
+            (readJsonLinesRows, '{"project": \n', "line 1: Expecting value"),
+            (readCsvRows, "project,description\nsecrets,Eat\np\n", "line 3: missing description"),
+        ):
+            with self.assertRaises(ValueError) as context:
+                list(reader(io.StringIO(fileStr)))
+            self.assertEqual(messageStr, str(context.exception))
+
+    def test_import_creates_projects_allocates_ids_and_skips_existing_ids(self):
+        console         = Console(io.StringIO(), io.StringIO())
+        programDatas    = ProgramDatas()
+        programDatas.addProject(projectName=ProjectName(projetNameStr="secrets"), console=console)
+
+        rows = [
+            TaskRow(None, "secrets", "Eat", False),
+            TaskRow(5, "training", "SOLID", True),
+            TaskRow(None, "training", "TDD", False),
+            TaskRow(5, "training", "Duplicate", False),
+        ]
+
+        self.assertEqual((3, 1), programDatas.importTasks(rows=rows, batchSize=2))
+        self.assertEqual(
+            "secrets\n  [ ] 1: Eat\n\ntraining\n  [x] 5: SOLID\n  [ ] 6: TDD\n\n",
+            str(programDatas))
+        self.assertEqual(TaskId(taskIdInt=7), programDatas.nextTaskId())
+
+    def test_rows_without_an_id_skip_the_ids_of_their_batch(self):
+        programDatas = ProgramDatas()
+        rows = [
+            TaskRow(1, "b", "Explicit", False),
+            TaskRow(None, "a", "Allocated", False),
+            TaskRow(1, "c", "Duplicate", False),
+        ]
+
+        self.assertEqual((2, 1), programDatas.importTasks(rows=rows))
+        self.assertEqual("b\n  [ ] 1: Explicit\n\na\n  [ ] 2: Allocated\n\n", str(programDatas))
+        self.assertEqual(TaskId(taskIdInt=3), programDatas.nextTaskId())
+
+    def test_import_command(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filePath = os.path.join(directory, "tasks.csv")
+            with open(filePath, "w") as csvFile:
+                csvFile.write("project,description\nsecrets,Eat more donuts.\n")
+
+            output = io.StringIO()
+            ProgramLoop(BatchConsole(io.StringIO(f"import {filePath}\nimport {filePath}.missing\nshow\n"), output)).run()
+
+        self.assertEqual(
+            "Imported 1 tasks.\n"
+            f"Could not import {filePath}.missing: [Errno 2] No such file or directory: '{filePath}.missing'\n"
+            "secrets\n  [ ] 1: Eat more donuts.\n\n\n",
+            output.getvalue())
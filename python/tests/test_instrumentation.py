@@ -0,0 +1,92 @@
+import json
+import os
+import pstats
+import tempfile
+import unittest
+
+from app import ProgramDatas
+from instrumentation import Instrumentation, LatencyHistogram
+from tests import executeCommands
+
+
+class LatencyHistogramTest(unittest.TestCase):
+
+    def test_percentiles_are_within_a_bucket(self):
+        histogram = LatencyHistogram()
+        for nanoseconds in range(1, 10001):
+            histogram.add(nanoseconds=nanoseconds)
+
+        for percent in (50, 90, 99):
+            expected = 10000 * percent / 100
+            self.assertLessEqual(expected, histogram.percentile(percent=percent))
+            self.assertLess(histogram.percentile(percent=percent), expected * 2 ** (1 / 8) + 1)
+
+    def test_empty_histogram(self):
+        self.assertEqual(0, LatencyHistogram().percentile(percent=99))
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def test_stats_are_off_by_default(self):
+        self.assertEqual(
+            "Instrumentation is off. Start the task list with --instrument.\n",
+            executeCommands(ProgramDatas(), "stats latency"))
+
+    def test_commands_are_counted_by_type(self):
+        programDatas = ProgramDatas(instrumentation=Instrumentation())
+        executeCommands(programDatas, "add project secrets", "add task secrets Eat", "add task secrets Sleep", "check 1", "show", "fly")
+
+        report = programDatas.instrumentation().report()
+        self.assertEqual(
+            {"add project": 1, "add task": 2, "check": 1, "show": 1, "error": 1},
+            {commandName: commandReport["count"] for commandName, commandReport in report.items()})
+        self.assertEqual({"totalNs", "p50Ns", "p90Ns", "p99Ns"}, set(report["add task"]["parse"]))
+        self.assertGreater(report["add task"]["execute"]["totalNs"], 0)
+        self.assertEqual(
+            report["add task"]["parse"]["totalNs"] + report["add task"]["execute"]["totalNs"],
+            report["add task"]["total"]["totalNs"])
+        self.assertEqual(
+            report["add task"]["total"]["totalNs"] + report["check"]["total"]["totalNs"],
+            programDatas.instrumentation().totalReport(commandNames=["add task", "check", "uncheck"])["totalNs"])
+
+    def test_stats_latency_and_json(self):
+        programDatas = ProgramDatas(instrumentation=Instrumentation())
+        output = executeCommands(programDatas, "show", "stats latency", "stats json")
+
+        lines = output.split("\n")
+        self.assertTrue(lines[1].startswith("show: 1 commands, parse "))
+        self.assertEqual(["show", "stats latency"], list(json.loads(lines[3])["commands"]))
+
+    def test_stats_profile_writes_a_window(self):
+        programDatas = ProgramDatas(instrumentation=Instrumentation())
+        with tempfile.TemporaryDirectory() as directory:
+            filePath = os.path.join(directory, "show.prof")
+            executeCommands(programDatas, f"stats profile 2 {filePath}", "show", "show")
+
+            functionNames = {function[2] for function in pstats.Stats(filePath).stats}
+            self.assertIn("renderChunks", functionNames)
+
+    def test_stats_profile_to_a_bad_path_is_reported(self):
+        programDatas = ProgramDatas(instrumentation=Instrumentation())
+        with tempfile.TemporaryDirectory() as directory:
+            filePath = os.path.join(directory, "missing", "show.prof")
+            self.assertEqual(
+                f"Could not write the profile to {filePath}: [Errno 2] No such file or directory: '{filePath}'\n"
+                "\n",
+                executeCommands(programDatas, f"stats profile 1 {filePath}", "show"))
+
+    def test_a_profile_that_cannot_be_written_is_reported_once(self):
+        programDatas = ProgramDatas(instrumentation=Instrumentation())
+        with tempfile.TemporaryDirectory() as directory:
+            subdirectory = os.path.join(directory, "profiles")
+            os.mkdir(subdirectory)
+            filePath = os.path.join(subdirectory, "show.prof")
+            executeCommands(programDatas, f"stats profile 1 {filePath}")
+            os.remove(filePath)
+            os.rmdir(subdirectory)
+
+            self.assertEqual(
+                "\n"
+                f"Could not write the profile to {filePath}: [Errno 2] No such file or directory: '{filePath}'\n"
+                "\n",
+                executeCommands(programDatas, "show", "show"))
@@ -0,0 +1,139 @@
+import io
+import os
+import tempfile
+import unittest
+
+from app import ProgramDatas
+from console import BatchConsole
+from mappedTable import MAGIC, MappedFormatError, MappedTaskFile
+from oneShot import runInPlace
+from storage import MappedStorage
+from taskRow import TaskRow
+from tests import executeCommands
+
+
+class MappedStorageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.directory          = self.temporaryDirectory.name
+
+    def tearDown(self):
+        self.temporaryDirectory.cleanup()
+
+    def test_tasks_survive_a_restart(self):
+        executeCommands(
+            ProgramDatas(storage=MappedStorage(directory=self.directory)),
+            "add project secrets", "add task secrets Eat more donuts.", "add project training", "add task training SOLID", "add task secrets Destroy all humans.", "check 3")
+
+        self.assertEqual(
+            "secrets\n  [ ] 1: Eat more donuts.\n  [x] 3: Destroy all humans.\n\n"
+            "training\n  [ ] 2: SOLID\n\n"
+            "\n"
+            "  [ ] 4: Sleep (training)\n\n",
+            executeCommands(ProgramDatas(storage=MappedStorage(directory=self.directory)), "show", "add task training Sleep", "list word sleep"))
+
+    def test_done_flags_are_written_in_place(self):
+        executeCommands(ProgramDatas(storage=MappedStorage(directory=self.directory)), "add project secrets", "add task secrets Eat")
+        recordsPath = os.path.join(self.directory, MappedTaskFile.RECORDS_FILE_NAME)
+        sizeBefore  = os.path.getsize(recordsPath)
+
+        executeCommands(ProgramDatas(storage=MappedStorage(directory=self.directory)), "check 1")
+
+        self.assertEqual(sizeBefore, os.path.getsize(recordsPath))
+        self.assertEqual("secrets\n  [x] 1: Eat\n\n", str(ProgramDatas(storage=MappedStorage(directory=self.directory))))
+
+    def test_files_grow_and_imported_ids_are_found(self):
+        programDatas = ProgramDatas(storage=MappedStorage(directory=self.directory))
+        programDatas.importTasks(rows=[TaskRow(index, f"project{index % 3}", f"Task {index} é", index % 2 == 0) for index in range(3000, 0, -1)])
+        programDatas.close()
+
+        restored = ProgramDatas(storage=MappedStorage(directory=self.directory))
+        self.assertEqual(
+            "Could not find a task with an ID of 3001\n"
+            "project0: 1 of 1000 tasks, offset 999\n  [ ] 3: Task 3 é\n\n\n",
+            executeCommands(restored, "uncheck 2999", "check 3001", "show project0 999"))
+
+        again = ProgramDatas(storage=MappedStorage(directory=self.directory))
+        self.assertEqual("  [ ] 3001: Next (project1)\n\n", executeCommands(again, "uncheck 2998", "add task project1 Next", "list word next"))
+        self.assertEqual(1502, executeCommands(ProgramDatas(storage=MappedStorage(directory=self.directory)), "list undone").count("\n") - 1)
+
+    def test_undone_add_task_stays_removed(self):
+        executeCommands(ProgramDatas(storage=MappedStorage(directory=self.directory)), "add project secrets", "add task secrets A", "add task secrets B", "add task secrets C", "undo")
+
+        self.assertEqual(
+            "secrets\n  [ ] 1: A\n  [ ] 2: B\n\n",
+            str(ProgramDatas(storage=MappedStorage(directory=self.directory))))
+        self.assertEqual("Could not find a task with an ID of 3\n", executeCommands(ProgramDatas(storage=MappedStorage(directory=self.directory)), "check 3"))
+
+    def test_saved_index_is_used_and_extended(self):
+        executeCommands(ProgramDatas(storage=MappedStorage(directory=self.directory)), "add project secrets", "add task secrets A", "add task secrets B")
+        indexPath = os.path.join(self.directory, MappedTaskFile.INDEX_FILE_NAME)
+        with open(indexPath, "rb") as indexFile:
+            savedIndex = indexFile.read()
+
+        executeCommands(ProgramDatas(storage=MappedStorage(directory=self.directory)), "add task secrets C", "undo", "add task secrets D")
+        with open(indexPath, "wb") as indexFile:
+            indexFile.write(savedIndex)
+
+        self.assertEqual(
+            "Could not find a task with an ID of 3\n"
+            "secrets\n  [ ] 1: A\n  [x] 2: B\n  [x] 4: D\n\n\n",
+            executeCommands(ProgramDatas(storage=MappedStorage(directory=self.directory)), "check 2-3", "check 4", "show"))
+
+    def test_check_runs_in_place_without_loading_projects(self):
+        executeCommands(ProgramDatas(storage=MappedStorage(directory=self.directory)), "add project secrets", "add task secrets A", "add task secrets B", "add task secrets C")
+        os.remove(os.path.join(self.directory, MappedTaskFile.INDEX_FILE_NAME))
+
+        output = io.StringIO()
+        runInPlace(commandLineStr="check 1,3-5", directory=self.directory, console=BatchConsole(None, output))
+        runInPlace(commandLineStr="uncheck 3", directory=self.directory, console=BatchConsole(None, output))
+
+        self.assertEqual("Could not find tasks with the IDs 4-5\n", output.getvalue())
+        self.assertTrue(os.path.exists(os.path.join(self.directory, MappedTaskFile.INDEX_FILE_NAME)))
+        self.assertEqual("secrets\n  [x] 1: A\n  [ ] 2: B\n  [ ] 3: C\n\n", str(ProgramDatas(storage=MappedStorage(directory=self.directory))))
+
+    def test_saved_project_rows_are_used_and_extended(self):
+        executeCommands(ProgramDatas(storage=MappedStorage(directory=self.directory)), "add project secrets", "add task secrets A", "add project training", "add task training B")
+        rowsPath = os.path.join(self.directory, MappedTaskFile.ROWS_FILE_NAME)
+        with open(rowsPath, "rb") as rowsFile:
+            savedRows = rowsFile.read()
+
+        executeCommands(
+            ProgramDatas(storage=MappedStorage(directory=self.directory)),
+            "add task secrets C", "add task training D", "undo", "add project sleep", "add task sleep E", "add task secrets F")
+        with open(rowsPath, "wb") as rowsFile:
+            rowsFile.write(savedRows)
+
+        expected = "secrets\n  [ ] 1: A\n  [ ] 3: C\n  [ ] 6: F\n\ntraining\n  [ ] 2: B\n\nsleep\n  [ ] 5: E\n\n"
+        self.assertEqual(expected, str(ProgramDatas(storage=MappedStorage(directory=self.directory))))
+        os.remove(rowsPath)
+        self.assertEqual(expected + "\n", executeCommands(ProgramDatas(storage=MappedStorage(directory=self.directory)), "show"))
+        self.assertTrue(os.path.exists(rowsPath))
+        self.assertEqual(expected, str(ProgramDatas(storage=MappedStorage(directory=self.directory))))
+
+    def test_corrupted_headers_are_reported_or_rebuilt(self):
+        executeCommands(ProgramDatas(storage=MappedStorage(directory=self.directory)), "add project secrets", "add task secrets A", "add task secrets B")
+        with open(os.path.join(self.directory, MappedTaskFile.INDEX_FILE_NAME), "r+b") as indexFile:
+            indexFile.write(b"TASKIDX0")
+        with open(os.path.join(self.directory, MappedTaskFile.ROWS_FILE_NAME), "r+b") as rowsFile:
+            rowsFile.write(b"TASKROW0")
+        self.assertEqual("secrets\n  [x] 1: A\n  [ ] 2: B\n\n\n", executeCommands(ProgramDatas(storage=MappedStorage(directory=self.directory)), "check 1", "show"))
+
+        recordsPath = os.path.join(self.directory, MappedTaskFile.RECORDS_FILE_NAME)
+        with open(recordsPath, "r+b") as recordsFile:
+            recordsFile.write(b"TASKMAP1")
+        with self.assertRaisesRegex(MappedFormatError, "tasks.bin holds task records of an unknown format b'TASKMAP1'"):
+            ProgramDatas(storage=MappedStorage(directory=self.directory))
+        with self.assertRaisesRegex(MappedFormatError, "tasks.bin holds task records"):
+            runInPlace(commandLineStr="check 1", directory=self.directory, console=BatchConsole(None, io.StringIO()))
+
+        with open(recordsPath, "r+b") as recordsFile:
+            recordsFile.write(MAGIC + (1 << 40).to_bytes(8, "little"))
+        with self.assertRaisesRegex(MappedFormatError, "more than the files hold"):
+            ProgramDatas(storage=MappedStorage(directory=self.directory))
+
+        with open(recordsPath, "wb") as recordsFile:
+            recordsFile.write(MAGIC)
+        with self.assertRaisesRegex(MappedFormatError, "too short"):
+            ProgramDatas(storage=MappedStorage(directory=self.directory))
@@ -0,0 +1,85 @@
+import io
+import unittest
+
+from app import ProgramDatas
+from console import Console
+from primitiveWrapper import ProjectName, TaskDescription, TaskId
+
+
+class ProgramDatasTest(unittest.TestCase):
+
+    def setUp(self):
+        self.output         = io.StringIO()
+        self.console        = Console(io.StringIO(), self.output)
+        self.programDatas   = ProgramDatas()
+
+    def addProject(self, name):
+        self.programDatas.addProject(projectName=ProjectName(projetNameStr=name), console=self.console)
+
+    def addTask(self, projectName, description):
+        self.programDatas.addTask(
+            projectName=ProjectName(projetNameStr=projectName),
+            taskDescription=TaskDescription(taskDescriptionStr=description),
+            console=self.console)
+
+    def test_check_and_uncheck_through_task_index(self):
+        self.addProject("secrets")
+        self.addTask("secrets", "Eat more donuts.")
+        self.addProject("training")
+        self.addTask("training", "SOLID")
+
+        self.programDatas.checkTask(taskId=TaskId(taskIdInt=2), console=self.console)
+        self.assertEqual(
+            "secrets\n  [ ] 1: Eat more donuts.\n\ntraining\n  [x] 2: SOLID\n\n",
+            str(self.programDatas))
+
+        self.programDatas.uncheckTask(taskId=TaskId(taskIdInt=2), console=self.console)
+        self.assertEqual(
+            "secrets\n  [ ] 1: Eat more donuts.\n\ntraining\n  [ ] 2: SOLID\n\n",
+            str(self.programDatas))
+        self.assertEqual("", self.output.getvalue())
+
+    def test_check_unknown_task(self):
+        self.addProject("secrets")
+        self.addTask("secrets", "Eat more donuts.")
+
+        self.programDatas.checkTask(taskId=TaskId(taskIdInt=42), console=self.console)
+
+        self.assertEqual("Could not find a task with an ID of 42\n", self.output.getvalue())
+
+    def test_task_in_unknown_project_does_not_consume_an_id(self):
+        self.addTask("missing", "Lost")
+        self.addProject("secrets")
+        self.addTask("secrets", "Found")
+
+        self.assertEqual("Could not find a project with the name missing.\n", self.output.getvalue())
+        self.assertEqual("secrets\n  [ ] 1: Found\n\n", str(self.programDatas))
+
+    def test_task_in_unknown_project_when_no_project_exists(self):
+        self.addTask("missing", "Lost")
+
+        self.assertEqual("Could not find a project with the name missing.\n", self.output.getvalue())
+        self.assertEqual("", str(self.programDatas))
+
+    def test_duplicate_project_is_rejected(self):
+        self.addProject("secrets")
+        self.addTask("secrets", "Eat more donuts.")
+        self.addProject("secrets")
+
+        self.assertEqual("A project with the name secrets already exists.\n", self.output.getvalue())
+        self.assertEqual("secrets\n  [ ] 1: Eat more donuts.\n\n", str(self.programDatas))
+
+    def test_show_rerenders_only_the_changed_project(self):
+        self.addProject("secrets")
+        self.addTask("secrets", "Eat more donuts.")
+        self.addProject("training")
+        self.addTask("training", "SOLID")
+        str(self.programDatas)
+
+        secretsRendered = str(self.programDatas._projectList._projects[ProjectName(projetNameStr="secrets")]._taskList)
+        self.programDatas.checkTask(taskId=TaskId(taskIdInt=2), console=self.console)
+
+        self.assertIs(secretsRendered, str(self.programDatas._projectList._projects[ProjectName(projetNameStr="secrets")]._taskList))
+        self.assertEqual(
+            "secrets\n  [ ] 1: Eat more donuts.\n\ntraining\n  [x] 2: SOLID\n\n",
+            str(self.programDatas))
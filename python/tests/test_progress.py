@@ -0,0 +1,42 @@
+import tempfile
+import unittest
+
+from app import ProgramDatas
+from storage import FileStorage, MappedStorage
+from tests import executeCommands
+
+
+class ProgressTest(unittest.TestCase):
+
+    def setUp(self):
+        self.programDatas = ProgramDatas()
+
+    def fill(self, programDatas):
+        return executeCommands(
+            programDatas,
+            "add project secrets", "add task secrets Eat", "add task secrets Sleep",
+            "add project training", "add task training SOLID", "add task training Coupling",
+            "check 1", "check 1", "check 2-4", "uncheck 3", "undo", "undo", "add task secrets Destroy", "undo")
+
+    def test_counts_follow_check_uncheck_and_undo(self):
+        self.fill(programDatas=self.programDatas)
+
+        self.assertEqual([("secrets", 1, 2), ("training", 0, 2)], self.programDatas.progress())
+        self.assertEqual(
+            "secrets: 1 of 2 tasks done\n"
+            "training: 0 of 2 tasks done\n"
+            "all projects: 1 of 4 tasks done\n"
+            "\n",
+            executeCommands(self.programDatas, "stats progress"))
+
+    def test_empty_task_list(self):
+        self.assertEqual("all projects: 0 of 0 tasks done\n\n", executeCommands(self.programDatas, "stats progress"))
+
+    def test_counts_are_rebuilt_on_load(self):
+        for createStorage in (FileStorage, MappedStorage):
+            with tempfile.TemporaryDirectory() as directory:
+                self.fill(programDatas=ProgramDatas(storage=createStorage(directory=directory)))
+
+                restored = ProgramDatas(storage=createStorage(directory=directory))
+                self.assertEqual([("secrets", 1, 2), ("training", 0, 2)], restored.progress())
+                restored.close()
@@ -0,0 +1,124 @@
+import unittest
+
+from app import ProgramDatas
+from descriptionIndex import DescriptionIndex, parseSearchTerms, tokenize
+from taskRow import TaskRow
+from tests import executeCommands
+
+ROWS = [
+    TaskRow(1, "secrets", "Eat more donuts.", True),
+    TaskRow(2, "secrets", "Destroy all humans.", False),
+    TaskRow(3, "training", "Four Elements of Simple Design", False),
+    TaskRow(4, "training", "SOLID", True),
+    TaskRow(5, "training", "Coupling and Cohesion", False),
+]
+
+
+class DescriptionIndexTest(unittest.TestCase):
+
+    def test_tokenize(self):
+        self.assertEqual(["eat", "more", "donuts"], tokenize(text="Eat more donuts."))
+
+    def test_rows_with_token_and_prefix(self):
+        descriptionIndex = DescriptionIndex()
+        descriptionIndex.addRow(row=0, description="Coupling and Cohesion")
+        descriptionIndex.addRow(row=1, description="Cohesion again, cohesion")
+        descriptionIndex.addRow(row=2, description="Code")
+
+        self.assertEqual([0, 1], list(descriptionIndex.rowsWithToken(token="COHESION")))
+        self.assertEqual([0, 1, 2], descriptionIndex.rowsWithPrefix(prefix="co"))
+        self.assertEqual([0], descriptionIndex.rowsWithPrefix(prefix="coup"))
+        self.assertEqual([], descriptionIndex.rowsWithPrefix(prefix="z"))
+
+    def test_tokens_added_after_a_prefix_query_are_found(self):
+        descriptionIndex = DescriptionIndex()
+        descriptionIndex.addRow(row=0, description="Coupling")
+        self.assertEqual([0], descriptionIndex.rowsWithPrefix(prefix="co"))
+
+        descriptionIndex.addRow(row=1, description="Cohesion")
+        descriptionIndex.addRow(row=2, description="Coupling again")
+        self.assertEqual([0, 2], list(descriptionIndex.rowsWithToken(token="coupling")))
+        self.assertEqual([0, 1, 2], descriptionIndex.rowsWithPrefix(prefix="co"))
+        self.assertEqual([1], descriptionIndex.rowsMatchingAll(tokens=["cohesion"], prefixes=["co"]))
+
+    def test_rows_matching_all(self):
+        descriptionIndex = DescriptionIndex()
+        descriptionIndex.addRow(row=0, description="Coupling and Cohesion")
+        descriptionIndex.addRow(row=1, description="Cohesion again, cohesion")
+        descriptionIndex.addRow(row=2, description="Code again")
+
+        self.assertEqual((["again"], ["co"]), parseSearchTerms(queryStr="Again, co*"))
+        self.assertEqual([1, 2], descriptionIndex.rowsMatchingAll(tokens=["again"], prefixes=["co"]))
+        self.assertEqual([1], descriptionIndex.rowsMatchingAll(tokens=["again", "cohesion"], prefixes=[]))
+        self.assertEqual([], descriptionIndex.rowsMatchingAll(tokens=["again", "missing"], prefixes=["co"]))
+
+
+class QueryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.programDatas = ProgramDatas()
+        self.programDatas.importTasks(rows=ROWS)
+
+    def test_list_undone(self):
+        self.assertEqual(
+            "  [ ] 2: Destroy all humans. (secrets)\n"
+            "  [ ] 3: Four Elements of Simple Design (training)\n"
+            "  [ ] 5: Coupling and Cohesion (training)\n"
+            "\n",
+            executeCommands(self.programDatas, "list undone"))
+
+    def test_list_undone_follows_check_and_uncheck(self):
+        self.assertEqual(
+            "  [ ] 1: Eat more donuts. (secrets)\n"
+            "\n",
+            executeCommands(self.programDatas, "check 2", "uncheck 1", "list undone secrets"))
+
+    def test_list_undone_follows_add_task(self):
+        self.assertEqual(
+            "  [ ] 2: Destroy all humans. (secrets)\n"
+            "  [ ] 6: Sleep (secrets)\n"
+            "\n",
+            executeCommands(self.programDatas, "add task secrets Sleep", "list undone secrets"))
+
+    def test_list_project(self):
+        self.assertEqual(
+            "  [x] 1: Eat more donuts. (secrets)\n"
+            "  [ ] 2: Destroy all humans. (secrets)\n"
+            "\n"
+            "Could not find a project with the name unknown.\n",
+            executeCommands(self.programDatas, "list project secrets", "list project unknown"))
+
+    def test_list_word_and_prefix(self):
+        self.assertEqual(
+            "  [ ] 5: Coupling and Cohesion (training)\n"
+            "\n"
+            "  [ ] 2: Destroy all humans. (secrets)\n"
+            "  [ ] 3: Four Elements of Simple Design (training)\n"
+            "\n"
+            "\n",
+            executeCommands(self.programDatas, "list word cohesion", "list prefix DES", "list prefix zzz"))
+
+    def test_list_word_follows_add_task(self):
+        self.assertEqual(
+            "  [x] 5: Coupling and Cohesion (training)\n"
+            "  [ ] 6: More cohesion (secrets)\n"
+            "\n",
+            executeCommands(self.programDatas, "add task secrets More cohesion", "check 5", "list word cohesion"))
+
+    def test_search_requires_every_term(self):
+        self.assertEqual(
+            "  [ ] 5: Coupling and Cohesion (training)\n"
+            "\n"
+            "\n"
+            "  [x] 1: Eat more donuts. (secrets)\n"
+            "  [ ] 3: Four Elements of Simple Design (training)\n"
+            "\n",
+            executeCommands(self.programDatas, "search cohesion COUPLING", "search cohesion donuts", "search e* d*"))
+
+    def test_search_follows_add_task_and_undo(self):
+        self.assertEqual(
+            "  [ ] 6: Design more donuts (secrets)\n"
+            "\n"
+            "\n"
+            "I don't know what the command search * is.\n",
+            executeCommands(self.programDatas, "add task secrets Design more donuts", "search des* donuts", "undo", "search des* donuts", "search *"))
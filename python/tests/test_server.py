@@ -0,0 +1,112 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from app import ProgramDatas
+from server import PROMPT, READ_LIMIT, TaskListServer
+from taskRow import TaskRow
+
+
+class TaskListServerTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.programDatas   = ProgramDatas()
+        self.server         = await TaskListServer(programDatas=self.programDatas, bufferSize=16).startTcp(host="127.0.0.1", port=0)
+        self.port           = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def connect(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        self.assertEqual(PROMPT, await reader.readuntil(PROMPT))
+        return reader, writer
+
+    async def send(self, connection, commandLineStr):
+        reader, writer = connection
+        writer.write(f"{commandLineStr}\n".encode("utf-8"))
+        await writer.drain()
+        return (await reader.readuntil(PROMPT))[:-len(PROMPT)].decode("utf-8")
+
+    async def test_clients_share_one_task_list(self):
+        alice   = await self.connect()
+        bob     = await self.connect()
+
+        self.assertEqual("", await self.send(alice, "add project secrets"))
+        self.assertEqual("", await self.send(bob, "add task secrets Eat more donuts."))
+        self.assertEqual("", await self.send(alice, "check 1"))
+        self.assertEqual("Could not find a task with an ID of 2\n", await self.send(bob, "check 2"))
+        self.assertEqual("secrets\n  [x] 1: Eat more donuts.\n\n\n", await self.send(bob, "show"))
+
+        for reader, writer in (alice, bob):
+            writer.write(b"quit\n")
+            self.assertEqual(b"", await reader.read())
+            writer.close()
+
+    async def test_concurrent_shows_and_mutations_stay_consistent(self):
+        setup = await self.connect()
+        await self.send(setup, "add project secrets")
+        for index in range(50):
+            await self.send(setup, f"add task secrets Task {index}")
+
+        connections = [await self.connect() for _ in range(10)]
+        results     = await asyncio.gather(*(
+            self.send(connection, "show" if index % 2 == 0 else f"check {index}")
+            for index, connection in enumerate(connections)))
+
+        for index, result in enumerate(results):
+            if index % 2 == 0:
+                self.assertTrue(result.startswith("secrets\n  "))
+                self.assertEqual(54, len(result.split("\n")))
+            else:
+                self.assertEqual("", result)
+        self.assertEqual(5, str(self.programDatas).count("[x]"))
+
+        for reader, writer in connections + [setup]:
+            writer.close()
+            await writer.wait_closed()
+
+    async def test_a_client_that_stops_reading_does_not_stall_the_others(self):
+        self.programDatas.importTasks(rows=[TaskRow(None, "secrets", f"Task {index} " + "x" * 100, False) for index in range(50000)])
+        stalled = await self.connect()
+        stalled[1].write(b"show\n")
+        await stalled[1].drain()
+
+        other = await self.connect()
+        self.assertEqual("", await asyncio.wait_for(self.send(other, "add task secrets Eat"), timeout=5))
+        self.assertTrue((await asyncio.wait_for(self.send(other, "list word eat"), timeout=5)).endswith("Eat (secrets)\n\n"))
+
+        for reader, writer in (stalled, other):
+            writer.close()
+            await writer.wait_closed()
+
+    async def test_commands_with_a_file_path_are_refused(self):
+        connection = await self.connect()
+        await self.send(connection, "add project secrets")
+        with tempfile.TemporaryDirectory() as directory:
+            filePath = os.path.join(directory, "tasks.csv")
+            self.assertEqual(
+                "The command export is not available to remote clients.\n"
+                "The command import is not available to remote clients.\n"
+                "The command stats json is not available to remote clients.\n"
+                "The command stats profile is not available to remote clients.\n",
+                "".join([
+                    await self.send(connection, f"export csv {filePath}"),
+                    await self.send(connection, f"import {filePath}"),
+                    await self.send(connection, f"stats json {filePath}"),
+                    await self.send(connection, f"stats profile 1 {filePath}")]))
+            self.assertEqual([], os.listdir(directory))
+        self.assertEqual("id,project,description,done\n", (await self.send(connection, "export csv"))[:28])
+
+        connection[1].close()
+        await connection[1].wait_closed()
+
+    async def test_an_oversized_line_is_reported(self):
+        connection = await self.connect()
+        self.assertEqual(f"The command line is longer than {READ_LIMIT} bytes.\n", await self.send(connection, "x" * (2 * READ_LIMIT)))
+        self.assertEqual("Could not find a task with an ID of 1\n", await self.send(connection, "check 1"))
+
+        connection[1].close()
+        await connection[1].wait_closed()
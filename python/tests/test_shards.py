@@ -0,0 +1,46 @@
+import io
+import unittest
+
+from console import BatchConsole
+from shards import ShardedProgramLoop, ShardRouter
+
+
+class ShardsTest(unittest.TestCase):
+
+    def execute(self, *commands, shardCount=2, batchSize=100):
+        output = io.StringIO()
+        router = ShardRouter(shardCount=shardCount)
+        ShardedProgramLoop(BatchConsole(io.StringIO("".join(command + "\n" for command in commands)), output), router=router, batchSize=batchSize).run()
+        return output.getvalue()
+
+    def test_show_merges_projects_in_creation_order(self):
+        self.assertEqual(
+            "secrets\n  [x] 1: Eat more donuts.\n  [ ] 4: Destroy all humans.\n\n"
+            "training\n  [ ] 3: SOLID\n  [ ] 6: Coupling and Cohesion\n\n"
+            "\n",
+            self.execute(
+                "add project secrets", "add task secrets Eat more donuts.", "add task secrets Destroy all humans.",
+                "add project training", "add task training SOLID", "add task training Coupling and Cohesion",
+                "check 1", "show", shardCount=3))
+
+    def test_lists_are_merged_by_task_id(self):
+        self.assertEqual(
+            "  [ ] 3: SOLID (training)\n"
+            "  [ ] 4: Destroy (secrets)\n"
+            "\n",
+            self.execute(
+                "add project secrets", "add task secrets Eat", "add task secrets Destroy",
+                "add project training", "add task training SOLID",
+                "check 1", "list undone", shardCount=3))
+
+    def test_task_ids_are_unique_across_shards(self):
+        output = self.execute(*[f"add project project{index}" for index in range(5)], *[f"add task project{index % 5} Task" for index in range(20)], "list word task", shardCount=3)
+        taskIds = [int(line.split(":")[0][6:]) for line in output.split("\n")[:-2]]
+        self.assertEqual(20, len(set(taskIds)))
+
+    def test_unsupported_commands_are_refused(self):
+        self.assertEqual(
+            "The command undo is not available with shards.\n"
+            "The command check 1-2 is not available with shards.\n"
+            "I don't know what the command fly is.\n",
+            self.execute("undo", "check 1-2", "fly", batchSize=1))
@@ -0,0 +1,69 @@
+import unittest
+
+from app import ProgramDatas
+from taskRow import TaskRow
+from tests import executeCommands
+
+
+class ShowWindowTest(unittest.TestCase):
+
+    def setUp(self):
+        self.programDatas = ProgramDatas()
+        self.programDatas.importTasks(rows=[TaskRow(None, "big", f"Task {index}", index % 2 == 0) for index in range(5)])
+        self.programDatas.importTasks(rows=[TaskRow(None, "small", "Alone", False)])
+
+    def test_show_project(self):
+        self.assertEqual(
+            "small: 1 of 1 tasks, offset 0\n"
+            "  [ ] 6: Alone\n"
+            "\n\n",
+            executeCommands(self.programDatas, "show small"))
+
+    def test_show_window_with_cursor(self):
+        self.assertEqual(
+            "big: 2 of 5 tasks, offset 1\n"
+            "  [ ] 2: Task 1\n"
+            "  [x] 3: Task 2\n"
+            "next: show big 3 2\n"
+            "\n\n"
+            "big: 2 of 5 tasks, offset 3\n"
+            "  [ ] 4: Task 3\n"
+            "  [x] 5: Task 4\n"
+            "\n\n"
+            "big: 0 of 5 tasks, offset 9\n"
+            "\n\n",
+            executeCommands(self.programDatas, "show big 1 2", "show big 3 2", "show big 9"))
+
+    def test_offsets_after_undoing_an_added_task(self):
+        self.assertEqual(
+            "big: 2 of 6 tasks, offset 3\n"
+            "  [ ] 4: Task 3\n"
+            "  [x] 5: Task 4\n"
+            "next: show big 5 2\n"
+            "\n\n"
+            "big: 2 of 5 tasks, offset 3\n"
+            "  [ ] 4: Task 3\n"
+            "  [x] 5: Task 4\n"
+            "\n\n"
+            "big: 0 of 5 tasks, offset 5\n"
+            "\n\n"
+            "big: 1 of 6 tasks, offset 5\n"
+            "  [ ] 7: Task 5\n"
+            "\n\n",
+            executeCommands(self.programDatas, "add task big Task 5", "show big 3 2", "undo", "show big 3 2", "show big 5 2", "redo", "show big 5 2"))
+
+    def test_show_window_after_full_show_and_check(self):
+        executeCommands(self.programDatas, "show")
+        self.assertEqual(
+            "big: 1 of 5 tasks, offset 1\n"
+            "  [x] 2: Task 1\n"
+            "next: show big 2 1\n"
+            "\n\n",
+            executeCommands(self.programDatas, "check 2", "show big 1 1"))
+
+    def test_show_unknown_project_and_bad_window(self):
+        self.assertEqual(
+            "Could not find a project with the name none.\n"
+            "I don't know what the command show big one is.\n"
+            "I don't know what the command show big 0 0 is.\n",
+            executeCommands(self.programDatas, "show none", "show big one", "show big 0 0"))
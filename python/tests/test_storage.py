@@ -0,0 +1,103 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from app import ProgramDatas
+from console import Console
+from primitiveWrapper import ProjectName, TaskDescription, TaskId
+from storage import FileStorage
+
+
+class FileStorageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory  = tempfile.mkdtemp()
+        self.console    = Console(io.StringIO(), io.StringIO())
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def open(self, compactEvery=1000):
+        return ProgramDatas(storage=FileStorage(directory=self.directory, compactEvery=compactEvery))
+
+    def fill(self, programDatas):
+        programDatas.addProject(projectName=ProjectName(projetNameStr="secrets"), console=self.console)
+        for description in ("Eat more donuts.", "Destroy all humans.", "Sleep"):
+            programDatas.addTask(
+                projectName=ProjectName(projetNameStr="secrets"),
+                taskDescription=TaskDescription(taskDescriptionStr=description),
+                console=self.console)
+        programDatas.checkTask(taskId=TaskId(taskIdInt=1), console=self.console)
+        programDatas.checkTask(taskId=TaskId(taskIdInt=3), console=self.console)
+        programDatas.uncheckTask(taskId=TaskId(taskIdInt=3), console=self.console)
+
+    def test_restart_restores_journaled_state(self):
+        programDatas = self.open()
+        self.fill(programDatas)
+        expected = str(programDatas)
+        programDatas.close()
+
+        restarted = self.open()
+        self.assertEqual(expected, str(restarted))
+
+        restarted.addTask(
+            projectName=ProjectName(projetNameStr="secrets"),
+            taskDescription=TaskDescription(taskDescriptionStr="Wake up"),
+            console=self.console)
+        self.assertIn("  [ ] 4: Wake up\n", str(restarted))
+        restarted.close()
+
+    def test_restart_after_compaction_loads_snapshot_and_journal_tail(self):
+        programDatas = self.open(compactEvery=3)
+        self.fill(programDatas)
+        expected = str(programDatas)
+        programDatas.close()
+
+        self.assertTrue(os.path.exists(os.path.join(self.directory, FileStorage.SNAPSHOT_FILE_NAME)))
+        self.assertEqual(expected, str(self.open()))
+
+    def test_crash_mid_append_drops_only_the_torn_entry(self):
+        programDatas = self.open()
+        self.fill(programDatas)
+        expected = str(programDatas)
+        programDatas.close()
+
+        with open(os.path.join(self.directory, FileStorage.JOURNAL_FILE_NAME), "a") as journal:
+            journal.write('[8, "D", 2, tr')
+
+        restarted = self.open()
+        self.assertEqual(expected, str(restarted))
+        restarted.checkTask(taskId=TaskId(taskIdInt=2), console=self.console)
+        restarted.close()
+
+        self.assertIn("  [x] 2: Destroy all humans.\n", str(self.open()))
+
+    def test_crash_between_snapshot_and_journal_truncation_does_not_replay_twice(self):
+        programDatas = self.open()
+        self.fill(programDatas)
+        expected = str(programDatas)
+        journalPath = os.path.join(self.directory, FileStorage.JOURNAL_FILE_NAME)
+        with open(journalPath) as journal:
+            journalBeforeCompaction = journal.read()
+        programDatas._storage.compact(programDatas=programDatas)
+        programDatas.close()
+
+        with open(journalPath, "w") as journal:
+            journal.write(journalBeforeCompaction)
+
+        self.assertEqual(expected, str(self.open()))
+
+    def test_reserved_ids_survive_restart_and_compaction(self):
+        programDatas = self.open()
+        self.fill(programDatas)
+        self.assertEqual(range(4, 104), programDatas.reserveTaskIds(count=100))
+        programDatas.close()
+
+        restarted = self.open()
+        self.assertEqual(TaskId(taskIdInt=104), restarted.nextTaskId())
+        restarted._storage.compact(programDatas=restarted)
+        restarted.close()
+
+        self.assertEqual(TaskId(taskIdInt=104), self.open().nextTaskId())
@@ -0,0 +1,34 @@
+import unittest
+
+from primitiveWrapper import TaskId
+from taskIdAllocator import TaskIdAllocator
+
+
+class TaskIdAllocatorTest(unittest.TestCase):
+
+    def test_allocate_hands_out_consecutive_ids(self):
+        allocator = TaskIdAllocator()
+
+        self.assertEqual([TaskId(taskIdInt=1), TaskId(taskIdInt=2)], [allocator.allocate(), allocator.allocate()])
+
+    def test_reserve_skips_a_block(self):
+        allocator = TaskIdAllocator()
+        allocator.allocate()
+
+        self.assertEqual(range(2, 12), allocator.reserve(count=10))
+        self.assertEqual(TaskId(taskIdInt=12), allocator.allocate())
+
+    def test_observe_and_advance_never_move_backwards(self):
+        allocator = TaskIdAllocator()
+        allocator.observe(taskId=TaskId(taskIdInt=41))
+        allocator.advanceTo(nextTaskId=TaskId(taskIdInt=10))
+
+        self.assertEqual(TaskId(taskIdInt=42), allocator.nextTaskId())
+
+    def test_stride_keeps_ids_in_their_residue_class(self):
+        allocator = TaskIdAllocator(nextTaskIdInt=2, stride=3)
+
+        self.assertEqual(TaskId(taskIdInt=2), allocator.allocate())
+        self.assertEqual(range(5, 11, 3), allocator.reserve(count=2))
+        allocator.observe(taskId=TaskId(taskIdInt=20))
+        self.assertEqual(TaskId(taskIdInt=23), allocator.nextTaskId())
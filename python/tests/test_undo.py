@@ -0,0 +1,71 @@
+import tempfile
+import unittest
+
+from app import ProgramDatas
+from storage import FileStorage
+from tests import executeCommands
+from undoLog import SET_DONE, UndoLog
+
+
+class UndoLogTest(unittest.TestCase):
+
+    def test_log_is_bounded(self):
+        undoLog = UndoLog(limit=2)
+        for row in range(3):
+            undoLog.record(entry=(SET_DONE, row, 0, 0))
+
+        self.assertEqual((SET_DONE, 2, 0, 0), undoLog.popUndo())
+        self.assertEqual((SET_DONE, 1, 0, 0), undoLog.popUndo())
+        self.assertIsNone(undoLog.popUndo())
+
+    def test_record_clears_redo(self):
+        undoLog = UndoLog()
+        undoLog.pushRedo(entry=(SET_DONE, 0, 1, 0))
+        undoLog.record(entry=(SET_DONE, 1, 0, 0))
+
+        self.assertIsNone(undoLog.popRedo())
+
+
+class UndoTest(unittest.TestCase):
+
+    def test_undo_and_redo_check(self):
+        self.assertEqual(
+            "secrets\n  [ ] 1: Eat\n\n\n"
+            "secrets\n  [x] 1: Eat\n\n\n",
+            executeCommands(ProgramDatas(), "add project secrets", "add task secrets Eat", "check 1", "undo", "show", "redo", "show"))
+
+    def test_undo_and_redo_add_task(self):
+        self.assertEqual(
+            "secrets\n  [ ] 1: Eat\n\n\n"
+            "  [ ] 1: Eat (secrets)\n\n"
+            "Could not find a task with an ID of 2\n"
+            "secrets\n  [ ] 1: Eat\n  [ ] 2: Eat again\n\n\n"
+            "  [ ] 1: Eat (secrets)\n  [ ] 2: Eat again (secrets)\n\n",
+            executeCommands(
+                ProgramDatas(),
+                "add project secrets", "add task secrets Eat", "add task secrets Eat again",
+                "undo", "show", "list undone", "check 2", "redo", "show", "list word eat"))
+
+    def test_undo_in_the_middle_of_a_project(self):
+        programDatas = ProgramDatas()
+        executeCommands(programDatas, "add project secrets", "add task secrets A", "add task secrets B", "add task secrets C", "show")
+        executeCommands(programDatas, "undo", "undo", "redo")
+
+        self.assertEqual("secrets\n  [ ] 1: A\n  [ ] 2: B\n\n", str(programDatas))
+        self.assertEqual(
+            "secrets: 1 of 2 tasks, offset 1\n  [ ] 2: B\n\n\n",
+            executeCommands(programDatas, "show secrets 1 5"))
+
+    def test_nothing_to_undo_or_redo(self):
+        self.assertEqual(
+            "Nothing to undo.\nNothing to redo.\n",
+            executeCommands(ProgramDatas(), "undo", "redo"))
+
+    def test_undo_is_journaled(self):
+        with tempfile.TemporaryDirectory() as directory:
+            programDatas = ProgramDatas(storage=FileStorage(directory=directory))
+            executeCommands(programDatas, "add project secrets", "add task secrets A", "add task secrets B", "check 1", "undo", "undo")
+
+            restored = ProgramDatas(storage=FileStorage(directory=directory))
+            self.assertEqual("secrets\n  [ ] 1: A\n\n", str(restored))
+            self.assertEqual("Could not find a task with an ID of 2\n", executeCommands(restored, "check 2"))